@@ -0,0 +1 @@
+"""End-to-end benchmarks for devtools-release-notifier."""
@@ -0,0 +1,5 @@
+"""Allow running the benchmark suite with ``python -m benchmarks``."""
+
+from benchmarks.run import main
+
+main()
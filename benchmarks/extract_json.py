@@ -0,0 +1,114 @@
+"""Microbenchmark for locating the translated JSON array in transcripts.
+
+Usage:
+    uv run python -m benchmarks.extract_json --sizes 1 4 8
+
+Compares ``extract_json_from_text`` with the previous regex-based locator on
+synthetic, bracket-heavy transcripts of the given sizes (in MiB) that end with
+the translated array, both inside a Markdown code block and as raw JSON.
+"""
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.models.output import TranslatedRelease
+from devtools_release_notifier.scripts.extract_claude_response import extract_json_from_text
+
+
+def legacy_extract_json_from_text(text: str) -> str | None:
+    """Previous implementation: regex candidates over the whole text, validated last to first."""
+    for pattern in (r"```(?:json)?\s*(\[.+?\])\s*```", r"\[\s*\{.*?\}\s*\]"):
+        for match in reversed(re.findall(pattern, text, re.DOTALL)):
+            try:
+                data = json.loads(match)
+                if isinstance(data, list):
+                    [TranslatedRelease(**item) for item in data]
+                return match
+            except (json.JSONDecodeError, ValidationError, TypeError):
+                continue
+    return None
+
+
+def build_transcript(size_bytes: int, fenced: bool, tool_count: int = 20) -> tuple[str, list]:
+    """Build a synthetic transcript ending with the translated array.
+
+    The body repeats tool output containing JSON arrays that are not
+    translations, Python snippets with unbalanced brackets and prose.
+
+    Args:
+        size_bytes: Approximate size of the transcript body
+        fenced: Put the answer in a Markdown code block
+        tool_count: Number of translated releases in the final answer
+
+    Returns:
+        Transcript text and the translated data it ends with
+    """
+    chunk = (
+        "Reading files... "
+        + json.dumps(
+            [{"path": f"src/module_{i}.py", "line": i, "matches": [i, i + 1]} for i in range(8)]
+        )
+        + "\nresults = [{'id': 1}, {'id': 2}\nvalues = data[0][1] + [{\n  x for x in y\n"
+        + "Checking config ['a', 'b'] and {\"key\": [1, 2, 3]}. " * 4
+        + "\n"
+    )
+    body = chunk * max(size_bytes // len(chunk), 1)
+    translated = [
+        {"tool_name": f"Tool {i:04d}", "translated_content": f"## 📌 主な変更点\n- 変更 {i}"}
+        for i in range(tool_count)
+    ]
+    answer = json.dumps(translated, ensure_ascii=False, indent=2)
+    if fenced:
+        answer = f"```json\n{answer}\n```"
+    return f"{body}\nFinal answer:\n{answer}\n", translated
+
+
+def _time(func: Callable[[str], str | None], text: str, repeat: int) -> tuple[float, str | None]:
+    """Get the best wall time of several calls and the result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the translated JSON locator")
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[1, 4],
+        help="Transcript sizes in MiB (default: 1 4)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Calls per measurement")
+    options = parser.parse_args(argv)
+
+    print(f"{'layout':>6}  {'size':>8}  {'legacy':>13}  {'scanner':>11}  {'speedup':>8}")
+    for fenced in (True, False):
+        layout = "fenced" if fenced else "raw"
+        for size in options.sizes:
+            text, expected = build_transcript(int(size * 1024 * 1024), fenced)
+            legacy_seconds, legacy = _time(legacy_extract_json_from_text, text, options.repeat)
+            scanner_seconds, scanner = _time(extract_json_from_text, text, options.repeat)
+            if json.loads(scanner or "null") != expected:
+                raise SystemExit(f"Scanner missed the answer in the {layout} {size} MiB transcript")
+            # The legacy regex can swallow the answer into an unbalanced bracket before it
+            legacy_mark = " " if json.loads(legacy or "null") == expected else "✗"
+            print(
+                f"{layout:>6}  {size:>6.1f}Mi  {legacy_seconds * 1000:>9.3f}ms {legacy_mark}  "
+                f"{scanner_seconds * 1000:>9.3f}ms  {legacy_seconds / scanner_seconds:>7.0f}x"
+            )
+    print("\n✗: the legacy locator did not return the translated answer")
+
+
+if __name__ == "__main__":
+    main()
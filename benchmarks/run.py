@@ -0,0 +1,318 @@
+"""Run the end-to-end benchmark suite.
+
+Usage:
+    uv run python -m benchmarks --sizes 10 100 --latency 0.02 --output results.json
+    uv run python -m benchmarks --compare baseline.json --output results.json
+
+Every scenario is executed twice from a fresh working directory: once for
+wall time and once under tracemalloc for peak memory, so allocation tracing
+does not distort the timings.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from benchmarks.standin import StandInServer
+from benchmarks.workloads import (
+    WEBHOOK_ENV,
+    build_config,
+    tool_slug,
+    write_config,
+    write_execution_file,
+)
+from devtools_release_notifier.notifier import UnifiedReleaseNotifier
+from devtools_release_notifier.scripts.extract_claude_response import extract_claude_response
+from devtools_release_notifier.scripts.send_to_discord import (
+    _load_releases,
+    _parse_translations,
+    _send_notifications,
+)
+
+# A scenario prepares state in a working directory and returns the
+# callable to be measured
+Scenario = Callable[[Path], Callable[[], object]]
+
+METRICS = ("wall_seconds", "peak_memory_bytes", "total_requests")
+
+
+def _notifier_run(workdir: Path, options: argparse.Namespace, base_url: str, tools: int):
+    """Prepare a UnifiedReleaseNotifier run on a synthetic config."""
+    config = build_config(
+        tools,
+        base_url,
+        strategy=options.strategy,
+        bulk_index=options.bulk_index,
+        max_concurrency=options.concurrency,
+    )
+    config["common"]["cache_directory"] = str(workdir / "cache")
+    config_path = write_config(workdir / "config.yml", config)
+
+    def run():
+        # Forced so that warm and repeated runs still fetch every tool
+        with UnifiedReleaseNotifier(str(config_path)) as notifier:
+            notifier.run(output_file=str(workdir / "releases.json"), force=True)
+
+    return run
+
+
+def _releases_file(workdir: Path, tools: int) -> Path:
+    """Write a releases.json as produced by the notifier."""
+    releases = [
+        {
+            "tool_name": f"Tool {i:04d}",
+            "version": "v1.0.0",
+            "content": f"Release notes for {tool_slug(i)}",
+            "url": f"https://example.com/{tool_slug(i)}",
+            "color": 5814783,
+            "webhook_env": WEBHOOK_ENV,
+        }
+        for i in range(tools)
+    ]
+    path = workdir / "releases.json"
+    path.write_text(json.dumps(releases))
+    return path
+
+
+def build_scenarios(options: argparse.Namespace, base_url: str, tools: int) -> dict[str, Scenario]:
+    """Build the scenarios measured for one config size.
+
+    Args:
+        options: Parsed command line options
+        base_url: Base URL of the stand-in server
+        tools: Number of tools in the synthetic config
+
+    Returns:
+        Mapping of scenario name to scenario
+    """
+
+    def notifier_cold(workdir: Path):
+        return _notifier_run(workdir, options, base_url, tools)
+
+    def notifier_warm(workdir: Path):
+        # Populate version and HTTP caches first; the measured run then
+        # mostly sees 304 responses and no new releases
+        run = _notifier_run(workdir, options, base_url, tools)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            run()
+        return run
+
+    def send_to_discord(workdir: Path):
+        releases_file = _releases_file(workdir, tools)
+        translated = json.dumps(
+            [
+                {"tool_name": f"Tool {i:04d}", "translated_content": f"翻訳 {i}"}
+                for i in range(tools)
+            ]
+        )
+
+        def run():
+            releases = _load_releases(str(releases_file))
+            translated_map = {
+                r.tool_name: r.translated_content for r in _parse_translations(translated)
+            }
+            _send_notifications(releases, translated_map, markdown_dir=str(workdir / "releases"))
+
+        return run
+
+    def extract_response(workdir: Path):
+        execution_file = write_execution_file(workdir / "execution.json", tools)
+        return lambda: extract_claude_response(str(execution_file))
+
+    return {
+        "notifier.run.cold": notifier_cold,
+        "notifier.run.warm": notifier_warm,
+        "scripts.send_to_discord": send_to_discord,
+        "scripts.extract_claude_response": extract_response,
+    }
+
+
+def measure(scenario: Scenario, server: StandInServer) -> dict:
+    """Measure wall time, peak memory and HTTP traffic of a scenario.
+
+    Args:
+        scenario: Scenario to measure
+        server: Stand-in server whose counters are read
+
+    Returns:
+        Measurement dictionary
+    """
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        with tempfile.TemporaryDirectory() as tmp:
+            run = scenario(Path(tmp))
+            server.state.reset()
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            wall_seconds = time.perf_counter() - start
+            traffic = server.state.snapshot()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            run = scenario(Path(tmp))
+            gc.collect()
+            tracemalloc.start()
+            try:
+                run()
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    return {"wall_seconds": wall_seconds, "peak_memory_bytes": peak_memory, **traffic}
+
+
+def _git_revision() -> str | None:
+    """Get the current git revision, if available."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _package_version() -> str | None:
+    """Get the installed package version, if available."""
+    try:
+        return version("devtools-release-notifier")
+    except PackageNotFoundError:
+        return None
+
+
+def compare(results: dict, baseline: dict):
+    """Print relative changes against a baseline results file.
+
+    Args:
+        results: Current results
+        baseline: Results loaded from a previous run
+    """
+    previous = {(r["scenario"], r["tools"]): r for r in baseline.get("results", [])}
+    print("\n📊 Comparison with baseline:")
+    for result in results["results"]:
+        before = previous.get((result["scenario"], result["tools"]))
+        if not before:
+            continue
+        changes = []
+        for metric in METRICS:
+            if before.get(metric):
+                ratio = result[metric] / before[metric]
+                changes.append(f"{metric}={ratio:.2f}x")
+        print(f"  {result['scenario']} [{result['tools']} tools]: {', '.join(changes)}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Run end-to-end benchmarks")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Numbers of tools in the synthetic configs (default: 10 100 1000)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        metavar="NAME",
+        help="Only run scenarios whose name starts with one of these prefixes",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Stand-in response latency in seconds"
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of stand-in responses that fail with HTTP 500",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for failure injection")
+    parser.add_argument(
+        "--webhook-limit",
+        type=int,
+        default=0,
+        help="Webhook requests allowed per window, enforced with 429 responses (0: unlimited)",
+    )
+    parser.add_argument(
+        "--webhook-window", type=float, default=2.0, help="Webhook rate limit window in seconds"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="common.max_concurrency for the notifier"
+    )
+    parser.add_argument(
+        "--strategy", choices=["fallback", "race"], default="fallback", help="Source strategy"
+    )
+    parser.add_argument(
+        "--bulk-index", action="store_true", help="Enable the bulk Homebrew cask index"
+    )
+    parser.add_argument("--output", help="Write machine-readable results to this JSON file")
+    parser.add_argument("--compare", help="Baseline results JSON file to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point."""
+    options = parse_args(argv)
+    max_size = max(options.sizes)
+    cask_tokens = [tool_slug(i) for i in range(max_size)]
+    results: dict = {
+        "metadata": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "package_version": _package_version(),
+            "git_revision": _git_revision(),
+            "parameters": {
+                k: v for k, v in vars(options).items() if k not in ("output", "compare")
+            },
+        },
+        "results": [],
+    }
+
+    with StandInServer(
+        options.latency,
+        options.failure_rate,
+        cask_tokens,
+        options.seed,
+        options.webhook_limit,
+        options.webhook_window,
+    ) as server:
+        os.environ[WEBHOOK_ENV] = f"{server.base_url}/webhook/bench"
+        for tools in options.sizes:
+            for name, scenario in build_scenarios(options, server.base_url, tools).items():
+                if options.scenarios and not name.startswith(tuple(options.scenarios)):
+                    continue
+                measurement = measure(scenario, server)
+                results["results"].append({"scenario": name, "tools": tools, **measurement})
+                print(
+                    f"  {name} [{tools} tools]: "
+                    f"{measurement['wall_seconds']:.3f}s, "
+                    f"peak {measurement['peak_memory_bytes'] / 1024 / 1024:.1f} MiB, "
+                    f"{measurement['total_requests']} requests, "
+                    f"{measurement['connections']} connections"
+                )
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\n✓ Wrote results to {options.output}")
+
+    if options.compare:
+        with open(options.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Local HTTP stand-in for GitHub, Homebrew, changelog hosts and Discord.
+
+The server generates deterministic responses for any tool name, so synthetic
+configurations of arbitrary size can point every source at it. Latency and
+failure rates are configurable, and requests and connections are counted so
+benchmarks can report how many round trips a run needed.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+FEED_ENTRIES = 20
+CHANGELOG_VERSIONS = 200
+
+
+def _atom_feed(name: str, kind: str) -> str:
+    """Generate an Atom feed with FEED_ENTRIES entries, newest first."""
+    entries = []
+    for i in range(FEED_ENTRIES, 0, -1):
+        version = f"v1.{i}.0"
+        entries.append(
+            f"""  <entry>
+    <id>tag:github.com,2008:{name}/{version}</id>
+    <updated>2025-01-{1 + i % 28:02d}T12:00:00Z</updated>
+    <link rel="alternate" type="text/html" href="https://example.com/{name}/{kind}/{version}"/>
+    <title>{version}</title>
+    <content type="html">&lt;p&gt;{kind} notes for {name} {version}&lt;/p&gt;</content>
+    <author><name>bench</name></author>
+  </entry>"""
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        f"  <title>{name} {kind}</title>\n" + "\n".join(entries) + "\n</feed>\n"
+    )
+
+
+def _changelog(name: str) -> str:
+    """Generate a CHANGELOG.md with CHANGELOG_VERSIONS sections, newest first."""
+    sections = [f"# Changelog for {name}\n"]
+    for i in range(CHANGELOG_VERSIONS, 0, -1):
+        items = "\n".join(f"- Change {j} in 2.0.{i}" for j in range(10))
+        sections.append(f"## 2.0.{i}\n{items}\n")
+    return "\n".join(sections)
+
+
+def _cask(token: str) -> dict:
+    """Generate a cask entry."""
+    return {
+        "token": token,
+        "version": "3.0.0",
+        "homepage": f"https://example.com/{token}",
+        "url": f"https://example.com/{token}/download.dmg",
+        "desc": f"Synthetic cask {token}",
+    }
+
+
+class StandInState:
+    """Configuration and counters shared by all request handlers."""
+
+    def __init__(
+        self,
+        latency: float,
+        failure_rate: float,
+        cask_tokens: list[str],
+        seed: int,
+        webhook_limit: int = 0,
+        webhook_window: float = 2.0,
+    ):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.cask_tokens = cask_tokens
+        self.random = random.Random(seed)
+        self.webhook_limit = webhook_limit
+        self.webhook_window = webhook_window
+        self.webhook_windows: dict[str, tuple[float, int]] = {}
+        self.lock = threading.Lock()
+        self.requests: Counter[str] = Counter()
+        self.connections = 0
+        self.bytes_sent = 0
+
+    def should_fail(self) -> bool:
+        """Decide whether the current request fails."""
+        if self.failure_rate <= 0:
+            return False
+        with self.lock:
+            return self.random.random() < self.failure_rate
+
+    def take_webhook_slot(self, path: str) -> tuple[bool, dict[str, str]]:
+        """Apply the fixed-window webhook rate limit.
+
+        Args:
+            path: Webhook path (each path is its own bucket)
+
+        Returns:
+            Whether the request is allowed and the rate limit headers to send
+        """
+        if self.webhook_limit <= 0:
+            return True, {}
+
+        with self.lock:
+            now = time.monotonic()
+            start, used = self.webhook_windows.get(path, (now, 0))
+            if now - start >= self.webhook_window:
+                start, used = now, 0
+            reset_after = max(self.webhook_window - (now - start), 0.0)
+            allowed = used < self.webhook_limit
+            if allowed:
+                used += 1
+            self.webhook_windows[path] = (start, used)
+
+        headers = {
+            "X-RateLimit-Limit": str(self.webhook_limit),
+            "X-RateLimit-Remaining": str(self.webhook_limit - used),
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+        }
+        if not allowed:
+            headers["Retry-After"] = f"{reset_after:.3f}"
+        return allowed, headers
+
+    def count(self, kind: str, size: int = 0):
+        """Record a request."""
+        with self.lock:
+            self.requests[kind] += 1
+            self.bytes_sent += size
+
+    def snapshot(self) -> dict:
+        """Get a copy of the counters."""
+        with self.lock:
+            return {
+                "requests": dict(sorted(self.requests.items())),
+                "total_requests": sum(self.requests.values()),
+                "connections": self.connections,
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def reset(self):
+        """Reset counters."""
+        with self.lock:
+            self.requests.clear()
+            self.connections = 0
+            self.bytes_sent = 0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Route requests to generated responses."""
+
+    protocol_version = "HTTP/1.1"
+    server: StandInHTTPServer
+
+    def setup(self):
+        """Count new connections."""
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.connections += 1
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+    def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_cacheable(self, kind: str, body: bytes, content_type: str):
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.state.count(f"{kind}_304")
+            self._send(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+            return
+        self.server.state.count(kind, len(body))
+        self._send(HTTPStatus.OK, body, {"ETag": etag, "Content-Type": content_type})
+
+    def _prepare(self) -> bool:
+        """Apply latency and failure injection; return False if the request failed."""
+        state = self.server.state
+        if state.latency > 0:
+            time.sleep(state.latency)
+        if state.should_fail():
+            state.count("failed")
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR)
+            return False
+        return True
+
+    def do_GET(self):
+        """Serve feeds, casks and changelogs."""
+        if not self._prepare():
+            return
+
+        path = urlparse(self.path).path
+        parts = path.strip("/").split("/")
+        if path.endswith("/releases.atom"):
+            self._send_cacheable(
+                "feed", _atom_feed(parts[-2], "releases").encode(), "application/atom+xml"
+            )
+        elif path.endswith("/commits/main.atom"):
+            self._send_cacheable(
+                "feed", _atom_feed(parts[-3], "commits").encode(), "application/atom+xml"
+            )
+        elif path == "/api/cask.json":
+            casks = [_cask(token) for token in self.server.state.cask_tokens]
+            self._send_cacheable("cask_index", json.dumps(casks).encode(), "application/json")
+        elif path.startswith("/api/cask/"):
+            token = parts[-1].removesuffix(".json")
+            self._send_cacheable("cask", json.dumps(_cask(token)).encode(), "application/json")
+        elif path.endswith("/CHANGELOG.md"):
+            self._send_cacheable("changelog", _changelog(parts[-2]).encode(), "text/markdown")
+        else:
+            self.server.state.count("not_found")
+            self._send(HTTPStatus.NOT_FOUND)
+
+    def do_POST(self):
+        """Accept Discord webhook calls."""
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if not self._prepare():
+            return
+
+        path = urlparse(self.path).path
+        if path.startswith("/webhook/"):
+            allowed, headers = self.server.state.take_webhook_slot(path)
+            if not allowed:
+                self.server.state.count("webhook_429")
+                body = json.dumps({"retry_after": float(headers["Retry-After"])}).encode()
+                self._send(
+                    HTTPStatus.TOO_MANY_REQUESTS,
+                    body,
+                    {**headers, "Content-Type": "application/json"},
+                )
+                return
+            self.server.state.count("webhook")
+            self._send(HTTPStatus.NO_CONTENT, headers=headers)
+        else:
+            self.server.state.count("not_found")
+            self._send(HTTPStatus.NOT_FOUND)
+
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server carrying shared stand-in state."""
+
+    daemon_threads = True
+
+    def __init__(self, state: StandInState):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.state = state
+
+
+class StandInServer:
+    """Run the stand-in server in a background thread.
+
+    Example:
+        >>> with StandInServer(latency=0.01) as server:
+        ...     url = server.base_url + "/gh/owner/repo/releases.atom"
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        cask_tokens: list[str] | None = None,
+        seed: int = 0,
+        webhook_limit: int = 0,
+        webhook_window: float = 2.0,
+    ):
+        """Initialize server.
+
+        Args:
+            latency: Delay added to every response in seconds
+            failure_rate: Fraction of requests answered with HTTP 500
+            cask_tokens: Tokens listed in the bulk cask index
+            seed: Random seed for failure injection
+            webhook_limit: Webhook requests allowed per window, with Discord-style
+                X-RateLimit headers and 429 responses (0 disables the limit)
+            webhook_window: Webhook rate limit window in seconds
+        """
+        self.state = StandInState(
+            latency, failure_rate, cask_tokens or [], seed, webhook_limit, webhook_window
+        )
+        self._server: StandInHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        if not self._server:
+            raise RuntimeError("Server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> StandInServer:
+        self._server = StandInHTTPServer(self.state)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread:
+            self._thread.join()
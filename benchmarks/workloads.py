@@ -0,0 +1,151 @@
+"""Synthetic workloads for the benchmark suite."""
+
+import json
+from pathlib import Path
+
+import yaml
+
+SOURCE_TYPES = ["github_releases", "github_commits", "homebrew_cask", "changelog"]
+WEBHOOK_ENV = "BENCH_DISCORD_WEBHOOK"
+
+
+def tool_slug(index: int) -> str:
+    """Get the synthetic identifier of a tool."""
+    return f"tool-{index:04d}"
+
+
+def _source(source_type: str, slug: str, base_url: str, priority: int) -> dict:
+    """Build a source configuration pointing at the stand-in server."""
+    match source_type:
+        case "github_releases":
+            return {
+                "type": source_type,
+                "priority": priority,
+                "atom_url": f"{base_url}/gh/bench/{slug}/releases.atom",
+                "owner": "bench",
+                "repo": slug,
+            }
+        case "github_commits":
+            return {
+                "type": source_type,
+                "priority": priority,
+                "atom_url": f"{base_url}/gh/bench/{slug}/commits/main.atom",
+                "owner": "bench",
+                "repo": slug,
+            }
+        case "homebrew_cask":
+            return {
+                "type": source_type,
+                "priority": priority,
+                "api_url": f"{base_url}/api/cask/{slug}.json",
+            }
+        case "changelog":
+            return {
+                "type": source_type,
+                "priority": priority,
+                "raw_url": f"{base_url}/raw/{slug}/CHANGELOG.md",
+                "version_pattern": "simple",
+                "content_url": f"{base_url}/raw/{slug}/CHANGELOG.md",
+            }
+    raise ValueError(f"Unknown source type: {source_type}")
+
+
+def build_config(
+    tool_count: int,
+    base_url: str,
+    strategy: str = "fallback",
+    bulk_index: bool = False,
+    max_concurrency: int = 8,
+) -> dict:
+    """Build a synthetic config mixing all source types.
+
+    Each tool gets a primary source cycling through SOURCE_TYPES and a
+    fallback source of the next type, so failures exercise fallback paths.
+
+    Args:
+        tool_count: Number of tools
+        base_url: Base URL of the stand-in server
+        strategy: Source strategy ("fallback" or "race")
+        bulk_index: Enable the bulk Homebrew cask index
+        max_concurrency: Maximum number of tools processed at once
+
+    Returns:
+        Config dictionary in config.yml layout
+    """
+    tools = []
+    for i in range(tool_count):
+        slug = tool_slug(i)
+        primary = SOURCE_TYPES[i % len(SOURCE_TYPES)]
+        secondary = SOURCE_TYPES[(i + 1) % len(SOURCE_TYPES)]
+        tools.append(
+            {
+                "name": f"Tool {i:04d}",
+                "enabled": True,
+                "sources": [
+                    _source(primary, slug, base_url, 1),
+                    _source(secondary, slug, base_url, 2),
+                ],
+                "notification": {"webhook_env": WEBHOOK_ENV, "color": 5814783},
+            }
+        )
+
+    return {
+        "tools": tools,
+        "common": {
+            "check_interval_hours": 6,
+            "cache_directory": "cache",
+            "max_concurrency": max_concurrency,
+            "source_strategy": strategy,
+            "homebrew": {
+                "bulk_index": bulk_index,
+                "index_url": f"{base_url}/api/cask.json",
+            },
+        },
+    }
+
+
+def write_config(path: Path, config: dict) -> Path:
+    """Write a config dictionary as YAML."""
+    with open(path, "w") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+    return path
+
+
+def write_execution_file(path: Path, tool_count: int, turns: int = 50) -> Path:
+    """Write a synthetic Claude execution file in array format.
+
+    The file contains a number of conversation turns followed by a final
+    result item holding the translated JSON array.
+
+    Args:
+        path: Output path
+        tool_count: Number of translated releases in the final answer
+        turns: Number of intermediate assistant turns
+
+    Returns:
+        Path to the written file
+    """
+    translated = [
+        {"tool_name": f"Tool {i:04d}", "translated_content": f"翻訳されたリリースノート {i}"}
+        for i in range(tool_count)
+    ]
+    items: list[dict] = [{"type": "system", "subtype": "init"}]
+    for turn in range(turns):
+        items.append(
+            {
+                "type": "assistant",
+                "message": {"content": [{"type": "text", "text": f"Step {turn}. " * 40}]},
+            }
+        )
+        items.append(
+            {
+                "type": "user",
+                "message": {"content": [{"type": "tool_result", "content": "ok " * 200}]},
+            }
+        )
+    answer = json.dumps(translated, ensure_ascii=False, indent=2)
+    items.append({"type": "result", "result": f"```json\n{answer}\n```"})
+
+    with open(path, "w") as f:
+        json.dump(items, f, ensure_ascii=False)
+    return path
@@ -0,0 +1,186 @@
+"""Consolidated single-file version cache."""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.models.release import CachedRelease
+
+CACHE_STORE_FILENAME = "versions.json"
+
+
+def write_json_atomic(path: Path, data: object):
+    """Write JSON to a file so that readers never observe a partial document.
+
+    The data is written to a temporary sibling file, flushed to disk and then
+    moved over the target with a single rename.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def legacy_cache_path(cache_directory: str | Path, tool_name: str) -> Path:
+    """Get the legacy per-tool cache file path.
+
+    Args:
+        cache_directory: Cache directory path
+        tool_name: Tool name
+
+    Returns:
+        Path to the legacy ``<tool>_version.json`` file
+    """
+    # Convert tool name to snake_case for filename
+    filename = tool_name.lower().replace(" ", "_") + "_version.json"
+    return Path(cache_directory) / filename
+
+
+class CacheStore:
+    """Cache of the last notified version of every tool, kept in one file.
+
+    The file is read once on creation. Updates are staged in memory (safely
+    from worker threads) and written with a single atomic replace by
+    :meth:`commit`, so a crash never leaves a half-written cache behind.
+    """
+
+    def __init__(self, cache_directory: str | Path):
+        """Initialize store and load existing entries.
+
+        Args:
+            cache_directory: Cache directory path
+        """
+        self.cache_directory = Path(cache_directory)
+        self.path = self.cache_directory / CACHE_STORE_FILENAME
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._migrated_paths: list[Path] = []
+        self._entries: dict[str, CachedRelease] = self._load()
+
+    def _load(self) -> dict[str, CachedRelease]:
+        """Load entries from disk.
+
+        Returns:
+            Mapping of tool name to cached release (empty if missing or invalid)
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return {name: CachedRelease(**entry) for name, entry in data.items()}
+        except json.JSONDecodeError as e:
+            print(f"⚠️  Failed to parse cache: Invalid JSON - {e}")
+        except (ValidationError, AttributeError) as e:
+            print(f"⚠️  Failed to validate cache: {e}")
+        except OSError as e:
+            print(f"⚠️  Failed to read cache: {e}")
+        return {}
+
+    def migrate_legacy_files(self, tool_names: list[str]):
+        """Import legacy per-tool ``*_version.json`` files into the store.
+
+        Only tools without an entry are imported. Migrated files are removed
+        after the next successful :meth:`commit`.
+
+        Args:
+            tool_names: Names of the configured tools
+        """
+        for tool_name in tool_names:
+            legacy_path = legacy_cache_path(self.cache_directory, tool_name)
+            if tool_name in self._entries or not legacy_path.exists():
+                continue
+
+            try:
+                with open(legacy_path) as f:
+                    cached = CachedRelease(**json.load(f))
+            except (OSError, json.JSONDecodeError, ValidationError) as e:
+                print(f"⚠️  Failed to migrate cache for {tool_name}: {e}")
+                continue
+
+            with self._lock:
+                self._entries[tool_name] = cached
+                self._migrated_paths.append(legacy_path)
+                self._dirty = True
+
+    def get(self, tool_name: str) -> CachedRelease | None:
+        """Get cached release for a tool.
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            Cached release information or None if not found
+        """
+        return self._entries.get(tool_name)
+
+    def set(self, tool_name: str, version: str):
+        """Stage a new cached version for a tool.
+
+        The detection time is added to the tool's release times unless this
+        is the first version seen for the tool.
+
+        Args:
+            tool_name: Tool name
+            version: Version string
+        """
+        with self._lock:
+            previous = self._entries.get(tool_name)
+            cached = CachedRelease(version=version)
+            if previous:
+                from devtools_release_notifier.cadence import record_release
+
+                cached.release_times = record_release(previous.release_times, cached.timestamp)
+                cached.checked_at = previous.checked_at
+            self._entries[tool_name] = cached
+            self._dirty = True
+
+    def mark_checked(self, tool_name: str, checked_at: datetime):
+        """Stage the time a tool was last checked successfully.
+
+        Tools without a cached version are left unmarked.
+
+        Args:
+            tool_name: Tool name
+            checked_at: Time of the check
+        """
+        with self._lock:
+            cached = self._entries.get(tool_name)
+            if cached is None:
+                return
+            self._entries[tool_name] = cached.model_copy(update={"checked_at": checked_at})
+            self._dirty = True
+
+    def commit(self):
+        """Write all staged updates to disk atomically."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {name: entry.model_dump() for name, entry in sorted(self._entries.items())}
+            migrated_paths = self._migrated_paths
+            self._migrated_paths = []
+            self._dirty = False
+
+        try:
+            write_json_atomic(self.path, data)
+        except OSError as e:
+            print(f"⚠️  Failed to write cache: {e}")
+            return
+
+        for legacy_path in migrated_paths:
+            legacy_path.unlink(missing_ok=True)
@@ -0,0 +1,49 @@
+"""Check intervals derived from observed release cadence."""
+
+import itertools
+import statistics
+from datetime import datetime, timedelta
+
+# Release times kept per tool to estimate its cadence
+CADENCE_HISTORY = 10
+
+# A tool is checked this many times per typical gap between its releases
+CHECKS_PER_RELEASE = 4
+
+
+def record_release(release_times: list[datetime], detected: datetime) -> list[datetime]:
+    """Append a release detection time, keeping only the latest ones.
+
+    Args:
+        release_times: Previous detection times, oldest first
+        detected: Detection time of the new release
+
+    Returns:
+        Updated detection times, oldest first
+    """
+    return [*release_times, detected][-CADENCE_HISTORY:]
+
+
+def cadence_interval(
+    release_times: list[datetime], min_interval: timedelta, max_interval: timedelta
+) -> timedelta:
+    """Derive a check interval from the gaps between past releases.
+
+    The interval is a fraction of the median gap, so a tool that ships every
+    few hours is checked hourly while one that ships monthly is checked
+    about weekly. The median ignores occasional hotfix bursts and long
+    pauses. Tools with fewer than two known releases get the floor.
+
+    Args:
+        release_times: Detection times of past releases, oldest first
+        min_interval: Shortest interval (floor)
+        max_interval: Longest interval (ceiling)
+
+    Returns:
+        Check interval between the floor and the ceiling
+    """
+    if len(release_times) < 2:
+        return min_interval
+    gaps = [later - earlier for earlier, later in itertools.pairwise(release_times)]
+    interval = statistics.median_low(gaps) / CHECKS_PER_RELEASE
+    return min(max(interval, min_interval), max_interval)
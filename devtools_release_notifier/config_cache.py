@@ -0,0 +1,148 @@
+"""Compiled configuration cache.
+
+Parsing ``config.yml`` with PyYAML dominates start-up once the file lists
+thousands of tools (seconds, against about a hundred milliseconds for the
+Pydantic validation). The validated configuration is therefore stored as
+compact JSON, keyed by the SHA-256 of the YAML file and the package version,
+and loaded with :meth:`AppConfig.model_validate_json` while the key matches.
+
+Only the values set in ``config.yml`` are stored, and loading validates
+them again, so defaults and validators always come from the running code
+even though the package version rarely changes between code changes.
+
+The key is the first line of the file and the configuration the rest, so a
+stale cache is detected without decoding the configuration.
+"""
+
+import hashlib
+import os
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.models.config import AppConfig
+
+COMPILED_CONFIG_FILENAME = "config.compiled.json"
+
+# Bumped when the stored contents change meaning (2: values set in the file only)
+COMPILED_FORMAT = 2
+
+
+def _package_version() -> str:
+    """Get the installed package version ("unknown" when running from source)."""
+    try:
+        return version("devtools-release-notifier")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def config_key(config_data: bytes) -> str:
+    """Compute the cache key of a configuration file.
+
+    Args:
+        config_data: Raw contents of the YAML file
+
+    Returns:
+        Package version, compiled format and SHA-256 digest of the contents
+    """
+    digest = hashlib.sha256(config_data).hexdigest()
+    return f"{_package_version()}:{COMPILED_FORMAT}:{digest}"
+
+
+def load_compiled_config(compiled_path: Path, key: str) -> AppConfig | None:
+    """Load a compiled configuration if it was built from the same file.
+
+    Args:
+        compiled_path: Compiled configuration path
+        key: Key of the current configuration file
+
+    Returns:
+        Validated configuration, or None if missing, stale or invalid
+    """
+    try:
+        with open(compiled_path, encoding="utf-8") as f:
+            if f.readline().rstrip("\n") != key:
+                return None
+            return AppConfig.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, ValidationError) as e:
+        print(f"⚠️  Ignoring invalid compiled config: {e}")
+        return None
+
+
+def write_compiled_config(compiled_path: Path, key: str, config: AppConfig):
+    """Replace the compiled configuration atomically.
+
+    Args:
+        compiled_path: Compiled configuration path
+        key: Key of the configuration file it was built from
+        config: Validated configuration (only the values set are stored)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    compiled_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = compiled_path.with_name(compiled_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(key + "\n")
+        f.write(config.model_dump_json(exclude_unset=True))
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, compiled_path)
+
+
+def parse_config(config_data: bytes) -> AppConfig:
+    """Parse and validate the YAML configuration.
+
+    PyYAML is imported here so that runs served from the compiled cache
+    never load it.
+
+    Args:
+        config_data: Contents of the configuration file
+
+    Returns:
+        Validated configuration
+
+    Raises:
+        yaml.YAMLError: If the configuration is not valid YAML
+        pydantic.ValidationError: If the configuration is invalid
+    """
+    import yaml
+
+    return AppConfig(**yaml.safe_load(config_data))
+
+
+def load_config(config_path: str | Path, compiled_path: str | Path | None = None) -> AppConfig:
+    """Load and validate the configuration, using the compiled cache if given.
+
+    Args:
+        config_path: Path to the YAML configuration file
+        compiled_path: Compiled configuration path (cache disabled if None)
+
+    Returns:
+        Validated configuration
+
+    Raises:
+        OSError: If the configuration file cannot be read
+        yaml.YAMLError: If the configuration file is not valid YAML
+        pydantic.ValidationError: If the configuration is invalid
+    """
+    config_data = Path(config_path).read_bytes()
+    if compiled_path is None:
+        return parse_config(config_data)
+
+    compiled_path = Path(compiled_path)
+    key = config_key(config_data)
+    config = load_compiled_config(compiled_path, key)
+    if config is not None:
+        return config
+
+    config = parse_config(config_data)
+    try:
+        write_compiled_config(compiled_path, key, config)
+    except OSError as e:
+        print(f"⚠️  Failed to write compiled config: {e}")
+    return config
@@ -0,0 +1,116 @@
+"""Conditional request cache (ETag / Last-Modified) for source URLs."""
+
+import json
+import threading
+from pathlib import Path
+
+import httpx
+from pydantic import ValidationError
+
+from devtools_release_notifier.cache_store import write_json_atomic
+from devtools_release_notifier.models.release import CachedResponse
+
+HTTP_CACHE_FILENAME = "http_cache.json"
+
+
+class HttpCache:
+    """Persist HTTP validators per URL and replay results on 304 Not Modified.
+
+    Entries are loaded once, updated in memory (safely from worker threads)
+    and written back with a single atomic replace by :meth:`save`.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize cache and load existing entries.
+
+        Args:
+            path: Path to the cache file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: dict[str, CachedResponse] = self._load()
+
+    def _load(self) -> dict[str, CachedResponse]:
+        """Load entries from disk.
+
+        Returns:
+            Mapping of URL to cached response (empty if missing or invalid)
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return {url: CachedResponse(**entry) for url, entry in data.items()}
+        except (OSError, json.JSONDecodeError, ValidationError, AttributeError) as e:
+            print(f"⚠️  Failed to load HTTP cache: {e}")
+            return {}
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Build conditional request headers for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if nothing is cached)
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def result(self, url: str) -> dict | None:
+        """Get the result stored for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Release information parsed from the last 200 response or None
+        """
+        entry = self._entries.get(url)
+        return dict(entry.result) if entry else None
+
+    def store(self, url: str, response: httpx.Response, result: dict):
+        """Store validators from a response together with its parsed result.
+
+        Responses without ETag or Last-Modified are not cached.
+
+        Args:
+            url: Request URL
+            response: Successful HTTP response
+            result: Release information parsed from the response
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        entry = CachedResponse(etag=etag, last_modified=last_modified, result=result)
+        with self._lock:
+            self._entries[url] = entry
+            self._dirty = True
+
+    def save(self):
+        """Write entries to disk atomically if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                url: entry.model_dump(mode="json") for url, entry in sorted(self._entries.items())
+            }
+            self._dirty = False
+
+        try:
+            write_json_atomic(self.path, data)
+        except OSError as e:
+            print(f"⚠️  Failed to write HTTP cache: {e}")
@@ -0,0 +1,34 @@
+"""Shared HTTP client factory."""
+
+import httpx
+
+from devtools_release_notifier.models.config import HttpConfig
+
+USER_AGENT = "devtools-release-notifier"
+
+
+def create_http_client(config: HttpConfig | None = None) -> httpx.Client:
+    """Create a connection-pooled HTTP client.
+
+    A single client is meant to be shared by every source and notifier so that
+    connections to the same host (github.com, formulae.brew.sh, discord.com)
+    are kept alive and reused instead of re-negotiating TCP and TLS per request.
+
+    Args:
+        config: HTTP client configuration (defaults are used if omitted)
+
+    Returns:
+        Configured HTTP client
+    """
+    config = config or HttpConfig()
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry_seconds,
+    )
+    return httpx.Client(
+        limits=limits,
+        timeout=config.timeout_seconds,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+    )
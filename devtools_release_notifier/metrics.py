@@ -0,0 +1,229 @@
+"""Lightweight timers and counters for notifier runs.
+
+Measurements are aggregated in memory per metric name and label set and can
+be written as JSON lines or OpenMetrics text at the end of a run. Labels such
+as the tool and source type are bound for the current context with
+:meth:`Metrics.labels`, so code deeper in the call stack only adds what it
+knows (for example the host).
+
+A disabled instance returns a shared no-op context manager from
+:meth:`Metrics.timer` and returns immediately from :meth:`Metrics.count`, so
+instrumentation can stay in place at negligible cost.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+from urllib.parse import urlsplit
+
+MetricsFormat = Literal["jsonl", "openmetrics"]
+
+METRIC_PREFIX = "devtools_notifier"
+PHASE_METRIC = "phase_seconds"
+
+LabelKey = tuple[tuple[str, str], ...]
+
+_bound_labels: ContextVar[dict[str, str] | None] = ContextVar("metrics_labels", default=None)
+_NULL_CONTEXT = nullcontext()
+
+
+def url_host(url: str) -> str:
+    """Get the host label for a URL.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Host name, or "unknown" if the URL has none
+    """
+    return urlsplit(url).hostname or "unknown"
+
+
+@dataclass
+class TimerStats:
+    """Aggregated timer observations."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float):
+        """Record one observation."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class _Timer:
+    """Context manager recording elapsed time into a Metrics instance."""
+
+    __slots__ = ("_key", "_metrics", "_start")
+
+    def __init__(self, metrics: Metrics, key: LabelKey):
+        self._metrics = metrics
+        self._key = key
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._metrics._observe(self._key, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Thread-safe collection of phase timers and counters."""
+
+    def __init__(self, enabled: bool = True):
+        """Initialize metrics.
+
+        Args:
+            enabled: Record measurements (a disabled instance records nothing)
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._timers: dict[LabelKey, TimerStats] = {}
+        self._counters: dict[tuple[str, LabelKey], int] = {}
+
+    def _key(self, labels: dict[str, str]) -> LabelKey:
+        """Merge context labels with explicit labels into a hashable key."""
+        merged = {**(_bound_labels.get() or {}), **labels}
+        return tuple(sorted((name, str(value)) for name, value in merged.items()))
+
+    @contextmanager
+    def _bind(self, labels: dict[str, str]) -> Iterator[None]:
+        token = _bound_labels.set({**(_bound_labels.get() or {}), **labels})
+        try:
+            yield
+        finally:
+            _bound_labels.reset(token)
+
+    def labels(self, **labels: str) -> AbstractContextManager[None]:
+        """Bind labels to all measurements made in the current context.
+
+        Args:
+            **labels: Label names and values (e.g. tool, source)
+
+        Returns:
+            Context manager restoring the previous labels on exit
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._bind(labels)
+
+    def timer(self, phase: str, **labels: str) -> AbstractContextManager[None]:
+        """Time a block of code as one phase.
+
+        Args:
+            phase: Phase name (fetch, parse, validate, cache, notify, run)
+            **labels: Additional labels (e.g. host)
+
+        Returns:
+            Context manager recording the elapsed time on exit
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _Timer(self, self._key({"phase": phase, **labels}))
+
+    def count(self, name: str, value: int = 1, **labels: str):
+        """Increment a counter.
+
+        Args:
+            name: Counter name
+            value: Increment
+            **labels: Additional labels (e.g. host, status)
+        """
+        if not self.enabled:
+            return
+        key = (name, self._key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, key: LabelKey, seconds: float):
+        with self._lock:
+            self._timers.setdefault(key, TimerStats()).observe(seconds)
+
+    def records(self) -> list[dict]:
+        """Get all measurements as JSON-serializable records.
+
+        Returns:
+            Timer records followed by counter records
+        """
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+
+        records: list[dict] = [
+            {
+                "type": "timer",
+                "name": PHASE_METRIC,
+                "labels": dict(key),
+                "count": stats.count,
+                "sum": stats.total,
+                "max": stats.max,
+            }
+            for key, stats in timers
+        ]
+        records.extend(
+            {"type": "counter", "name": name, "labels": dict(key), "value": value}
+            for (name, key), value in counters
+        )
+        return records
+
+    def to_json_lines(self) -> str:
+        """Render measurements as JSON lines."""
+        return "".join(json.dumps(record) + "\n" for record in self.records())
+
+    def to_openmetrics(self) -> str:
+        """Render measurements in the OpenMetrics text format."""
+        lines: list[str] = []
+        declared: set[str] = set()
+        for record in self.records():
+            name = f"{METRIC_PREFIX}_{record['name']}"
+            labels = _format_labels(record["labels"])
+            if record["type"] == "timer":
+                if name not in declared:
+                    lines.append(f"# TYPE {name} summary")
+                    lines.append(f"# UNIT {name} seconds")
+                lines.append(f"{name}_count{labels} {record['count']}")
+                lines.append(f"{name}_sum{labels} {record['sum']}")
+            else:
+                if name not in declared:
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}_total{labels} {record['value']}")
+            declared.add(name)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path, format: MetricsFormat = "jsonl"):
+        """Write measurements to a file.
+
+        Args:
+            path: Output file path
+            format: "jsonl" for JSON lines or "openmetrics" for OpenMetrics text
+        """
+        text = self.to_openmetrics() if format == "openmetrics" else self.to_json_lines()
+        Path(path).write_text(text)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Format labels for the OpenMetrics text format."""
+    if not labels:
+        return ""
+    pairs = (f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared disabled instance used when no metrics are passed in
+NULL_METRICS = Metrics(enabled=False)
@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class GitHubReleasesSourceConfig(BaseModel):
@@ -109,10 +109,16 @@ class ToolConfig(BaseModel):
         enabled: Whether this tool is enabled
         sources: List of source configurations
         notification: Discord notification configuration
+        check_interval_hours: Check interval (defaults to
+            common.check_interval_hours). ``run`` skips the tool if it was
+            checked within the interval unless ``--force`` is passed
     """
 
     name: str = Field(..., description="Tool name")
     enabled: bool = Field(default=True, description="Whether this tool is enabled")
+    check_interval_hours: int | None = Field(
+        default=None, ge=1, description="Check interval in hours (overrides common)"
+    )
     sources: list[SourceConfig] = Field(..., description="Source configurations")
     notification: NotificationConfig = Field(..., description="Notification configuration")
 
@@ -125,16 +131,116 @@ def validate_sources(cls, v: list[SourceConfig]) -> list[SourceConfig]:
         return v
 
 
+class HttpConfig(BaseModel):
+    """Shared HTTP client configuration.
+
+    Attributes:
+        timeout_seconds: Request timeout in seconds
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle keep-alive connections
+        keepalive_expiry_seconds: Idle time before a keep-alive connection is closed
+    """
+
+    timeout_seconds: float = Field(default=10.0, gt=0, description="Request timeout in seconds")
+    max_connections: int = Field(
+        default=20, ge=1, description="Maximum number of concurrent connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Maximum number of idle keep-alive connections"
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0, ge=0, description="Idle time before a keep-alive connection is closed"
+    )
+
+
+class HomebrewConfig(BaseModel):
+    """Homebrew bulk cask index configuration.
+
+    Attributes:
+        bulk_index: Answer all Homebrew sources from one bulk index download
+        index_url: Bulk cask API URL
+        index_file: Local file in bulk API format used instead of index_url
+    """
+
+    bulk_index: bool = Field(default=False, description="Use the bulk cask index")
+    index_url: str = Field(
+        default="https://formulae.brew.sh/api/cask.json", description="Bulk cask API URL"
+    )
+    index_file: str | None = Field(None, description="Local bulk index file (e.g. for tests)")
+
+
+class DiscordConfig(BaseModel):
+    """Discord delivery configuration.
+
+    Attributes:
+        batch: Send new releases after all tools are checked, packed into
+            multi-embed messages per webhook, instead of one message each
+    """
+
+    batch: bool = Field(default=False, description="Pack notifications into multi-embed messages")
+
+
+class AdaptivePollingConfig(BaseModel):
+    """Adaptive per-tool polling configuration.
+
+    Attributes:
+        enabled: Derive each tool's check interval from its observed release
+            cadence and skip tools that are not due yet
+        min_interval_hours: Shortest check interval (floor)
+        max_interval_hours: Longest check interval (ceiling)
+    """
+
+    enabled: bool = Field(default=False, description="Poll tools according to release cadence")
+    min_interval_hours: float = Field(default=1.0, gt=0, description="Shortest check interval")
+    max_interval_hours: float = Field(default=168.0, gt=0, description="Longest check interval")
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> AdaptivePollingConfig:
+        """Validate that the floor does not exceed the ceiling."""
+        if self.min_interval_hours > self.max_interval_hours:
+            raise ValueError("min_interval_hours must not exceed max_interval_hours")
+        return self
+
+
 class CommonConfig(BaseModel):
     """Common configuration.
 
     Attributes:
-        check_interval_hours: Check interval in hours
+        check_interval_hours: Check interval in hours. ``run`` skips tools
+            checked within the interval unless ``--force`` is passed
+        check_jitter: Random spread applied to every check interval in serve
+            mode, as a fraction of the interval
         cache_directory: Cache directory path
+        max_concurrency: Maximum number of tools processed concurrently
+        source_strategy: How sources of a tool are resolved ('fallback' tries them
+            one by one in priority order, 'race' starts them all at once)
+        http: Shared HTTP client configuration
+        homebrew: Homebrew bulk cask index configuration
+        discord: Discord delivery configuration
+        adaptive_polling: Adaptive per-tool polling configuration
     """
 
     check_interval_hours: int = Field(default=6, ge=1, description="Check interval in hours")
+    check_jitter: float = Field(
+        default=0.1, ge=0, le=0.5, description="Random spread of check intervals (fraction)"
+    )
     cache_directory: str = Field(default="./cache", description="Cache directory path")
+    max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum number of tools processed concurrently"
+    )
+    source_strategy: Literal["fallback", "race"] = Field(
+        default="fallback", description="Source resolution strategy ('fallback' or 'race')"
+    )
+    http: HttpConfig = Field(default_factory=HttpConfig, description="HTTP client configuration")
+    homebrew: HomebrewConfig = Field(
+        default_factory=HomebrewConfig, description="Homebrew bulk index configuration"
+    )
+    discord: DiscordConfig = Field(
+        default_factory=DiscordConfig, description="Discord delivery configuration"
+    )
+    adaptive_polling: AdaptivePollingConfig = Field(
+        default_factory=AdaptivePollingConfig, description="Adaptive polling configuration"
+    )
 
 
 class AppConfig(BaseModel):
@@ -6,6 +6,16 @@
 
 from devtools_release_notifier.templates import render_template
 
+# Discord limits (https://discord.com/developers/docs/resources/message#embed-object-embed-limits)
+EMBED_TITLE_LIMIT = 256
+EMBEDS_PER_MESSAGE = 10
+MESSAGE_EMBED_CHARS_LIMIT = 6000
+
+# Release content is cut below the 4096-character description limit to leave
+# some headroom
+CONTENT_MAX_LENGTH = 4000
+FOOTER_TEXT = "devtools-release-notifier"
+
 
 class DiscordEmbedFooter(BaseModel):
     """Discord embed footer.
@@ -36,6 +46,46 @@ class DiscordEmbed(BaseModel):
     timestamp: str = Field(..., description="ISO 8601 timestamp")
     footer: DiscordEmbedFooter | None = Field(None, description="Embed footer")
 
+    @classmethod
+    def create_release(
+        cls,
+        tool_name: str,
+        version: str,
+        content: str,
+        url: str,
+        color: int,
+    ) -> DiscordEmbed:
+        """Create a release embed within Discord's per-embed limits.
+
+        Args:
+            tool_name: Tool name
+            version: Version string
+            content: Release content
+            url: Release URL
+            color: Embed color
+
+        Returns:
+            Discord embed
+        """
+        title = render_template(t"🚀 {tool_name} - {version}")
+        return cls(
+            title=title[:EMBED_TITLE_LIMIT],
+            description=content[:CONTENT_MAX_LENGTH],
+            url=url,
+            color=color,
+            timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            footer=DiscordEmbedFooter(text=FOOTER_TEXT),
+        )
+
+    def character_count(self) -> int:
+        """Count characters toward Discord's per-message embed limit.
+
+        Returns:
+            Combined length of title, description and footer text
+        """
+        footer = self.footer.text if self.footer else ""
+        return len(self.title) + len(self.description) + len(footer)
+
 
 class DiscordWebhookPayload(BaseModel):
     """Discord webhook payload.
@@ -67,16 +117,66 @@ def create_release_notification(
         Returns:
             Discord webhook payload
         """
-        # Limit content to Discord's embed description limit (4096 chars)
-        truncated_content = content[:4000] if len(content) > 4000 else content
-
-        embed = DiscordEmbed(
-            title=render_template(t"🚀 {tool_name} - {version}"),
-            description=truncated_content,
-            url=url,
-            color=color,
-            timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-            footer=DiscordEmbedFooter(text="devtools-release-notifier"),
+        embed = DiscordEmbed.create_release(
+            tool_name=tool_name, version=version, content=content, url=url, color=color
         )
-
         return cls(embeds=[embed])
+
+    @classmethod
+    def pack(cls, embeds: list[DiscordEmbed]) -> list[DiscordWebhookPayload]:
+        """Pack embeds into as few payloads as Discord's message limits allow.
+
+        Embeds keep their order; a new payload is started when adding the next
+        embed would exceed the embed count or combined character limit.
+
+        Args:
+            embeds: Embeds to send
+
+        Returns:
+            Payloads whose embeds, concatenated, equal the input
+        """
+        payloads: list[DiscordWebhookPayload] = []
+        batch: list[DiscordEmbed] = []
+        batch_chars = 0
+        for embed in embeds:
+            chars = embed.character_count()
+            if batch and (
+                len(batch) >= EMBEDS_PER_MESSAGE or batch_chars + chars > MESSAGE_EMBED_CHARS_LIMIT
+            ):
+                payloads.append(cls(embeds=batch))
+                batch, batch_chars = [], 0
+            batch.append(embed)
+            batch_chars += chars
+        if batch:
+            payloads.append(cls(embeds=batch))
+        return payloads
+
+
+class ReleaseNotification(BaseModel):
+    """Release notification addressed to a resolved webhook.
+
+    Attributes:
+        webhook_url: Discord webhook URL
+        tool_name: Tool name
+        version: Version string
+        content: Release content
+        url: Release URL
+        color: Embed color (integer)
+    """
+
+    webhook_url: str = Field(..., description="Discord webhook URL")
+    tool_name: str = Field(..., description="Tool name")
+    version: str = Field(..., description="Version string")
+    content: str = Field(..., description="Release content")
+    url: str = Field(..., description="Release URL")
+    color: int = Field(..., ge=0, le=16777215, description="Embed color (0-16777215)")
+
+    def to_embed(self) -> DiscordEmbed:
+        """Build the release embed for this notification."""
+        return DiscordEmbed.create_release(
+            tool_name=self.tool_name,
+            version=self.version,
+            content=self.content,
+            url=self.url,
+            color=self.color,
+        )
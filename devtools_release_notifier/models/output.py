@@ -1,6 +1,8 @@
 """Output models for GitHub Actions integration."""
 
-from pydantic import BaseModel, Field
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer
 
 
 class ReleaseOutput(BaseModel):
@@ -42,3 +44,56 @@ class TranslatedRelease(BaseModel):
 
     tool_name: str = Field(..., description="Tool name")
     translated_content: str = Field(..., description="Translated content in Japanese")
+
+
+# Validators for whole JSON arrays, built once and reused (validate_json parses
+# and validates in a single pass)
+RELEASE_OUTPUT_LIST_ADAPTER = TypeAdapter(list[ReleaseOutput])
+TRANSLATED_RELEASE_LIST_ADAPTER = TypeAdapter(list[TranslatedRelease])
+
+
+class OutboxEntry(BaseModel):
+    """Pending Discord delivery stored in the notification outbox.
+
+    The webhook is stored by environment variable name, never by URL, since
+    the outbox lives in the committed cache directory.
+
+    Attributes:
+        release: Release to notify (content is what will be sent)
+        attempts: Number of failed delivery attempts
+        next_attempt_at: Earliest time of the next delivery attempt
+        last_error: Reason the last attempt failed
+    """
+
+    release: ReleaseOutput = Field(..., description="Release to notify")
+    attempts: int = Field(default=0, ge=0, description="Number of failed delivery attempts")
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="Earliest next attempt time"
+    )
+    last_error: str | None = Field(None, description="Reason the last attempt failed")
+
+    @property
+    def key(self) -> str:
+        """Identify the release (one pending delivery per tool version)."""
+        return f"{self.release.tool_name}@{self.release.version}"
+
+    @field_serializer("next_attempt_at")
+    def serialize_next_attempt_at(self, value: datetime) -> str:
+        """Serialize next attempt datetime to ISO format string."""
+        return value.isoformat()
+
+
+class ReleaseLogEntry(BaseModel):
+    """Markdown release log listed in the releases manifest.
+
+    Attributes:
+        date: Release log date (YYYY-MM-DD, also the file name)
+        tool: Tool directory name (slug)
+        path: Path of the log relative to the releases directory
+        title: Frontmatter title ("<tool name> - <version>")
+    """
+
+    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$", description="Release log date")
+    tool: str = Field(..., description="Tool directory name")
+    path: str = Field(..., description="Path relative to the releases directory")
+    title: str = Field(..., description="Frontmatter title")
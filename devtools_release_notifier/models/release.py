@@ -39,14 +39,64 @@ class CachedRelease(BaseModel):
     Attributes:
         version: Version string
         timestamp: Cache timestamp
+        release_times: Detection times of the latest releases, oldest first
+        checked_at: Time of the last successful check
     """
 
     version: str = Field(..., description="Cached version string")
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(UTC), description="Cache timestamp"
     )
+    release_times: list[datetime] = Field(
+        default_factory=list, description="Detection times of the latest releases"
+    )
+    checked_at: datetime | None = Field(None, description="Time of the last successful check")
 
     @field_serializer("timestamp")
     def serialize_timestamp(self, value: datetime) -> str:
         """Serialize timestamp datetime to ISO format string."""
         return value.isoformat()
+
+    @field_serializer("release_times")
+    def serialize_release_times(self, value: list[datetime]) -> list[str]:
+        """Serialize release times to ISO format strings."""
+        return [v.isoformat() for v in value]
+
+    @field_serializer("checked_at")
+    def serialize_checked_at(self, value: datetime | None) -> str | None:
+        """Serialize last check datetime to ISO format string."""
+        return value.isoformat() if value else None
+
+
+class CachedResponse(BaseModel):
+    """Conditional request validators for a fetched URL.
+
+    Attributes:
+        etag: ETag header of the last successful response
+        last_modified: Last-Modified header of the last successful response
+        result: Release information parsed from that response
+    """
+
+    etag: str | None = Field(None, description="ETag header value")
+    last_modified: str | None = Field(None, description="Last-Modified header value")
+    result: dict = Field(..., description="Release information parsed from the response")
+
+
+class ReleaseRecord(BaseModel):
+    """Release of a tool recorded in the release history.
+
+    Attributes:
+        version: Version string
+        source: Source type the release was found by
+        published: Publication datetime reported by the source
+        detected: Time the notifier first saw the release
+        content_hash: SHA-256 of the release notes
+    """
+
+    version: str = Field(..., description="Version string")
+    source: Literal["github_releases", "homebrew_cask", "github_commits", "changelog"] = Field(
+        ..., description="Source type identifier"
+    )
+    published: datetime = Field(..., description="Publication datetime")
+    detected: datetime = Field(..., description="Detection datetime")
+    content_hash: str = Field(..., description="SHA-256 of the release notes")
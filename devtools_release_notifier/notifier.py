@@ -1,56 +1,159 @@
 """Main notifier script."""
 
 import argparse
+import asyncio
+import contextlib
+import contextvars
+import functools
 import json
 import os
+import signal
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-
-import yaml
-from pydantic import ValidationError
-
-from devtools_release_notifier.models.config import AppConfig
+from typing import TYPE_CHECKING, Any
+
+from devtools_release_notifier.cache_store import CacheStore, legacy_cache_path
+from devtools_release_notifier.config_cache import COMPILED_CONFIG_FILENAME, load_config
+from devtools_release_notifier.http_cache import HTTP_CACHE_FILENAME, HttpCache
+from devtools_release_notifier.http_client import create_http_client
+from devtools_release_notifier.metrics import NULL_METRICS, Metrics, MetricsFormat
+from devtools_release_notifier.models.config import ToolConfig
+from devtools_release_notifier.models.discord import CONTENT_MAX_LENGTH
 from devtools_release_notifier.models.output import ReleaseOutput
 from devtools_release_notifier.models.release import CachedRelease, ReleaseInfo
-from devtools_release_notifier.notifiers.discord import DiscordNotifier
-from devtools_release_notifier.sources.base import ReleaseSource
-from devtools_release_notifier.sources.changelog import ChangelogSource
-from devtools_release_notifier.sources.github_commits import GitHubCommitsSource
-from devtools_release_notifier.sources.github_releases import GitHubReleaseSource
-from devtools_release_notifier.sources.homebrew_cask import HomebrewCaskSource
+from devtools_release_notifier.sources import SOURCE_CLASSES, get_source_class
+from devtools_release_notifier.sources.base import FetchCancelled, ReleaseSource
+
+# Modules only some commands or configurations need are imported on first use
+if TYPE_CHECKING:
+    from devtools_release_notifier.models.discord import ReleaseNotification
+    from devtools_release_notifier.notifiers.discord import DiscordNotifier
+    from devtools_release_notifier.outbox import NotificationOutbox
+    from devtools_release_notifier.release_history import ReleaseHistory
+    from devtools_release_notifier.sources.homebrew_index import HomebrewCaskIndex
+
+# Scheduled runs may start a little earlier than the interval after the previous one
+CHECK_GRACE = timedelta(minutes=15)
+
+# Separates the notes of releases reported together
+CATCH_UP_SEPARATOR = "\n\n"
 
 
 class UnifiedReleaseNotifier:
     """Unified release notifier for development tools."""
 
-    def __init__(self, config_path: str = "config.yml"):
+    def __init__(
+        self,
+        config_path: str = "config.yml",
+        metrics: Metrics | None = None,
+        compiled_config_path: str | Path | None = None,
+    ):
         """Initialize notifier with configuration.
 
         Args:
             config_path: Path to configuration file
+            metrics: Metrics to record timings and counters in (disabled if omitted)
+            compiled_config_path: Compiled configuration cache, reused while
+                the configuration file is unchanged (disabled if omitted)
         """
-        # Load configuration
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
+        self.metrics = metrics if metrics is not None else NULL_METRICS
 
-        self.config = AppConfig(**config_data)
+        # Load configuration
+        self.config = load_config(config_path, compiled_config_path)
 
         # Create cache directory
         cache_dir = Path(self.config.common.cache_directory)
         cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+
+        # Shared connection pool for all sources and notifiers
+        self.http_client = create_http_client(self.config.common.http)
+
+        # Version cache (migrates legacy per-tool files on first use)
+        self.cache_store = CacheStore(cache_dir)
+        self.cache_store.migrate_legacy_files([tool.name for tool in self.config.tools])
+
+        # Every detected release (see history), created on first use
+        self._history: ReleaseHistory | None = None
+        self._history_lock = threading.Lock()
 
-        # Initialize Discord notifier
-        self.discord_notifier = DiscordNotifier()
+        # ETag / Last-Modified validators from previous runs
+        self.http_cache = HttpCache(cache_dir / HTTP_CACHE_FILENAME)
+
+        # Bulk Homebrew index shared by all Homebrew sources (optional)
+        homebrew_config = self.config.common.homebrew
+        self.cask_index: HomebrewCaskIndex | None = None
+        if homebrew_config.bulk_index:
+            from devtools_release_notifier.sources.homebrew_index import (
+                HOMEBREW_INDEX_FILENAME,
+                HomebrewCaskIndex,
+            )
+
+            self.cask_index = HomebrewCaskIndex(
+                self.http_client,
+                homebrew_config.index_url,
+                local_path=cache_dir / HOMEBREW_INDEX_FILENAME,
+                index_file=homebrew_config.index_file,
+                metrics=self.metrics,
+            )
 
         # Initialize storage for new releases
         self.new_releases: list[ReleaseOutput] = []
 
-    def get_source(self, source_config) -> ReleaseSource:
+    @property
+    def history(self) -> ReleaseHistory:
+        """Every detected release, for history queries without refetching.
+
+        Created on first use, which may happen in any worker thread.
+        """
+        with self._history_lock:
+            if self._history is None:
+                from devtools_release_notifier.release_history import (
+                    HISTORY_DIRNAME,
+                    ReleaseHistory,
+                )
+
+                self._history = ReleaseHistory(self.cache_dir / HISTORY_DIRNAME)
+            return self._history
+
+    @functools.cached_property
+    def discord_notifier(self) -> DiscordNotifier:
+        """Discord notifier sharing the HTTP client, created on first send."""
+        from devtools_release_notifier.notifiers.discord import DiscordNotifier
+
+        return DiscordNotifier(client=self.http_client)
+
+    @functools.cached_property
+    def outbox(self) -> NotificationOutbox:
+        """Pending Discord deliveries, including failed ones from earlier runs."""
+        from devtools_release_notifier.outbox import OUTBOX_FILENAME, NotificationOutbox
+
+        return NotificationOutbox(self.cache_dir / OUTBOX_FILENAME)
+
+    def __enter__(self) -> UnifiedReleaseNotifier:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Exit context manager and release pooled connections."""
+        self.close()
+
+    def close(self):
+        """Close the shared HTTP client."""
+        self.http_client.close()
+
+    def get_source(self, source_config, cancel: threading.Event | None = None) -> ReleaseSource:
         """Get source instance based on configuration.
 
+        The source module is imported on first use.
+
         Args:
             source_config: Source configuration
+            cancel: Set once the source's fetch is no longer needed
 
         Returns:
             Source instance
@@ -58,32 +161,33 @@ def get_source(self, source_config) -> ReleaseSource:
         Raises:
             ValueError: If source type is unknown
         """
-        source_map: dict[str, type[ReleaseSource]] = {
-            "github_releases": GitHubReleaseSource,
-            "homebrew_cask": HomebrewCaskSource,
-            "github_commits": GitHubCommitsSource,
-            "changelog": ChangelogSource,
-        }
+        source_class = get_source_class(source_config.type)
 
-        source_class = source_map.get(source_config.type)
-        if not source_class:
-            raise ValueError(f"Unknown source type: {source_config.type}")
+        # Homebrew sources share the bulk index
+        extra: dict[str, Any] = {}
+        if source_config.type == "homebrew_cask":
+            extra["cask_index"] = self.cask_index
 
         # Convert Pydantic model to dict for source initialization
-        return source_class(source_config.model_dump())
+        return source_class(
+            source_config.model_dump(),
+            client=self.http_client,
+            http_cache=self.http_cache,
+            metrics=self.metrics,
+            cancel=cancel,
+            **extra,
+        )
 
     def get_cache_path(self, tool_name: str) -> Path:
-        """Get cache file path for a tool.
+        """Get legacy per-tool cache file path.
 
         Args:
             tool_name: Tool name
 
         Returns:
-            Path to cache file
+            Path to legacy cache file (only read for migration)
         """
-        # Convert tool name to snake_case for filename
-        filename = tool_name.lower().replace(" ", "_") + "_version.json"
-        return Path(self.config.common.cache_directory) / filename
+        return legacy_cache_path(self.config.common.cache_directory, tool_name)
 
     def load_cached_version(self, tool_name: str) -> CachedRelease | None:
         """Load cached version information.
@@ -94,130 +198,387 @@ def load_cached_version(self, tool_name: str) -> CachedRelease | None:
         Returns:
             Cached release information or None if not found
         """
-        cache_path = self.get_cache_path(tool_name)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with open(cache_path) as f:
-                data = json.load(f)
-            return CachedRelease(**data)
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Failed to parse cache for {tool_name}: Invalid JSON - {e}")
-            return None
-        except ValidationError as e:
-            print(f"⚠️  Failed to validate cache for {tool_name}: {e}")
-            return None
-        except OSError as e:
-            print(f"⚠️  Failed to read cache for {tool_name}: {e}")
-            return None
+        return self.cache_store.get(tool_name)
 
     def save_cached_version(self, tool_name: str, version: str):
-        """Save version to cache.
+        """Stage version in the cache.
+
+        The update is written to disk when the cache store is committed at
+        the end of the run.
 
         Args:
             tool_name: Tool name
             version: Version string
         """
-        cache_path = self.get_cache_path(tool_name)
-        cached = CachedRelease(version=version)
+        self.cache_store.set(tool_name, version)
 
-        try:
-            with open(cache_path, "w") as f:
-                json.dump(cached.model_dump(), f, indent=2)
-                f.write("\n")
-        except OSError as e:
-            print(f"⚠️  Failed to write cache for {tool_name}: {e}")
+    def check_interval(self, tool_config: ToolConfig) -> timedelta:
+        """Get the interval between checks of a tool.
 
-    def process_tool(self, tool_config, output_file: str | None, no_notify: bool):
-        """Process a single tool.
+        With adaptive polling the interval follows the tool's observed release
+        cadence; otherwise it is the configured check_interval_hours.
 
         Args:
             tool_config: Tool configuration
-            output_file: Output file path for new releases
-            no_notify: Skip Discord notification
+
+        Returns:
+            Check interval
         """
-        if not tool_config.enabled:
-            print(f"⏭️  {tool_config.name}: Skipped (disabled)")
-            return
+        adaptive = self.config.common.adaptive_polling
+        if adaptive.enabled:
+            from devtools_release_notifier.cadence import cadence_interval
+
+            cached = self.load_cached_version(tool_config.name)
+            return cadence_interval(
+                cached.release_times if cached else [],
+                timedelta(hours=adaptive.min_interval_hours),
+                timedelta(hours=adaptive.max_interval_hours),
+            )
+        return timedelta(
+            hours=tool_config.check_interval_hours or self.config.common.check_interval_hours
+        )
 
-        print(f"\n🔍 Processing {tool_config.name}...")
+    def next_check(self, tool_config: ToolConfig) -> datetime | None:
+        """Get the earliest time a tool is checked again without --force.
+
+        Args:
+            tool_config: Tool configuration
 
+        Returns:
+            Last successful check plus the check interval, or None if the tool
+            has never been checked
+        """
+        cached = self.load_cached_version(tool_config.name)
+        if cached is None or cached.checked_at is None:
+            return None
+        return cached.checked_at + self.check_interval(tool_config)
+
+    def fetch_from_source(
+        self,
+        source_config,
+        known_version: str | None = None,
+        cancel: threading.Event | None = None,
+    ) -> list[ReleaseInfo] | None:
+        """Fetch release information from a single source.
+
+        Args:
+            source_config: Source configuration
+            known_version: Cached version; sources that list past releases
+                also return the ones since this version
+            cancel: Set once the result is no longer needed
+
+        Returns:
+            Releases newest first (see :meth:`ReleaseSource.fetch_releases`),
+            or None if the source failed or was cancelled
+        """
+        print(f"  Trying {source_config.type} (priority {source_config.priority})...")
+        with self.metrics.labels(source=source_config.type):
+            try:
+                source = self.get_source(source_config, cancel)
+                results = source.fetch_releases(known_version)
+                if cancel is not None and cancel.is_set():
+                    # Decided without this source while it was fetching
+                    return None
+                if results:
+                    # Convert dicts to ReleaseInfo
+                    with self.metrics.timer("validate"):
+                        releases = [ReleaseInfo(**result) for result in results]
+                    print(f"  ✓ Got version {releases[0].version} from {source_config.type}")
+                    self.metrics.count("source_results", result="ok")
+                    return releases
+                self.metrics.count("source_results", result="empty")
+            except FetchCancelled:
+                return None
+            except Exception as e:
+                print(f"  ✗ Failed: {e}")
+                self.metrics.count("source_results", result="error")
+        return None
+
+    def fetch_release(
+        self, tool_config, known_version: str | None = None
+    ) -> list[ReleaseInfo] | None:
+        """Fetch release information, trying sources in priority order.
+
+        Args:
+            tool_config: Tool configuration
+            known_version: Cached version of the tool
+
+        Returns:
+            Releases newest first from the first successful source or None
+        """
         # Sort sources by priority
         sorted_sources = sorted(tool_config.sources, key=lambda s: s.priority)
 
         # Try sources in priority order
-        latest_info: ReleaseInfo | None = None
         for source_config in sorted_sources:
-            print(f"  Trying {source_config.type} (priority {source_config.priority})...")
-            try:
-                source = self.get_source(source_config)
-                result = source.fetch_latest_version()
-                if result:
-                    # Convert dict to ReleaseInfo
-                    latest_info = ReleaseInfo(**result)
-                    print(f"  ✓ Got version {latest_info.version} from {source_config.type}")
-                    break
-            except Exception as e:
-                print(f"  ✗ Failed: {e}")
-                continue
+            releases = self.fetch_from_source(source_config, known_version)
+            if releases:
+                return releases
+
+        return None
+
+    def fetch_release_race(
+        self, tool_config, known_version: str | None = None
+    ) -> list[ReleaseInfo] | None:
+        """Fetch latest release information from all sources concurrently.
+
+        Every source starts at once. Results are consumed in priority order, so
+        the highest-priority successful source wins as soon as all sources
+        above it have finished. Lower-priority fetches still pending at that
+        point never start. Ones already in flight are told to stop: a body
+        being streamed is abandoned at its next chunk, and nothing is
+        cached or counted as a result. A request still waiting for its
+        response headers cannot be interrupted; it runs until it completes
+        or times out, holding a pooled connection and delaying interpreter
+        exit until then.
 
-        if not latest_info:
-            print(f"⚠️  {tool_config.name}: No version information available")
-            return
+        Args:
+            tool_config: Tool configuration
+            known_version: Cached version of the tool
+
+        Returns:
+            Releases newest first from the highest-priority successful source or None
+        """
+        sorted_sources = sorted(tool_config.sources, key=lambda s: s.priority)
+
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(sorted_sources))
+        # Each worker runs in a copy of this context to keep bound metric labels
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, self.fetch_from_source, sc, known_version, cancel
+            )
+            for sc in sorted_sources
+        ]
+        try:
+            for future in futures:
+                releases = future.result()
+                if releases:
+                    return releases
+            return None
+        finally:
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def process_tool(self, tool_config, force: bool = False) -> ReleaseOutput | None:
+        """Process a single tool.
+
+        The cache is updated for a new release right away; its notification is
+        queued in the outbox by :meth:`run_async` and delivered after all tools
+        have been processed. A tool checked successfully less than
+        :meth:`check_interval` ago is skipped without any request.
+
+        Args:
+            tool_config: Tool configuration
+            force: Check the tool even if it was checked recently
+
+        Returns:
+            Release output if a new release was found, None otherwise
+        """
+        with self.metrics.labels(tool=tool_config.name):
+            return self._process_tool(tool_config, force)
+
+    def _process_tool(self, tool_config, force: bool) -> ReleaseOutput | None:
+        """Process a single tool with metric labels bound (see :meth:`process_tool`)."""
+        if not tool_config.enabled:
+            print(f"⏭️  {tool_config.name}: Skipped (disabled)")
+            return None
+
+        now = datetime.now(UTC)
+        if not force:
+            next_check = self.next_check(tool_config)
+            if next_check and next_check - CHECK_GRACE > now:
+                print(
+                    f"⏭️  {tool_config.name}: Checked recently, next check after "
+                    f"{next_check:%Y-%m-%d %H:%M} UTC"
+                )
+                self.metrics.count("skipped_fresh")
+                return None
+
+        print(f"\n🔍 Processing {tool_config.name}...")
 
         # Check cache
-        cached = self.load_cached_version(tool_config.name)
-        if cached and cached.version == latest_info.version:
+        with self.metrics.timer("cache"):
+            cached = self.load_cached_version(tool_config.name)
+        known_version = cached.version if cached else None
+
+        if self.config.common.source_strategy == "race":
+            releases = self.fetch_release_race(tool_config, known_version)
+        else:
+            releases = self.fetch_release(tool_config, known_version)
+        if not releases:
+            print(f"⚠️  {tool_config.name}: No version information available")
+            return None
+
+        latest_info = releases[0]
+        if latest_info.version == known_version:
             print(f"ℹ️  {tool_config.name}: Already up to date ({latest_info.version})")
-            return
+            self.cache_store.mark_checked(tool_config.name, now)
+            return None
 
-        print(f"🎉 {tool_config.name}: New version {latest_info.version}")
+        new_releases = missed_releases(releases, known_version)
+        if len(new_releases) > 1:
+            print(
+                f"🎉 {tool_config.name}: {len(new_releases)} new versions "
+                f"({new_releases[-1].version} … {latest_info.version})"
+            )
+        else:
+            print(f"🎉 {tool_config.name}: New version {latest_info.version}")
 
-        # Prepare output if requested
-        if output_file:
-            release_output = ReleaseOutput(
-                tool_name=tool_config.name,
-                version=latest_info.version,
-                content=latest_info.content,
-                url=latest_info.url,
-                color=tool_config.notification.color,
-                webhook_env=tool_config.notification.webhook_env,
+        from devtools_release_notifier.release_history import release_record
+
+        # Update cache (delivery is tracked separately by the outbox)
+        with self.metrics.timer("cache"):
+            self.save_cached_version(tool_config.name, latest_info.version)
+            try:
+                for release in reversed(new_releases):
+                    self.history.append(tool_config.name, release_record(release, now))
+            except OSError as e:
+                print(f"⚠️  {tool_config.name}: Failed to record release history: {e}")
+        self.cache_store.mark_checked(tool_config.name, now)
+        self.metrics.count("new_releases", value=len(new_releases))
+
+        return ReleaseOutput(
+            tool_name=tool_config.name,
+            version=latest_info.version,
+            content=catch_up_content(new_releases),
+            url=latest_info.url,
+            color=tool_config.notification.color,
+            webhook_env=tool_config.notification.webhook_env,
+        )
+
+    def _send(self, notifications: list[ReleaseNotification]) -> list[bool]:
+        """Send notifications one message each, or packed in batch mode.
+
+        Args:
+            notifications: Notifications to send
+
+        Returns:
+            Per-notification success flags
+        """
+        if self.config.common.discord.batch:
+            return self.discord_notifier.send_batch(notifications)
+        return [
+            self.discord_notifier.send(
+                webhook_url=n.webhook_url,
+                tool_name=n.tool_name,
+                version=n.version,
+                content=n.content,
+                url=n.url,
+                color=n.color,
             )
-            self.new_releases.append(release_output)
+            for n in notifications
+        ]
 
-        # Send Discord notification if not disabled
-        if not no_notify:
-            webhook_url = os.getenv(tool_config.notification.webhook_env)
-            if webhook_url:
-                self.discord_notifier.send(
-                    webhook_url=webhook_url,
-                    tool_name=tool_config.name,
-                    version=latest_info.version,
-                    content=latest_info.content,
-                    url=latest_info.url,
-                    color=tool_config.notification.color,
-                )
+    def deliver_notifications(self, releases: list[ReleaseOutput]):
+        """Queue new releases in the outbox and deliver everything due.
+
+        The outbox is saved before any request is made, so a failed or
+        interrupted delivery is retried on a later run. Notifications still
+        pending from earlier runs are delivered in the same pass.
+
+        Args:
+            releases: New releases of this run, in configuration order
+        """
+        for release in releases:
+            if os.getenv(release.webhook_env):
+                self.outbox.add(release)
             else:
-                print(
-                    f"⚠️  {tool_config.name}: Webhook URL not found "
-                    f"({tool_config.notification.webhook_env})"
+                print(f"⚠️  {release.tool_name}: Webhook URL not found ({release.webhook_env})")
+
+        if not len(self.outbox):
+            return
+
+        with self.metrics.timer("cache"):
+            self.outbox.save()
+
+        print(f"\n📨 Delivering {len(self.outbox)} pending notification(s)...")
+        with self.metrics.timer("notify"):
+            result = self.outbox.flush(self._send)
+        for entry in result.sent:
+            self.metrics.count("notifications", tool=entry.release.tool_name, result="sent")
+        for entry in result.failed:
+            self.metrics.count("notifications", tool=entry.release.tool_name, result="failed")
+            print(f"  ↻ {entry.release.tool_name}: Will retry on a later run")
+
+        with self.metrics.timer("cache"):
+            self.outbox.save()
+
+    async def run_async(
+        self,
+        output_file: str | None = None,
+        no_notify: bool = False,
+        max_concurrency: int | None = None,
+        tools: list[ToolConfig] | None = None,
+        force: bool = False,
+    ):
+        """Process tools concurrently.
+
+        Tools are processed in worker threads bounded by ``max_concurrency``.
+        Within a tool, sources are resolved according to
+        ``common.source_strategy``, and new releases are collected in
+        configuration order regardless of which tool finishes first.
+        Notifications are delivered through the outbox once all tools have been
+        processed.
+
+        Args:
+            output_file: Output file path for new releases
+            no_notify: Skip Discord notification
+            max_concurrency: Maximum number of tools processed at once
+                (defaults to common.max_concurrency)
+            tools: Tools to process (defaults to all configured tools)
+            force: Check tools even if they were checked recently
+        """
+        limit = self.config.common.max_concurrency if max_concurrency is None else max_concurrency
+        if tools is None:
+            tools = self.config.tools
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=limit) as executor:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        functools.partial(self.process_tool, tool_config, force),
+                    )
+                    for tool_config in tools
                 )
+            )
 
-        # Update cache
-        self.save_cached_version(tool_config.name, latest_info.version)
+        releases = [r for r in results if r is not None]
+        if output_file:
+            self.new_releases.extend(releases)
 
-    def run(self, output_file: str | None = None, no_notify: bool = False):
+        if not no_notify:
+            self.deliver_notifications(releases)
+
+        # Persist all cache updates of this run in one go
+        with self.metrics.timer("cache"):
+            self.cache_store.commit()
+            self.http_cache.save()
+            if self._history is not None:
+                self._history.compact()
+
+    def run(
+        self,
+        output_file: str | None = None,
+        no_notify: bool = False,
+        max_concurrency: int | None = None,
+        force: bool = False,
+    ):
         """Run notifier for all tools.
 
         Args:
             output_file: Output file path for new releases
             no_notify: Skip Discord notification
+            max_concurrency: Maximum number of tools processed at once
+                (defaults to common.max_concurrency)
+            force: Check tools even if they were checked recently
         """
         print("🚀 Starting devtools-release-notifier")
 
-        for tool_config in self.config.tools:
-            self.process_tool(tool_config, output_file, no_notify)
+        with self.metrics.timer("run"):
+            asyncio.run(self.run_async(output_file, no_notify, max_concurrency, force=force))
 
         # Write output file if requested and there are new releases
         if output_file and self.new_releases:
@@ -230,13 +591,279 @@ def run(self, output_file: str | None = None, no_notify: bool = False):
 
         print("\n✅ Completed")
 
+    async def serve_async(
+        self,
+        no_notify: bool = False,
+        max_concurrency: int | None = None,
+        stop: asyncio.Event | None = None,
+    ):
+        """Check tools on their own intervals until stopped.
+
+        The configuration, HTTP connection pool and caches stay in memory
+        between rounds. Every round processes the tools that are due
+        concurrently (see :meth:`run_async`), which also retries pending
+        notifications, then sleeps until the next tool is due.
+
+        Args:
+            no_notify: Skip Discord notification
+            max_concurrency: Maximum number of tools processed at once
+                (defaults to common.max_concurrency)
+            stop: Event ending the loop once set (SIGINT and SIGTERM set it
+                when omitted)
+        """
+        from devtools_release_notifier.scheduler import ToolScheduler
+
+        common = self.config.common
+        # Tools checked recently (e.g. by an earlier process) are not due yet
+        scheduler = ToolScheduler(
+            self.config.tools,
+            self.check_interval,
+            common.check_jitter,
+            datetime.now(UTC),
+            first_check=self.next_check,
+        )
+        if not len(scheduler):
+            print("⚠️  No enabled tools to schedule")
+            return
+
+        if stop is None:
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                with contextlib.suppress(NotImplementedError):
+                    loop.add_signal_handler(signum, stop.set)
+
+        while not stop.is_set():
+            due = scheduler.due(datetime.now(UTC))
+            if due:
+                print(f"\n🔄 Checking {len(due)} due tool(s)...")
+                with self.metrics.timer("run"):
+                    # The scheduler already decided which tools are due
+                    await self.run_async(
+                        no_notify=no_notify, max_concurrency=max_concurrency, tools=due, force=True
+                    )
+                scheduler.reschedule(due, datetime.now(UTC))
+
+            next_check = scheduler.next_check()
+            assert next_check is not None
+            delay = max((next_check - datetime.now(UTC)).total_seconds(), 0)
+            print(f"🕒 Next check at {next_check:%Y-%m-%d %H:%M:%S} UTC")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+
+        print("\n✅ Stopped")
+
+    def serve(self, no_notify: bool = False, max_concurrency: int | None = None):
+        """Run notifier as a long-running scheduler until interrupted.
+
+        Args:
+            no_notify: Skip Discord notification
+            max_concurrency: Maximum number of tools processed at once
+                (defaults to common.max_concurrency)
+        """
+        print("🚀 Serving devtools-release-notifier")
+        asyncio.run(self.serve_async(no_notify, max_concurrency))
+
+
+def missed_releases(releases: list[ReleaseInfo], known_version: str | None) -> list[ReleaseInfo]:
+    """Get the releases published since the known version.
+
+    If the source did not reach the known version (it was not listed, or more
+    releases than a source reads were published), only the newest release is
+    reported, since the others cannot be told apart from old ones.
+
+    Args:
+        releases: Releases newest first, as returned by a source
+        known_version: Cached version of the tool
+
+    Returns:
+        New releases, newest first
+    """
+    if known_version is not None and releases[-1].version == known_version:
+        return releases[:-1]
+    return releases[:1]
+
+
+def _share_budget(lengths: list[int], budget: int) -> list[int]:
+    """Split a character budget fairly between texts.
+
+    Texts shorter than an equal share keep their full length, and what they
+    leave over is shared among the longer ones.
+
+    Args:
+        lengths: Text lengths
+        budget: Characters available in total
+
+    Returns:
+        Characters allowed for each text, in input order
+    """
+    limits = [0] * len(lengths)
+    remaining = max(budget, 0)
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    for position, index in enumerate(order):
+        limits[index] = min(lengths[index], remaining // (len(order) - position))
+        remaining -= limits[index]
+    return limits
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Cut text to a length, marking the cut with an ellipsis.
+
+    Args:
+        text: Text to shorten
+        limit: Maximum length
+
+    Returns:
+        Text as is if it fits, otherwise its start and "…" within limit
+    """
+    if len(text) <= limit:
+        return text
+    return text[: max(limit - 1, 0)] + "…" if limit else ""
+
+
+def catch_up_content(releases: list[ReleaseInfo], max_length: int = CONTENT_MAX_LENGTH) -> str:
+    """Combine the notes of new releases into one notification.
+
+    Notes are shortened before they are joined, so every release stays
+    visible within the notification's length limit instead of the oldest
+    ones being cut off.
+
+    Args:
+        releases: New releases, newest first
+        max_length: Length limit of the combined notes
+
+    Returns:
+        Notes of a single release as is, otherwise each release's notes
+        (shortened to a fair share of max_length) under a version heading
+    """
+    if len(releases) == 1:
+        return releases[0].content
+
+    headings = [f"### {release.version}\n\n" for release in releases]
+    separators = len(CATCH_UP_SEPARATOR) * (len(releases) - 1)
+    limits = _share_budget(
+        [len(release.content) for release in releases],
+        max_length - sum(map(len, headings)) - separators,
+    )
+    return CATCH_UP_SEPARATOR.join(
+        heading + _shorten(release.content, limit)
+        for heading, release, limit in zip(headings, releases, limits, strict=True)
+    )
+
+
+def lazy_modules(
+    config_path: str,
+    compiled_config_path: str | Path | None = None,
+    command: str = "run",
+    notify: bool = True,
+) -> list[str]:
+    """Get the modules a command and configuration make the notifier import on demand.
+
+    Modules only needed once a release is found (release history, Discord
+    notifier) are not included.
+
+    Args:
+        config_path: Path to configuration file
+        compiled_config_path: Compiled configuration cache (disabled if omitted)
+        command: "run" or "serve"
+        notify: Whether notifications are delivered (no --no-notify)
+
+    Returns:
+        Source modules of enabled tools, plus the bulk Homebrew index, adaptive
+        polling, outbox and serve scheduler when in use
+    """
+    config = load_config(config_path, compiled_config_path)
+
+    modules = sorted(
+        {
+            SOURCE_CLASSES[source.type][0]
+            for tool in config.tools
+            if tool.enabled
+            for source in tool.sources
+        }
+    )
+    if config.common.homebrew.bulk_index:
+        modules.append("devtools_release_notifier.sources.homebrew_index")
+    if config.common.adaptive_polling.enabled:
+        modules.append("devtools_release_notifier.cadence")
+    if notify:
+        modules.append("devtools_release_notifier.outbox")
+    if command == "serve":
+        modules.append("devtools_release_notifier.scheduler")
+    return modules
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line value as a positive integer.
+
+    Args:
+        value: Argument value
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
 
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Development tools release notifier")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve"],
+        default="run",
+        help="'run' checks all tools once (default), 'serve' keeps checking them "
+        "on their check_interval_hours until interrupted",
+    )
     parser.add_argument("--output", type=str, help="Output new releases to JSON file")
     parser.add_argument("--no-notify", action="store_true", help="Skip Discord notification")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Check every tool, including ones checked within their check interval",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        help="Maximum number of tools processed concurrently (overrides config)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        help="Write per-phase timings and counters to this file at the end of the run",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=["jsonl", "openmetrics"],
+        default="jsonl",
+        help="Format of --metrics-file (default: jsonl)",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Report import time per module for each entry point and exit",
+    )
+    parser.add_argument(
+        "--no-compiled-config",
+        action="store_true",
+        help=(
+            "Parse config.yml without the compiled configuration cache "
+            f"(cache/{COMPILED_CONFIG_FILENAME}, regardless of common.cache_directory)"
+        ),
+    )
     args = parser.parse_args()
+    if args.command == "serve" and args.output:
+        parser.error("--output cannot be used with serve")
 
     # Check config file exists
     config_path = "config.yml"
@@ -244,9 +871,38 @@ def main():
         print(f"✗ Configuration file not found: {config_path}")
         sys.exit(1)
 
+    # Validated config.yml, reused while the file and package version are unchanged.
+    # It is read before the configuration, so common.cache_directory cannot move it.
+    compiled_config_path = None if args.no_compiled_config else f"cache/{COMPILED_CONFIG_FILENAME}"
+
+    if args.startup_profile:
+        from devtools_release_notifier.startup import print_startup_profile
+
+        print_startup_profile(
+            lazy_modules(config_path, compiled_config_path, args.command, not args.no_notify)
+        )
+        return
+
+    # Metrics stay disabled (and nearly free) unless an output file is requested
+    metrics = Metrics(enabled=bool(args.metrics_file))
+
     try:
-        notifier = UnifiedReleaseNotifier(config_path)
-        notifier.run(output_file=args.output, no_notify=args.no_notify)
+        with UnifiedReleaseNotifier(
+            config_path, metrics=metrics, compiled_config_path=compiled_config_path
+        ) as notifier:
+            if args.command == "serve":
+                notifier.serve(no_notify=args.no_notify, max_concurrency=args.concurrency)
+            else:
+                notifier.run(
+                    output_file=args.output,
+                    no_notify=args.no_notify,
+                    max_concurrency=args.concurrency,
+                    force=args.force,
+                )
+        if args.metrics_file:
+            metrics_format: MetricsFormat = args.metrics_format
+            metrics.write(args.metrics_file, metrics_format)
+            print(f"✓ Wrote metrics to {args.metrics_file}")
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
         sys.exit(130)
@@ -2,12 +2,51 @@
 
 import httpx
 
-from devtools_release_notifier.models.discord import DiscordWebhookPayload
+from devtools_release_notifier.http_client import create_http_client
+from devtools_release_notifier.models.discord import DiscordWebhookPayload, ReleaseNotification
+from devtools_release_notifier.notifiers.rate_limit import WebhookRateLimiter
 
 
 class DiscordNotifier:
     """Handle Discord webhook notifications."""
 
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        rate_limiter: WebhookRateLimiter | None = None,
+    ):
+        """Initialize notifier.
+
+        Args:
+            client: Shared HTTP client (a private client is created if omitted)
+            rate_limiter: Webhook rate limiter (a private limiter is created if omitted)
+        """
+        self.client = client if client is not None else create_http_client()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else WebhookRateLimiter()
+
+    def _post(self, webhook_url: str, payload: DiscordWebhookPayload, label: str) -> bool:
+        """Post a payload to a webhook.
+
+        Args:
+            webhook_url: Discord webhook URL
+            payload: Webhook payload
+            label: Tool name(s) used in log messages
+
+        Returns:
+            True if the payload was accepted, False otherwise
+        """
+        try:
+            response = self.rate_limiter.post(self.client, webhook_url, payload.model_dump())
+            response.raise_for_status()
+            print(f"✓ Discord notification sent for {label}")
+            return True
+        except httpx.HTTPError as e:
+            print(f"✗ Discord notification failed for {label}: {e}")
+            return False
+        except Exception as e:
+            print(f"✗ Discord notification failed for {label}: {e}")
+            return False
+
     def send(
         self,
         webhook_url: str,
@@ -38,18 +77,40 @@ def send(
                 url=url,
                 color=color,
             )
-
-            response = httpx.post(
-                webhook_url,
-                json=payload.model_dump(),
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            print(f"✓ Discord notification sent for {tool_name}")
-            return True
-        except httpx.HTTPError as e:
-            print(f"✗ Discord notification failed for {tool_name}: {e}")
-            return False
         except Exception as e:
             print(f"✗ Discord notification failed for {tool_name}: {e}")
             return False
+
+        return self._post(webhook_url, payload, tool_name)
+
+    def send_batch(self, notifications: list[ReleaseNotification]) -> list[bool]:
+        """Send release notifications, packing them into as few messages as possible.
+
+        Notifications are grouped by webhook URL (in first-seen order) and each
+        group is packed into messages of up to 10 embeds within Discord's size
+        limits.
+
+        Args:
+            notifications: Notifications to send
+
+        Returns:
+            Per-notification success flags, in input order
+        """
+        results = [False] * len(notifications)
+
+        by_webhook: dict[str, list[int]] = {}
+        for index, notification in enumerate(notifications):
+            by_webhook.setdefault(notification.webhook_url, []).append(index)
+
+        for webhook_url, indices in by_webhook.items():
+            embeds = [notifications[i].to_embed() for i in indices]
+            offset = 0
+            for payload in DiscordWebhookPayload.pack(embeds):
+                batch = indices[offset : offset + len(payload.embeds)]
+                offset += len(payload.embeds)
+                label = ", ".join(notifications[i].tool_name for i in batch)
+                if self._post(webhook_url, payload, label):
+                    for i in batch:
+                        results[i] = True
+
+        return results
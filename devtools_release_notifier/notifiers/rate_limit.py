@@ -0,0 +1,177 @@
+"""Rate limiting for Discord webhook requests.
+
+Discord reports per-webhook limits in ``X-RateLimit-*`` response headers and
+answers requests over the limit with 429 and a ``Retry-After`` delay. The
+limiter learns each webhook's bucket from those headers, holds back requests
+until the bucket resets, and retries rate-limited requests after the
+indicated delay. It is thread-safe, so concurrent tool workers sharing one
+webhook are queued instead of failing.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_MAX_RETRIES = 3
+
+# Longer delays are not waited for; the request is reported as failed instead
+# (both for Retry-After and for a bucket that resets later)
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+@dataclass
+class _Bucket:
+    """Rate limit state of one webhook."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float = 0.0
+
+
+def _header_float(response: httpx.Response, name: str) -> float | None:
+    """Read a numeric header, ignoring missing or malformed values."""
+    try:
+        return float(response.headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def retry_after_seconds(response: httpx.Response) -> float:
+    """Get the delay requested by a 429 response.
+
+    Args:
+        response: Rate-limited response
+
+    Returns:
+        Delay in seconds from the Retry-After header or the JSON body
+        (defaults to 1 second)
+    """
+    delay = _header_float(response, "Retry-After")
+    if delay is None:
+        try:
+            delay = float(response.json().get("retry_after"))
+        except (ValueError, TypeError, AttributeError):
+            delay = None
+    return max(delay if delay is not None else 1.0, 0.0)
+
+
+class WebhookRateLimiter:
+    """Per-webhook rate limiter learning its limits from response headers."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_retries: Maximum number of retries after 429 responses
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _reserve(self, webhook_url: str) -> float:
+        """Take a request slot from the bucket.
+
+        Args:
+            webhook_url: Discord webhook URL
+
+        Returns:
+            Seconds to wait before trying again (0 if a slot was taken)
+        """
+        with self._lock:
+            bucket = self._buckets.setdefault(webhook_url, _Bucket())
+            now = self._clock()
+            if bucket.reset_at and now >= bucket.reset_at:
+                # Bucket has reset; assume the full limit until told otherwise
+                bucket.remaining = bucket.limit
+                bucket.reset_at = 0.0
+            if bucket.remaining is None:
+                return 0.0
+            if bucket.remaining > 0:
+                bucket.remaining -= 1
+                return 0.0
+            return max(bucket.reset_at - now, 0.0) if bucket.reset_at else 0.0
+
+    def acquire(self, webhook_url: str) -> float:
+        """Block until a request to the webhook fits its rate limit.
+
+        Args:
+            webhook_url: Discord webhook URL
+
+        Returns:
+            0 once a slot was taken, or the remaining delay without waiting
+            if it exceeds MAX_RETRY_AFTER_SECONDS
+        """
+        while (delay := self._reserve(webhook_url)) > 0:
+            if delay > MAX_RETRY_AFTER_SECONDS:
+                return delay
+            self._sleep(delay)
+        return 0.0
+
+    def update(self, webhook_url: str, response: httpx.Response):
+        """Learn the webhook's rate limit state from a response.
+
+        Args:
+            webhook_url: Discord webhook URL
+            response: Webhook response
+        """
+        limit = _header_float(response, "X-RateLimit-Limit")
+        remaining = _header_float(response, "X-RateLimit-Remaining")
+        reset_after = _header_float(response, "X-RateLimit-Reset-After")
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            remaining = 0
+            reset_after = retry_after_seconds(response)
+
+        with self._lock:
+            bucket = self._buckets.setdefault(webhook_url, _Bucket())
+            if limit is not None:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                bucket.remaining = int(remaining)
+            if reset_after is not None:
+                bucket.reset_at = self._clock() + reset_after
+
+    def post(self, client: httpx.Client, webhook_url: str, payload: dict) -> httpx.Response:
+        """Post a payload within the webhook's rate limit, retrying 429 responses.
+
+        Args:
+            client: HTTP client
+            webhook_url: Discord webhook URL
+            payload: JSON payload
+
+        Returns:
+            Final response (still 429 if retries were exhausted or the
+            requested delay exceeds MAX_RETRY_AFTER_SECONDS; a webhook still
+            limited for longer is answered with 429 without a request)
+        """
+        attempt = 0
+        while True:
+            if delay := self.acquire(webhook_url):
+                return httpx.Response(
+                    httpx.codes.TOO_MANY_REQUESTS,
+                    headers={"Retry-After": f"{delay:.3f}"},
+                    request=httpx.Request("POST", webhook_url),
+                )
+            response = client.post(webhook_url, json=payload)
+            self.update(webhook_url, response)
+
+            if response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+                return response
+
+            delay = retry_after_seconds(response)
+            if attempt >= self.max_retries or delay > MAX_RETRY_AFTER_SECONDS:
+                return response
+
+            attempt += 1
+            print(f"  ⏳ Rate limited by Discord, retrying in {delay:.1f}s")
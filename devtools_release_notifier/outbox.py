@@ -0,0 +1,199 @@
+"""Durable outbox for Discord notifications."""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.cache_store import write_json_atomic
+from devtools_release_notifier.models.discord import ReleaseNotification
+from devtools_release_notifier.models.output import OutboxEntry, ReleaseOutput
+
+OUTBOX_FILENAME = "outbox.json"
+
+# Failed deliveries are retried with exponential backoff, then dropped
+MAX_ATTEMPTS = 8
+BACKOFF_BASE = timedelta(minutes=5)
+BACKOFF_MAX = timedelta(hours=24)
+
+# Sends notifications and returns per-notification success flags
+Sender = Callable[[list[ReleaseNotification]], list[bool]]
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Get the delay before retrying a delivery.
+
+    Args:
+        attempts: Number of failed attempts so far (at least 1)
+
+    Returns:
+        Delay doubling with every attempt, capped at BACKOFF_MAX
+    """
+    # Bound the exponent so large attempt counts cannot overflow timedelta
+    return min(BACKOFF_BASE * 2 ** min(attempts - 1, 16), BACKOFF_MAX)
+
+
+@dataclass
+class FlushResult:
+    """Outcome of one outbox flush.
+
+    Attributes:
+        sent: Entries delivered (removed from the outbox)
+        failed: Entries that failed (kept for retry unless attempts ran out)
+        skipped: Entries without a configured webhook (removed from the outbox)
+    """
+
+    sent: list[OutboxEntry] = field(default_factory=list)
+    failed: list[OutboxEntry] = field(default_factory=list)
+    skipped: list[OutboxEntry] = field(default_factory=list)
+
+
+class NotificationOutbox:
+    """Pending Discord deliveries persisted under the cache directory.
+
+    Releases are added before any delivery is attempted and the outbox is
+    saved, so a failed or interrupted delivery is retried on a later run
+    instead of being lost. Delivered entries are removed; failed ones are
+    kept with exponential backoff.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize outbox and load pending entries.
+
+        Args:
+            path: Outbox file path
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, OutboxEntry] = self._load()
+
+    def __len__(self) -> int:
+        """Get the number of pending entries."""
+        return len(self._entries)
+
+    def _load(self) -> dict[str, OutboxEntry]:
+        """Load entries from disk.
+
+        Returns:
+            Mapping of entry key to entry (empty if missing or invalid)
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            entries = [OutboxEntry(**item) for item in data]
+            return {entry.key: entry for entry in entries}
+        except json.JSONDecodeError as e:
+            print(f"⚠️  Failed to parse outbox: Invalid JSON - {e}")
+        except (ValidationError, TypeError) as e:
+            print(f"⚠️  Failed to validate outbox: {e}")
+        except OSError as e:
+            print(f"⚠️  Failed to read outbox: {e}")
+        return {}
+
+    def add(self, release: ReleaseOutput):
+        """Add a release to deliver, replacing a pending entry for the same version.
+
+        Args:
+            release: Release to notify
+        """
+        entry = OutboxEntry(release=release)
+        with self._lock:
+            self._entries[entry.key] = entry
+
+    def due(self, now: datetime | None = None) -> list[OutboxEntry]:
+        """Get entries whose next attempt time has come.
+
+        Args:
+            now: Current time (defaults to now)
+
+        Returns:
+            Due entries in insertion order
+        """
+        now = now or datetime.now(UTC)
+        with self._lock:
+            return [e for e in self._entries.values() if e.next_attempt_at <= now]
+
+    def save(self):
+        """Write pending entries to disk atomically (removing the file when empty)."""
+        with self._lock:
+            data = [entry.model_dump() for entry in self._entries.values()]
+
+        try:
+            if data:
+                write_json_atomic(self.path, data)
+            else:
+                self.path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"⚠️  Failed to write outbox: {e}")
+
+    def _mark_failed(self, entry: OutboxEntry, error: str, now: datetime):
+        """Record a failed attempt, dropping the entry once attempts run out."""
+        entry.attempts += 1
+        entry.last_error = error
+        if entry.attempts >= MAX_ATTEMPTS:
+            print(
+                f"✗ Giving up on notification for {entry.release.tool_name} "
+                f"after {entry.attempts} attempts"
+            )
+            with self._lock:
+                self._entries.pop(entry.key, None)
+            return
+        entry.next_attempt_at = now + backoff_delay(entry.attempts)
+
+    def flush(self, send: Sender, now: datetime | None = None) -> FlushResult:
+        """Deliver all due entries in one pass.
+
+        Webhook URLs are resolved from the environment at delivery time. All
+        due entries are handed to ``send`` at once, so a batching sender can
+        pack them into as few messages as possible.
+
+        Args:
+            send: Sender returning per-notification success flags
+            now: Current time (defaults to now)
+
+        Returns:
+            Sent, failed and skipped entries
+        """
+        now = now or datetime.now(UTC)
+        result = FlushResult()
+
+        deliverable: list[tuple[OutboxEntry, ReleaseNotification]] = []
+        for entry in self.due(now):
+            release = entry.release
+            webhook_url = os.getenv(release.webhook_env)
+            if not webhook_url:
+                print(f"⚠️  Webhook URL not found for {release.tool_name} ({release.webhook_env})")
+                result.skipped.append(entry)
+                continue
+            notification = ReleaseNotification(
+                webhook_url=webhook_url,
+                tool_name=release.tool_name,
+                version=release.version,
+                content=release.content,
+                url=release.url,
+                color=release.color,
+            )
+            deliverable.append((entry, notification))
+
+        sent_flags = send([notification for _, notification in deliverable]) if deliverable else []
+
+        for (entry, _), sent in zip(deliverable, sent_flags, strict=True):
+            if sent:
+                result.sent.append(entry)
+            else:
+                result.failed.append(entry)
+                self._mark_failed(entry, "Discord delivery failed", now)
+
+        with self._lock:
+            for entry in result.sent + result.skipped:
+                self._entries.pop(entry.key, None)
+
+        return result
@@ -0,0 +1,260 @@
+"""Append-only release history per tool.
+
+Every release the notifier detects is appended as one JSON line to
+``history/<tool>.jsonl`` under the cache directory, with its version,
+source, publication and detection times and a hash of its notes. History
+queries therefore never need to fetch sources or parse the Markdown logs.
+
+A tool's file is read once per process and indexed in memory (records
+ordered by detection time plus a version lookup). A version is recorded
+once: appending a version that is already known is a no-op, so duplicate
+lines can only come from concurrent writers or interrupted appends.
+:meth:`ReleaseHistory.compact` rewrites files holding such waste.
+"""
+
+import bisect
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.models.release import ReleaseInfo, ReleaseRecord
+
+HISTORY_DIRNAME = "history"
+
+# Compact a file once it holds this many unusable lines (and at least as
+# many as usable records)
+COMPACT_MIN_WASTE = 8
+
+
+def history_filename(tool_name: str) -> str:
+    """Get the history file name of a tool.
+
+    Args:
+        tool_name: Tool name
+
+    Returns:
+        File name derived from the tool name (e.g. ``claude_code.jsonl``)
+    """
+    return re.sub(r"[^a-z0-9]+", "_", tool_name.lower()).strip("_") + ".jsonl"
+
+
+def release_record(info: ReleaseInfo, detected: datetime) -> ReleaseRecord:
+    """Build a history record for a detected release.
+
+    Args:
+        info: Release information from the source
+        detected: Detection time
+
+    Returns:
+        History record
+    """
+    return ReleaseRecord(
+        version=info.version,
+        source=info.source,
+        published=info.published,
+        detected=detected,
+        content_hash=hashlib.sha256(info.content.encode()).hexdigest(),
+    )
+
+
+@dataclass
+class _ToolIndex:
+    """In-memory index of one tool's history file.
+
+    Attributes:
+        records: Records ordered by detection time
+        detected: Detection times of the records (for bisection)
+        versions: Records by version
+        wasted_lines: Duplicate or invalid lines in the file
+    """
+
+    records: list[ReleaseRecord] = field(default_factory=list)
+    detected: list[datetime] = field(default_factory=list)
+    versions: dict[str, ReleaseRecord] = field(default_factory=dict)
+    wasted_lines: int = 0
+
+    def add(self, record: ReleaseRecord) -> bool:
+        """Index a record unless its version is known.
+
+        Returns:
+            True if the record was added
+        """
+        if record.version in self.versions:
+            return False
+        position = bisect.bisect_right(self.detected, record.detected)
+        self.records.insert(position, record)
+        self.detected.insert(position, record.detected)
+        self.versions[record.version] = record
+        return True
+
+    def needs_compaction(self) -> bool:
+        """Check whether the file holds enough waste to be rewritten."""
+        return self.wasted_lines >= max(COMPACT_MIN_WASTE, len(self.records))
+
+
+class ReleaseHistory:
+    """Release history of all tools, one append-only JSON lines file each.
+
+    Safe to use from worker threads.
+    """
+
+    def __init__(self, directory: str | Path):
+        """Initialize history.
+
+        Args:
+            directory: Directory holding the history files
+        """
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._indexes: dict[str, _ToolIndex] = {}
+
+    def path(self, tool_name: str) -> Path:
+        """Get the history file path of a tool.
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            Path to the tool's JSON lines file
+        """
+        return self.directory / history_filename(tool_name)
+
+    def _index(self, tool_name: str) -> _ToolIndex:
+        """Get the index of a tool, loading its file on first use.
+
+        Must be called with the lock held.
+        """
+        index = self._indexes.get(tool_name)
+        if index is not None:
+            return index
+
+        index = _ToolIndex()
+        try:
+            with open(self.path(tool_name), encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        added = index.add(ReleaseRecord.model_validate_json(line))
+                    except ValidationError:
+                        # Typically a line cut short by an interrupted append
+                        added = False
+                    if not added:
+                        index.wasted_lines += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️  Failed to read release history of {tool_name}: {e}")
+        self._indexes[tool_name] = index
+        return index
+
+    def append(self, tool_name: str, record: ReleaseRecord) -> bool:
+        """Record a release of a tool.
+
+        Args:
+            tool_name: Tool name
+            record: Release record
+
+        Returns:
+            True if the release was recorded, False if its version was known
+
+        Raises:
+            OSError: If the history file cannot be written
+        """
+        with self._lock:
+            index = self._index(tool_name)
+            if record.version in index.versions:
+                return False
+            self.directory.mkdir(parents=True, exist_ok=True)
+            line = (record.model_dump_json() + "\n").encode("utf-8")
+            with open(self.path(tool_name), "a+b") as f:
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a line cut short by an interrupted append
+                        line = b"\n" + line
+                f.write(line)
+            index.add(record)
+            return True
+
+    def latest(self, tool_name: str, count: int = 1) -> list[ReleaseRecord]:
+        """Get the most recently detected releases of a tool.
+
+        Args:
+            tool_name: Tool name
+            count: Maximum number of releases
+
+        Returns:
+            Releases, newest first
+        """
+        if count <= 0:
+            return []
+        with self._lock:
+            records = self._index(tool_name).records
+            return records[: -count - 1 : -1]
+
+    def since(self, tool_name: str, since: datetime) -> list[ReleaseRecord]:
+        """Get the releases of a tool detected at or after a time.
+
+        Args:
+            tool_name: Tool name
+            since: Earliest detection time (timezone-aware)
+
+        Returns:
+            Releases, newest first
+        """
+        with self._lock:
+            index = self._index(tool_name)
+            start = bisect.bisect_left(index.detected, since)
+            return index.records[start:][::-1]
+
+    def get(self, tool_name: str, version: str) -> ReleaseRecord | None:
+        """Get the record of a tool version.
+
+        Args:
+            tool_name: Tool name
+            version: Version string
+
+        Returns:
+            Release record, or None if the version was never recorded
+        """
+        with self._lock:
+            return self._index(tool_name).versions.get(version)
+
+    def compact(self, force: bool = False) -> list[str]:
+        """Rewrite the loaded history files that hold duplicate or invalid lines.
+
+        Each file is replaced atomically by its records ordered by detection
+        time. Only files loaded by this process are considered.
+
+        Args:
+            force: Rewrite every loaded file holding any waste
+
+        Returns:
+            Names of the compacted tools
+        """
+        compacted: list[str] = []
+        with self._lock:
+            for tool_name, index in self._indexes.items():
+                if not index.wasted_lines or not (force or index.needs_compaction()):
+                    continue
+                path = self.path(tool_name)
+                tmp_path = path.with_name(path.name + ".tmp")
+                try:
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        f.writelines(record.model_dump_json() + "\n" for record in index.records)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, path)
+                except OSError as e:
+                    print(f"⚠️  Failed to compact release history of {tool_name}: {e}")
+                    continue
+                index.wasted_lines = 0
+                compacted.append(tool_name)
+        return compacted
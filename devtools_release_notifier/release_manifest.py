@@ -0,0 +1,261 @@
+"""Manifest of the Markdown release logs.
+
+The manifest (``_manifest.jsonl`` next to the tool directories) holds one JSON
+line per release log with its date, tool, path and title. Saving a log
+appends a single line, and the releases index is rendered from the manifest
+without opening any log. The manifest is rebuilt from the Markdown files only
+when it is missing or stale.
+
+A rebuild lists file names only and walks them newest-first, reading just the
+frontmatter of the logs it keeps until the requested number of entries is
+found. Its cost therefore depends on that number, not on the archive size
+(apart from listing the directories). The rebuilt manifest holds only those
+newest entries; older logs can never be rendered again, since new logs are
+always newer.
+"""
+
+import heapq
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from devtools_release_notifier.models.output import ReleaseLogEntry
+
+MANIFEST_FILENAME = "_manifest.jsonl"
+
+RELEASE_FILE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})\.md")
+TITLE_PATTERN = re.compile(r'^title:\s*"(.+)"')
+
+# Frontmatter lines read before giving up on finding the title
+FRONTMATTER_MAX_LINES = 20
+
+# (date, path) of a release log, ordered like the index
+ReleaseFile = tuple[str, str]
+
+
+def extract_title(file_path: Path) -> str | None:
+    """Extract title from Markdown frontmatter.
+
+    Only the frontmatter at the top of the file is read.
+
+    Args:
+        file_path: Path to Markdown file
+
+    Returns:
+        Title string or None if not found
+    """
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            if f.readline().strip() != "---":
+                return None
+            for _, line in zip(range(FRONTMATTER_MAX_LINES), f, strict=False):
+                if line.strip() == "---":
+                    break
+                match = TITLE_PATTERN.match(line)
+                if match:
+                    return match.group(1)
+        return None
+    except (OSError, ValueError):
+        return None
+
+
+def tool_directories(base_dir: Path) -> list[str]:
+    """List tool directory names under the releases directory.
+
+    Args:
+        base_dir: Releases directory
+
+    Returns:
+        Sorted directory names, excluding names starting with "_"
+    """
+    with os.scandir(base_dir) as it:
+        return sorted(
+            entry.name for entry in it if entry.is_dir() and not entry.name.startswith("_")
+        )
+
+
+def release_files(base_dir: Path, tool: str) -> list[ReleaseFile]:
+    """List the release logs (YYYY-MM-DD.md) of a tool by name only.
+
+    Args:
+        base_dir: Releases directory
+        tool: Tool directory name
+
+    Returns:
+        (date, path) pairs, newest first
+    """
+    files: list[ReleaseFile] = []
+    with os.scandir(base_dir / tool) as it:
+        for entry in it:
+            date_match = RELEASE_FILE_PATTERN.fullmatch(entry.name)
+            if date_match and entry.is_file():
+                files.append((date_match.group(1), f"{tool}/{entry.name}"))
+    files.sort(reverse=True)
+    return files
+
+
+def append_entry(base_dir: Path, entry: ReleaseLogEntry):
+    """Record a saved release log in the manifest.
+
+    Nothing is written if the manifest does not exist yet; it is then built
+    from disk, including this log, the next time it is read.
+
+    Args:
+        base_dir: Releases directory
+        entry: Saved release log
+
+    Raises:
+        OSError: If the manifest cannot be written
+    """
+    manifest_path = base_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return
+    with open(manifest_path, "a", encoding="utf-8") as f:
+        f.write(entry.model_dump_json() + "\n")
+
+
+def load_entries(base_dir: Path) -> list[ReleaseLogEntry] | None:
+    """Load the manifest.
+
+    A log saved more than once (same tool and date) keeps its last line.
+
+    Args:
+        base_dir: Releases directory
+
+    Returns:
+        Manifest entries, or None if the manifest is missing or invalid
+    """
+    manifest_path = base_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            entries = {}
+            for line in f:
+                if line.strip():
+                    entry = ReleaseLogEntry.model_validate_json(line)
+                    entries[entry.path] = entry
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, ValidationError) as e:
+        print(f"⚠️  Ignoring invalid releases manifest: {e}")
+        return None
+    return list(entries.values())
+
+
+def _newest_first(base_dir: Path) -> Iterator[ReleaseFile]:
+    """Walk all release logs newest-first across tool directories.
+
+    Yields:
+        (date, path) pairs ordered by date and path (descending)
+    """
+    per_tool = [release_files(base_dir, tool) for tool in tool_directories(base_dir)]
+    return heapq.merge(*per_tool, reverse=True)
+
+
+def scan_entries(base_dir: Path, max_entries: int) -> list[ReleaseLogEntry]:
+    """Collect entries for the newest release logs on disk.
+
+    Logs without a frontmatter title are skipped.
+
+    Args:
+        base_dir: Releases directory
+        max_entries: Number of entries to collect
+
+    Returns:
+        Up to max_entries entries, newest first
+    """
+    entries: list[ReleaseLogEntry] = []
+    if max_entries <= 0:
+        return entries
+    for date, path in _newest_first(base_dir):
+        title = extract_title(base_dir / path)
+        if title:
+            tool = path.split("/", 1)[0]
+            entries.append(ReleaseLogEntry(date=date, tool=tool, path=path, title=title))
+            if len(entries) >= max_entries:
+                break
+    return entries
+
+
+def write_manifest(base_dir: Path, entries: list[ReleaseLogEntry]):
+    """Replace the manifest atomically.
+
+    Args:
+        base_dir: Releases directory
+        entries: All manifest entries
+
+    Raises:
+        OSError: If the manifest cannot be written
+    """
+    manifest_path = base_dir / MANIFEST_FILENAME
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(entry.model_dump_json() + "\n" for entry in entries)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, manifest_path)
+
+
+def _newest(entries: list[ReleaseLogEntry], max_entries: int) -> list[ReleaseLogEntry]:
+    """Get the newest entries, ordered by date and path (descending)."""
+    return heapq.nlargest(max_entries, entries, key=lambda e: (e.date, e.path))
+
+
+def _is_stale(
+    base_dir: Path,
+    entries: list[ReleaseLogEntry],
+    newest: list[ReleaseLogEntry],
+    max_entries: int,
+) -> bool:
+    """Check whether the manifest no longer matches the logs on disk.
+
+    Only cheap checks are made. Every entry about to be rendered must still
+    exist, and tool directories missing from the manifest must not hold logs
+    that would be rendered. If fewer entries than requested are known, all
+    tool directories are checked that way.
+    """
+    if any(not (base_dir / entry.path).is_file() for entry in newest):
+        return True
+
+    known_paths = {entry.path for entry in entries}
+    known_tools = {entry.tool for entry in entries}
+    complete = len(newest) >= max_entries
+    cutoff = (newest[-1].date, newest[-1].path) if complete and newest else ("", "")
+    for tool in tool_directories(base_dir):
+        if complete and tool in known_tools:
+            # New logs of known tools are appended when saved
+            continue
+        for release_file in release_files(base_dir, tool):
+            if release_file <= cutoff:
+                break
+            if release_file[1] not in known_paths:
+                return True
+    return False
+
+
+def latest_entries(base_dir: Path, max_entries: int) -> list[ReleaseLogEntry]:
+    """Get the newest release logs, rebuilding the manifest if needed.
+
+    Args:
+        base_dir: Releases directory
+        max_entries: Maximum number of entries to return
+
+    Returns:
+        Newest entries, ordered by date (descending)
+
+    Raises:
+        OSError: If the releases directory cannot be read or the rebuilt
+            manifest cannot be written
+    """
+    entries = load_entries(base_dir)
+    if entries is not None:
+        newest = _newest(entries, max_entries)
+        if not _is_stale(base_dir, entries, newest, max_entries):
+            return newest
+
+    print("🔄 Rebuilding releases manifest from Markdown logs...")
+    entries = scan_entries(base_dir, max_entries)
+    write_manifest(base_dir, entries)
+    return entries
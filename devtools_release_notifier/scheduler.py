@@ -0,0 +1,81 @@
+"""Per-tool check schedule for serve mode."""
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from devtools_release_notifier.models.config import ToolConfig
+
+
+class ToolScheduler:
+    """Next check time of every enabled tool.
+
+    Each tool is checked on its own interval (see
+    :meth:`UnifiedReleaseNotifier.check_interval`), which is looked up again
+    after every check so that it can follow the tool's release cadence.
+    Every interval is stretched or shrunk by a random factor within
+    ``jitter`` so that tools sharing an interval drift apart instead of
+    hitting their sources in the same round forever.
+    """
+
+    def __init__(
+        self,
+        tools: list[ToolConfig],
+        interval: Callable[[ToolConfig], timedelta],
+        jitter: float,
+        now: datetime,
+        rng: random.Random | None = None,
+        first_check: Callable[[ToolConfig], datetime | None] | None = None,
+    ):
+        """Initialize schedule.
+
+        Args:
+            tools: Tool configurations (disabled tools are never scheduled)
+            interval: Gets the nominal check interval of a tool
+            jitter: Maximum relative deviation of an interval (0 to disable)
+            now: Current time
+            rng: Random number generator (for reproducible schedules)
+            first_check: Gets the time a tool is first due (e.g. its last
+                check plus its interval); tools without one are due at once
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._tools = [tool for tool in tools if tool.enabled]
+        self._next_check: dict[str, datetime] = {
+            tool.name: (first_check and first_check(tool)) or now for tool in self._tools
+        }
+
+    def __len__(self) -> int:
+        """Get the number of scheduled tools."""
+        return len(self._tools)
+
+    def due(self, now: datetime) -> list[ToolConfig]:
+        """Get the tools due for a check.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Due tools, in configuration order
+        """
+        return [tool for tool in self._tools if self._next_check[tool.name] <= now]
+
+    def reschedule(self, tools: list[ToolConfig], now: datetime):
+        """Schedule the next check of tools that have just been checked.
+
+        Args:
+            tools: Checked tools
+            now: Time the check finished
+        """
+        for tool in tools:
+            factor = self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_check[tool.name] = now + self.interval(tool) * factor
+
+    def next_check(self) -> datetime | None:
+        """Get the time of the earliest scheduled check.
+
+        Returns:
+            Earliest next check, or None if no tool is scheduled
+        """
+        return min(self._next_check.values(), default=None)
@@ -3,59 +3,84 @@
 
 This script parses the execution file generated by anthropics/claude-code-action
 and extracts the final Claude response containing the translated release information.
+
+The answer is almost always in the last result or assistant item, so the file
+is first memory-mapped and read item by item from the end, stopping at the
+first valid translation. Array items are delimited by matching brackets
+backwards, so each top-level item is decoded once, and reading every item
+costs about as much as parsing the whole file. Object-format files, and
+files the fast path cannot read, are parsed whole.
 """
 
+import itertools
 import json
+import mmap
 import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from pydantic import ValidationError
 
-from devtools_release_notifier.models.output import TranslatedRelease
+from devtools_release_notifier.models.output import TRANSLATED_RELEASE_LIST_ADAPTER
+
+# An array candidate must open with an object, like the translated output
+_ARRAY_OF_OBJECTS = re.compile(r"\[\s*\{")
+_DECODER = json.JSONDecoder()
+
+# Initial number of bytes read from the end for array items (doubled as needed)
+_ITEM_WINDOW_BYTES = 64 * 1024
+
+# Item types that can hold the answer, as they appear in the file
+_ANSWER_TYPES = (b'"result"', b'"assistant"')
+
+# Deepest nesting of containers inside an array item read from the end
+_MAX_ITEM_DEPTH = 16
+
+
+def _is_translation(data: object) -> bool:
+    """Check whether decoded JSON is a list of translated releases.
+
+    Args:
+        data: Decoded JSON value
+
+    Returns:
+        True if every item validates as TranslatedRelease
+    """
+    try:
+        TRANSLATED_RELEASE_LIST_ADAPTER.validate_python(data)
+    except ValidationError:
+        return False
+    return True
 
 
 def extract_json_from_text(text: str) -> str | None:
     """Extract JSON array from text.
 
+    The text is scanned backwards for ``[`` characters opening an array of
+    objects. Each candidate is decoded in place with ``raw_decode``, and the
+    first one that validates is returned, so the most recent response wins
+    and earlier parts of a long transcript are never examined. Arrays inside
+    Markdown code blocks are found the same way.
+
     Args:
         text: Text containing JSON
 
     Returns:
         Extracted JSON string or None if not found
     """
-    # First, try to extract from markdown code blocks
-    markdown_pattern = r"```(?:json)?\s*(\[.+?\])\s*```"
-    markdown_matches = re.findall(markdown_pattern, text, re.DOTALL)
-
-    for match in reversed(markdown_matches):
-        try:
-            # Validate that it's actually valid JSON
-            data = json.loads(match)
-            # Validate structure with Pydantic
-            if isinstance(data, list):
-                [TranslatedRelease(**item) for item in data]
-            return match
-        except (json.JSONDecodeError, ValidationError):
-            # Invalid JSON or structure, try next match
+    end = len(text)
+    while (start := text.rfind("[", 0, end)) != -1:
+        end = start
+        if not _ARRAY_OF_OBJECTS.match(text, start):
             continue
-
-    # If no markdown code blocks, try to find raw JSON array
-    json_pattern = r"\[\s*\{.*?\}\s*\]"
-    matches = re.findall(json_pattern, text, re.DOTALL)
-
-    # Try matches from last to first (most recent response first)
-    for match in reversed(matches):
         try:
-            # Validate that it's actually valid JSON
-            data = json.loads(match)
-            # Validate structure with Pydantic
-            if isinstance(data, list):
-                [TranslatedRelease(**item) for item in data]
-            return match
-        except (json.JSONDecodeError, ValidationError):
-            # Invalid JSON or structure, try next match
+            data, stop = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            # Invalid JSON, try the previous candidate
             continue
+        if _is_translation(data):
+            return text[start:stop]
 
     return None
 
@@ -237,9 +262,205 @@ def _extract_from_dict_format(data: dict) -> str | None:
     return None
 
 
+def _extract_from_item(item: object) -> str | None:
+    """Extract JSON from a result or assistant item.
+
+    Args:
+        item: Decoded execution file item
+
+    Returns:
+        Extracted JSON string or None if not found
+    """
+    if not isinstance(item, dict):
+        return None
+    return _extract_from_result_item(item) or _extract_from_assistant_item(item)
+
+
+def _reversed_item_pattern(max_depth: int) -> re.Pattern[bytes]:
+    """Build the pattern matching one top-level array item in reversed JSON.
+
+    Reversed, an escaped quote is a quote followed by an odd number of
+    backslashes. Regular expressions cannot count brackets, so containers
+    are matched level by level up to a fixed depth.
+
+    Args:
+        max_depth: Deepest nesting of containers inside an item
+
+    Returns:
+        Pattern matching whitespace, an item (group 1) and the separator
+        before it (group 2: ``,`` or the opening ``[`` of the array)
+    """
+    string = rb'"(?:[^"]++|"(?=\\(?:\\\\)*+(?!\\)))*+"'
+    other = rb'[^"\[\]{}]++'
+    content = rb"(?:" + other + rb"|" + string + rb")*+"
+    for _ in range(max_depth):
+        content = rb"(?:" + other + rb"|" + string + rb"|[\]}]" + content + rb"[\[{])*+"
+    scalar = rb'[^"\[\]{},]*+'
+    item = rb"[\]}]" + content + rb"[\[{]|" + string + rb"|" + scalar
+    return re.compile(rb"\s*+(" + item + rb")\s*+([,\[])")
+
+
+_REVERSED_ITEM = _reversed_item_pattern(_MAX_ITEM_DEPTH)
+
+
+def _iter_item_spans_reversed(buffer: mmap.mmap) -> Iterator[tuple[int, int]]:
+    """Find the items of a top-level JSON array from the end.
+
+    The end of the file is reversed into a window that doubles whenever an
+    item does not fit, and each item is matched whole, so the objects nested
+    in an item are never decoded on their own.
+
+    Args:
+        buffer: Memory-mapped JSON array document
+
+    Yields:
+        Start and end byte offsets of the items, last first
+
+    Raises:
+        ValueError: If the document is not a JSON array or nests too deep
+    """
+    size = len(buffer)
+    window = buffer[max(size - _ITEM_WINDOW_BYTES, 0) :][::-1]
+    pos = len(window) - len(window.lstrip())
+    if window[pos : pos + 1] != b"]":
+        raise ValueError("Execution file does not end with a JSON array")
+    pos += 1
+
+    while True:
+        match = _REVERSED_ITEM.match(window, pos)
+        if match is None:
+            if len(window) == size:
+                raise ValueError("Malformed or deeply nested item in execution file")
+            window = buffer[max(size - 2 * len(window), 0) :][::-1]
+            continue
+
+        if match[1]:
+            yield size - match.end(1), size - match.start(1)
+        if match[2] == b"[":
+            return
+        pos = match.end()
+
+
+def _iter_json_lines_reversed(buffer: mmap.mmap) -> Iterator[object]:
+    """Decode JSON lines from the end.
+
+    Args:
+        buffer: Memory-mapped JSON-lines file
+
+    Yields:
+        Decoded lines, last first
+
+    Raises:
+        ValueError: If a line is not valid JSON (the file is not JSON lines)
+    """
+    end = len(buffer)
+    while end > 0:
+        start = buffer.rfind(b"\n", 0, end) + 1
+        line = buffer[start:end].strip()
+        end = start - 1
+        if line:
+            yield json.loads(line)
+
+
+def _extract_from_array_buffer(buffer: mmap.mmap) -> tuple[str | None, int]:
+    """Extract JSON from an array execution file, reading items from the end.
+
+    Only the top-level result and assistant items are decoded.
+
+    Args:
+        buffer: Memory-mapped execution file
+
+    Returns:
+        Extracted JSON string or None if the file cannot be read this way,
+        and the number of trailing items read without finding it
+
+    Raises:
+        ValueError: If no item holds a translation
+    """
+    items_read = 0
+    try:
+        for start, end in _iter_item_spans_reversed(buffer):
+            # Tool output and user items cannot hold the answer
+            if buffer[start] == ord("{") and any(
+                buffer.find(key, start, end) != -1 for key in _ANSWER_TYPES
+            ):
+                json_response = _extract_from_item(json.loads(buffer[start:end]))
+                if json_response:
+                    return json_response, items_read
+            items_read += 1
+    except ValueError:
+        # Malformed or deeply nested file, left to the full parse
+        return None, items_read
+
+    # Every item has been read, only the whole-text search is left
+    json_response = extract_json_from_text(buffer[:].decode())
+    if json_response:
+        return json_response, items_read
+    raise ValueError("Could not find translated JSON in execution file")
+
+
+def _extract_from_json_lines_buffer(buffer: mmap.mmap) -> str | None:
+    """Extract JSON from a JSON-lines execution file, reading lines from the end.
+
+    Args:
+        buffer: Memory-mapped execution file
+
+    Returns:
+        Extracted JSON string, or None if the file is not JSON lines
+
+    Raises:
+        ValueError: If no line holds a translation
+    """
+    lines = _iter_json_lines_reversed(buffer)
+    try:
+        last_lines = list(itertools.islice(lines, 2))
+        if len(last_lines) < 2:
+            # A single object, whose result field the full parse reads
+            item = last_lines[0] if last_lines else None
+            return _extract_from_assistant_item(item) if isinstance(item, dict) else None
+        for item in itertools.chain(last_lines, lines):
+            json_response = _extract_from_item(item)
+            if json_response:
+                return json_response
+    except ValueError:
+        return None
+    raise ValueError("Could not find translated JSON in execution file")
+
+
+def _extract_streaming(file_path: Path) -> tuple[str | None, int]:
+    """Extract JSON by reading the execution file from the end.
+
+    Args:
+        file_path: Path to execution file
+
+    Returns:
+        Extracted JSON string or None if not found this way, and the number
+        of trailing array items already read (skipped by the full parse)
+
+    Raises:
+        ValueError: If the file is a JSON array or JSON lines without a translation
+    """
+    with open(file_path, "rb") as f:
+        if not f.seek(0, 2):
+            return None, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            first = buffer[: min(len(buffer), 64)].lstrip()[:1]
+
+            if first == b"[":
+                return _extract_from_array_buffer(buffer)
+
+            if first == b"{":
+                # JSON lines (stream-json), or a single object left to the full parse
+                return _extract_from_json_lines_buffer(buffer), 0
+
+    return None, 0
+
+
 def extract_claude_response(execution_file_path: str) -> str:
     """Extract Claude's final response from execution file.
 
+    Supports JSON array, JSON object and JSON-lines execution files.
+
     Args:
         execution_file_path: Path to execution file
 
@@ -254,6 +475,11 @@ def extract_claude_response(execution_file_path: str) -> str:
     if not file_path.exists():
         raise ValueError(f"Execution file not found: {execution_file_path}")
 
+    # Fast path: read items from the end without loading the whole file
+    json_response, items_read = _extract_streaming(file_path)
+    if json_response:
+        return json_response
+
     try:
         with open(file_path) as f:
             data = json.load(f)
@@ -262,7 +488,7 @@ def extract_claude_response(execution_file_path: str) -> str:
 
     # Try array format
     if isinstance(data, list):
-        json_response = _extract_from_array_format(data)
+        json_response = _extract_from_array_format(data[: len(data) - items_read])
         if json_response:
             return json_response
 
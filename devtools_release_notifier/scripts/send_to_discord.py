@@ -7,9 +7,7 @@
 """
 
 import argparse
-import json
 import os
-import re
 import sys
 from collections import defaultdict
 from datetime import UTC, datetime
@@ -18,7 +16,19 @@
 import httpx
 from pydantic import ValidationError
 
-from devtools_release_notifier.models.output import ReleaseOutput, TranslatedRelease
+from devtools_release_notifier.http_client import create_http_client
+from devtools_release_notifier.models.discord import ReleaseNotification
+from devtools_release_notifier.models.output import (
+    RELEASE_OUTPUT_LIST_ADAPTER,
+    TRANSLATED_RELEASE_LIST_ADAPTER,
+    ReleaseLogEntry,
+    ReleaseOutput,
+    TranslatedRelease,
+)
+from devtools_release_notifier.notifiers.discord import DiscordNotifier
+from devtools_release_notifier.notifiers.rate_limit import WebhookRateLimiter
+from devtools_release_notifier.outbox import NotificationOutbox, Sender
+from devtools_release_notifier.release_manifest import append_entry, latest_entries
 from devtools_release_notifier.templates import render_template
 
 
@@ -29,6 +39,8 @@ def send_to_discord(
     translated_content: str,
     url: str,
     color: int,
+    client: httpx.Client | None = None,
+    rate_limiter: WebhookRateLimiter | None = None,
 ) -> bool:
     """Send notification to Discord webhook.
 
@@ -39,6 +51,9 @@ def send_to_discord(
         translated_content: Translated release notes
         url: Release URL
         color: Embed color (RGB integer)
+        client: Shared HTTP client (a one-off client is used if omitted)
+        rate_limiter: Webhook rate limiter shared across calls (a one-off limiter
+            is used if omitted)
 
     Returns:
         True if successful, False otherwise
@@ -60,8 +75,13 @@ def send_to_discord(
         ]
     }
 
+    limiter = rate_limiter if rate_limiter is not None else WebhookRateLimiter()
     try:
-        response = httpx.post(webhook_url, json=payload, timeout=10.0)
+        if client is None:
+            with create_http_client() as one_off_client:
+                response = limiter.post(one_off_client, webhook_url, payload)
+        else:
+            response = limiter.post(client, webhook_url, payload)
         response.raise_for_status()
         print(f"✓ Sent notification for {tool_name}")
         return True
@@ -104,6 +124,9 @@ def save_markdown_log(
 ) -> bool:
     """Save notification content as Markdown file.
 
+    The log is also recorded in the releases manifest used to render the
+    releases index.
+
     Args:
         markdown_dir: Base directory for Markdown files (e.g., "rspress/docs/releases")
         tool_name: Tool name
@@ -129,9 +152,10 @@ def save_markdown_log(
         escaped_version = _escape_yaml_string(version)
 
         # Create frontmatter and content
+        title = render_template(t"{tool_name} - {escaped_version}")
         frontmatter = render_template(
             t"""---
-title: "{tool_name} - {escaped_version}"
+title: "{title}"
 date: "{timestamp.strftime("%Y-%m-%d")}"
 version: "{escaped_version}"
 url: "{url}"
@@ -157,6 +181,15 @@ def save_markdown_log(
 
         # Write to file
         file_path.write_text(frontmatter, encoding="utf-8")
+        append_entry(
+            Path(markdown_dir),
+            ReleaseLogEntry(
+                date=timestamp.strftime("%Y-%m-%d"),
+                tool=tool_slug,
+                path=f"{tool_slug}/{filename}",
+                title=title,
+            ),
+        )
         print(f"✓ Saved Markdown log for {tool_name}: {file_path}")
         return True
 
@@ -165,25 +198,6 @@ def save_markdown_log(
         return False
 
 
-def _extract_title_from_markdown(file_path: Path) -> str | None:
-    """Extract title from Markdown frontmatter.
-
-    Args:
-        file_path: Path to Markdown file
-
-    Returns:
-        Title string or None if not found
-    """
-    try:
-        content = file_path.read_text(encoding="utf-8")
-        match = re.search(r'^title:\s*"(.+)"', content, re.MULTILINE)
-        if match:
-            return match.group(1)
-        return None
-    except (OSError, ValueError):
-        return None
-
-
 def _get_tool_links(base_dir: Path) -> list[str]:
     """Generate tool filter links dynamically from directory structure.
 
@@ -208,6 +222,9 @@ def _get_tool_links(base_dir: Path) -> list[str]:
 def update_releases_index(markdown_dir: str, max_entries: int = 15) -> bool:
     """Update releases/index.md with latest release entries.
 
+    Entries are read from the releases manifest, which is rebuilt from the
+    Markdown logs only when it is missing or stale.
+
     Args:
         markdown_dir: Base directory for Markdown files (e.g., "rspress/docs/releases")
         max_entries: Maximum number of entries to keep (default: 15)
@@ -219,33 +236,13 @@ def update_releases_index(markdown_dir: str, max_entries: int = 15) -> bool:
         base_dir = Path(markdown_dir)
         index_path = base_dir / "index.md"
 
-        # Collect all release Markdown files (YYYY-MM-DD.md)
-        release_files: list[tuple[str, Path, str]] = []
-        for tool_dir in base_dir.iterdir():
-            if not tool_dir.is_dir() or tool_dir.name.startswith("_"):
-                continue
-
-            for md_file in tool_dir.glob("20*.md"):
-                # Extract date from filename (YYYY-MM-DD.md)
-                date_match = re.match(r"(\d{4}-\d{2}-\d{2})\.md", md_file.name)
-                if date_match:
-                    date_str = date_match.group(1)
-                    # Extract title from frontmatter
-                    title = _extract_title_from_markdown(md_file)
-                    if title:
-                        # Remove "Tool Name - " prefix from title
-                        title_parts = title.split(" - ", 1)
-                        short_title = title_parts[1] if len(title_parts) > 1 else title
-                        release_files.append((date_str, md_file, short_title))
-
-        # Sort by date (descending) and limit to max_entries
-        release_files.sort(key=lambda x: x[0], reverse=True)
-        release_files = release_files[:max_entries]
-
-        # Group by date
-        releases_by_date: dict[str, list[tuple[Path, str]]] = defaultdict(list)
-        for date_str, file_path, title in release_files:
-            releases_by_date[date_str].append((file_path, title))
+        # Group the newest entries by date
+        releases_by_date: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        for entry in latest_entries(base_dir, max_entries):
+            # Remove "Tool Name - " prefix from title
+            title_parts = entry.title.split(" - ", 1)
+            short_title = title_parts[1] if len(title_parts) > 1 else entry.title
+            releases_by_date[entry.date].append((entry.path, short_title))
 
         # Generate tool filter links dynamically
         tool_links = _get_tool_links(base_dir)
@@ -275,9 +272,7 @@ def update_releases_index(markdown_dir: str, max_entries: int = 15) -> bool:
 
             # Sort entries within the same date alphabetically by title
             entries = sorted(releases_by_date[date_str], key=lambda x: x[1])
-            for file_path, title in entries:
-                # Generate relative path from index.md
-                rel_path = file_path.relative_to(base_dir)
+            for rel_path, title in entries:
                 content_lines.append(f"- [{title}](./{rel_path})")
 
             content_lines.append("")
@@ -292,6 +287,22 @@ def update_releases_index(markdown_dir: str, max_entries: int = 15) -> bool:
         return False
 
 
+def _root_error_type(error: ValidationError) -> str | None:
+    """Get the error type if validation failed on the document itself.
+
+    Args:
+        error: Validation error from a list adapter
+
+    Returns:
+        Error type such as "json_invalid" or "list_type", or None if the
+        error is about individual items
+    """
+    errors = error.errors()
+    if len(errors) == 1 and not errors[0]["loc"]:
+        return errors[0]["type"]
+    return None
+
+
 def _load_releases(file_path: str) -> list[ReleaseOutput]:
     """Load and validate releases data from JSON file.
 
@@ -305,17 +316,18 @@ def _load_releases(file_path: str) -> list[ReleaseOutput]:
         SystemExit: If file cannot be loaded or validation fails
     """
     try:
-        with open(file_path) as f:
-            releases_data = json.load(f)
-        if not isinstance(releases_data, list):
-            print("Error: Releases data must be a JSON array", file=sys.stderr)
-            sys.exit(1)
-        return [ReleaseOutput(**item) for item in releases_data]
-    except (OSError, json.JSONDecodeError) as e:
+        return RELEASE_OUTPUT_LIST_ADAPTER.validate_json(Path(file_path).read_bytes())
+    except OSError as e:
         print(f"Error loading releases file: {e}", file=sys.stderr)
         sys.exit(1)
     except ValidationError as e:
-        print(f"Error: Invalid releases data format: {e}", file=sys.stderr)
+        match _root_error_type(e):
+            case "json_invalid":
+                print(f"Error loading releases file: {e}", file=sys.stderr)
+            case "list_type":
+                print("Error: Releases data must be a JSON array", file=sys.stderr)
+            case _:
+                print(f"Error: Invalid releases data format: {e}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -332,80 +344,144 @@ def _parse_translations(json_str: str) -> list[TranslatedRelease]:
         SystemExit: If JSON cannot be parsed or validation fails
     """
     try:
-        translated_data = json.loads(json_str)
-        if not isinstance(translated_data, list):
-            print("Error: Translated data must be a JSON array", file=sys.stderr)
-            sys.exit(1)
-        return [TranslatedRelease(**item) for item in translated_data]
-    except json.JSONDecodeError as e:
-        print(f"Error parsing translated JSON: {e}", file=sys.stderr)
-        sys.exit(1)
+        return TRANSLATED_RELEASE_LIST_ADAPTER.validate_json(json_str)
     except ValidationError as e:
-        print(f"Error: Invalid translated data format: {e}", file=sys.stderr)
+        match _root_error_type(e):
+            case "json_invalid":
+                print(f"Error parsing translated JSON: {e}", file=sys.stderr)
+            case "list_type":
+                print("Error: Translated data must be a JSON array", file=sys.stderr)
+            case _:
+                print(f"Error: Invalid translated data format: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _sender(client: httpx.Client, batch: bool) -> Sender:
+    """Create a sender sharing one connection pool and rate limit state.
+
+    Args:
+        client: Shared HTTP client
+        batch: Pack notifications into multi-embed messages per webhook
+
+    Returns:
+        Sender returning per-notification success flags
+    """
+    rate_limiter = WebhookRateLimiter()
+    if batch:
+        return DiscordNotifier(client=client, rate_limiter=rate_limiter).send_batch
+
+    def send(notifications: list[ReleaseNotification]) -> list[bool]:
+        return [
+            send_to_discord(
+                webhook_url=n.webhook_url,
+                tool_name=n.tool_name,
+                version=n.version,
+                translated_content=n.content,
+                url=n.url,
+                color=n.color,
+                client=client,
+                rate_limiter=rate_limiter,
+            )
+            for n in notifications
+        ]
+
+    return send
+
+
 def _send_notifications(
-    releases: list[ReleaseOutput], translated_map: dict[str, str], markdown_dir: str | None = None
+    releases: list[ReleaseOutput],
+    translated_map: dict[str, str],
+    markdown_dir: str | None = None,
+    batch: bool = False,
+    outbox_path: str | None = None,
 ) -> tuple[int, int, int]:
     """Send Discord notifications for all releases.
 
+    With an outbox, the releases are queued together with notifications still
+    pending from earlier runs, and failed ones are kept there for retry.
+
     Args:
         releases: List of releases to notify
         translated_map: Mapping of tool names to translated content
         markdown_dir: Base directory for Markdown files (optional)
+        batch: Pack notifications into multi-embed messages per webhook
+        outbox_path: Path of the notification outbox (optional)
 
     Returns:
         Tuple of (success_count, failed_count, skipped_count)
     """
-    success_count = 0
-    failed_count = 0
-    skipped_count = 0
     timestamp = datetime.now(UTC)
     markdown_saved = False
 
-    for release in releases:
-        # Get webhook URL from environment
-        webhook_url = os.getenv(release.webhook_env)
-
-        if not webhook_url:
-            print(f"⚠️  Webhook URL not found for {release.tool_name} ({release.webhook_env})")
-            skipped_count += 1
-            continue
-
-        # Get translated content or fall back to original
-        translated_content = translated_map.get(release.tool_name, release.content)
-
-        # Send to Discord
-        if send_to_discord(
-            webhook_url=webhook_url,
-            tool_name=release.tool_name,
-            version=release.version,
-            translated_content=translated_content,
-            url=release.url,
-            color=release.color,
-        ):
-            success_count += 1
-
-            # Save Markdown log if directory is specified
-            if markdown_dir:
-                if save_markdown_log(
-                    markdown_dir=markdown_dir,
-                    tool_name=release.tool_name,
-                    version=release.version,
-                    translated_content=translated_content,
-                    url=release.url,
-                    timestamp=timestamp,
-                ):
-                    markdown_saved = True
+    # Use translated content, falling back to the original
+    releases = [
+        release.model_copy(
+            update={"content": translated_map.get(release.tool_name, release.content)}
+        )
+        for release in releases
+    ]
+
+    delivered: list[ReleaseOutput | ReleaseNotification] = []
+    with create_http_client() as client:
+        send = _sender(client, batch)
+
+        if outbox_path:
+            outbox = NotificationOutbox(outbox_path)
+            for release in releases:
+                outbox.add(release)
+            outbox.save()
+            result = outbox.flush(send)
+            outbox.save()
+
+            delivered = [entry.release for entry in result.sent]
+            failed_count = len(result.failed)
+            skipped_count = len(result.skipped)
         else:
-            failed_count += 1
+            # Resolve webhooks
+            notifications: list[ReleaseNotification] = []
+            skipped_count = 0
+            for release in releases:
+                webhook_url = os.getenv(release.webhook_env)
+                if not webhook_url:
+                    print(
+                        f"⚠️  Webhook URL not found for {release.tool_name} ({release.webhook_env})"
+                    )
+                    skipped_count += 1
+                    continue
+
+                notifications.append(
+                    ReleaseNotification(
+                        webhook_url=webhook_url,
+                        tool_name=release.tool_name,
+                        version=release.version,
+                        content=release.content,
+                        url=release.url,
+                        color=release.color,
+                    )
+                )
+
+            results = send(notifications) if notifications else []
+            delivered = [n for n, sent in zip(notifications, results, strict=True) if sent]
+            failed_count = len(notifications) - len(delivered)
+
+    # Save Markdown log if directory is specified
+    if markdown_dir:
+        for release in delivered:
+            if save_markdown_log(
+                markdown_dir=markdown_dir,
+                tool_name=release.tool_name,
+                version=release.version,
+                translated_content=release.content,
+                url=release.url,
+                timestamp=timestamp,
+            ):
+                markdown_saved = True
 
     # Update releases/index.md if any Markdown logs were saved
     if markdown_saved and markdown_dir:
         update_releases_index(markdown_dir)
 
-    return success_count, failed_count, skipped_count
+    return len(delivered), failed_count, skipped_count
 
 
 def _print_summary(success_count: int, failed_count: int, skipped_count: int, total: int):
@@ -455,18 +531,38 @@ def main():
     parser = argparse.ArgumentParser(
         description="Send translated release information to Discord and save as Markdown"
     )
-    parser.add_argument("releases_file", help="Path to releases.json file")
-    parser.add_argument("translated_json", help="JSON string containing translated data")
+    parser.add_argument(
+        "releases_file",
+        nargs="?",
+        help="Path to releases.json file (omit to only retry the outbox)",
+    )
+    parser.add_argument(
+        "translated_json",
+        nargs="?",
+        default="[]",
+        help="JSON string containing translated data",
+    )
     parser.add_argument(
         "--markdown-dir",
         default="rspress/docs/releases",
         help="Base directory for Markdown files (default: rspress/docs/releases)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Pack notifications into multi-embed messages per webhook",
+    )
+    parser.add_argument(
+        "--outbox",
+        help="Notification outbox file; failed notifications are kept there and retried",
+    )
 
     args = parser.parse_args()
+    if args.releases_file is None and args.outbox is None:
+        parser.error("releases_file is required without --outbox")
 
     # Load and validate data
-    releases = _load_releases(args.releases_file)
+    releases = _load_releases(args.releases_file) if args.releases_file else []
     translated = _parse_translations(args.translated_json)
 
     # Create mapping of tool names to translated content
@@ -474,11 +570,15 @@ def main():
 
     # Send notifications and save Markdown logs
     success_count, failed_count, skipped_count = _send_notifications(
-        releases, translated_map, markdown_dir=args.markdown_dir
+        releases,
+        translated_map,
+        markdown_dir=args.markdown_dir,
+        batch=args.batch,
+        outbox_path=args.outbox,
     )
 
-    # Print summary and exit
-    total_releases = len(releases)
+    # Print summary and exit (the outbox may add pending notifications from earlier runs)
+    total_releases = success_count + failed_count + skipped_count
     _print_summary(success_count, failed_count, skipped_count, total_releases)
     _exit_with_status(success_count, failed_count, total_releases)
 
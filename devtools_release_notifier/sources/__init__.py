@@ -0,0 +1,36 @@
+"""Release information sources.
+
+Source classes are registered by configuration type with the module that
+defines them, so only the modules a configuration actually uses are imported.
+"""
+
+import importlib
+
+from devtools_release_notifier.sources.base import ReleaseSource
+
+# Source type -> (module, class name)
+SOURCE_CLASSES: dict[str, tuple[str, str]] = {
+    "github_releases": ("devtools_release_notifier.sources.github_releases", "GitHubReleaseSource"),
+    "homebrew_cask": ("devtools_release_notifier.sources.homebrew_cask", "HomebrewCaskSource"),
+    "github_commits": ("devtools_release_notifier.sources.github_commits", "GitHubCommitsSource"),
+    "changelog": ("devtools_release_notifier.sources.changelog", "ChangelogSource"),
+}
+
+
+def get_source_class(source_type: str) -> type[ReleaseSource]:
+    """Resolve a source class, importing its module on first use.
+
+    Args:
+        source_type: Source type from the configuration
+
+    Returns:
+        Source class
+
+    Raises:
+        ValueError: If source type is unknown
+    """
+    try:
+        module_name, class_name = SOURCE_CLASSES[source_type]
+    except KeyError:
+        raise ValueError(f"Unknown source type: {source_type}") from None
+    return getattr(importlib.import_module(module_name), class_name)
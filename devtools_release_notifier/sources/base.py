@@ -1,18 +1,212 @@
 """Base class for release information sources."""
 
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+import httpx
+
+from devtools_release_notifier.http_cache import HttpCache
+from devtools_release_notifier.http_client import create_http_client
+from devtools_release_notifier.metrics import NULL_METRICS, Metrics, url_host
+
+# Releases read at most when catching up with a known version
+MAX_CATCH_UP = 10
+
+
+def collect_until(releases: Iterable[dict], known_version: str | None) -> list[dict]:
+    """Consume releases (newest first) until the known version is reached.
+
+    Releases are consumed lazily, so a streamed source stops reading right
+    after the known version. Without a known version only the newest
+    release is taken, and at most MAX_CATCH_UP releases are read.
+
+    Args:
+        releases: Release information, newest first
+        known_version: Version seen on the previous check
+
+    Returns:
+        Releases newest first, ending with the known version if it was reached
+    """
+    collected: list[dict] = []
+    for release in releases:
+        collected.append(release)
+        if (
+            known_version is None
+            or release["version"] == known_version
+            or len(collected) >= MAX_CATCH_UP
+        ):
+            break
+    return collected
+
+
+class FetchCancelled(BaseException):
+    """Raised in a source whose fetch is no longer needed.
+
+    Like ``asyncio.CancelledError`` it is not an ``Exception``, so the error
+    handling of sources does not report it as a failed fetch.
+    """
+
+
+class _CancellableStream(httpx.SyncByteStream):
+    """Response body that stops at the next chunk once its fetch is cancelled."""
+
+    def __init__(self, stream: httpx.SyncByteStream, cancel: threading.Event):
+        self._stream = stream
+        self._cancel = cancel
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            if self._cancel.is_set():
+                raise FetchCancelled
+            yield chunk
+
+    def close(self):
+        self._stream.close()
 
 
 class ReleaseSource(ABC):
     """Abstract base class for release information sources."""
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        client: httpx.Client | None = None,
+        http_cache: HttpCache | None = None,
+        metrics: Metrics | None = None,
+        cancel: threading.Event | None = None,
+    ):
         """Initialize with configuration.
 
         Args:
             config: Configuration dictionary for this source
+            client: Shared HTTP client (a private client is created if omitted)
+            http_cache: Conditional request cache (requests are unconditional if omitted)
+            metrics: Metrics to record request timings in (disabled if omitted)
+            cancel: Set once the fetch is no longer needed (see :class:`FetchCancelled`)
         """
         self.config = config
+        self.client = client if client is not None else create_http_client()
+        self.http_cache = http_cache
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.cancel = cancel
+
+    def _raise_if_cancelled(self):
+        """Stop a fetch that is no longer needed.
+
+        Raises:
+            FetchCancelled: If the cancel event is set
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            raise FetchCancelled
+
+    def _get(self, url: str) -> httpx.Response:
+        """Send a GET request, conditional on validators from a previous response.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            HTTP response (may be 304 Not Modified)
+
+        Raises:
+            FetchCancelled: If the fetch was cancelled before the request or
+                while waiting for the response
+        """
+        self._raise_if_cancelled()
+        headers = self.http_cache.request_headers(url) if self.http_cache else None
+        host = url_host(url)
+        with self.metrics.timer("fetch", host=host):
+            response = self.client.get(url, headers=headers)
+        self.metrics.count("http_requests", host=host, status=str(response.status_code))
+        self._raise_if_cancelled()
+        return response
+
+    @contextmanager
+    def _stream(self, url: str) -> Iterator[httpx.Response]:
+        """Send a streaming GET request, conditional like :meth:`_get`.
+
+        The fetch timer covers the time until the response headers arrive;
+        reading the body is attributed to the caller's parse phase. Once the
+        fetch is cancelled, reading the body stops at the next chunk.
+
+        Args:
+            url: Request URL
+
+        Yields:
+            Response with an unread body
+
+        Raises:
+            FetchCancelled: If the fetch was cancelled before or while reading
+        """
+        self._raise_if_cancelled()
+        headers = self.http_cache.request_headers(url) if self.http_cache else None
+        host = url_host(url)
+        request = self.client.build_request("GET", url, headers=headers)
+        with self.metrics.timer("fetch", host=host):
+            response = self.client.send(request, stream=True)
+        self.metrics.count("http_requests", host=host, status=str(response.status_code))
+        if self.cancel is not None and isinstance(response.stream, httpx.SyncByteStream):
+            response.stream = _CancellableStream(response.stream, self.cancel)
+        try:
+            yield response
+        finally:
+            response.close()
+
+    def _not_modified_result(self, url: str, response: httpx.Response) -> dict | None:
+        """Get the cached result when the server reports the resource unchanged.
+
+        Args:
+            url: Request URL
+            response: HTTP response
+
+        Returns:
+            Result stored for the URL if the response is 304, otherwise None
+
+        Raises:
+            FetchCancelled: If the fetch was cancelled (nothing is replayed)
+        """
+        if response.status_code != httpx.codes.NOT_MODIFIED or not self.http_cache:
+            return None
+
+        self._raise_if_cancelled()
+        result = self.http_cache.result(url)
+        if result:
+            print(f"  ✓ Not modified since last check: {url}")
+        return result
+
+    def _remember(self, url: str, response: httpx.Response, result: dict):
+        """Store response validators and the parsed result for the next run.
+
+        Args:
+            url: Request URL
+            response: Successful HTTP response
+            result: Release information parsed from the response
+
+        Raises:
+            FetchCancelled: If the fetch was cancelled (nothing is stored)
+        """
+        self._raise_if_cancelled()
+        if self.http_cache:
+            self.http_cache.store(url, response, result)
+
+    def fetch_releases(self, known_version: str | None = None) -> list[dict] | None:
+        """Fetch releases published since a known version.
+
+        Sources that can list past releases override this to read them
+        newest first from a single response and stop at the known version
+        (see :func:`collect_until`). Others only report their latest release.
+
+        Args:
+            known_version: Version seen on the previous check
+
+        Returns:
+            Releases newest first, ending with the known version if it was
+            reached, or None if failed
+        """
+        result = self.fetch_latest_version()
+        return [result] if result else None
 
     @abstractmethod
     def fetch_latest_version(self) -> dict | None:
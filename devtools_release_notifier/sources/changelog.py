@@ -1,11 +1,13 @@
 """Changelog source for release information."""
 
+import itertools
 import re
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 import httpx
 
-from devtools_release_notifier.sources.base import ReleaseSource
+from devtools_release_notifier.sources.base import ReleaseSource, collect_until
 
 VERSION_PATTERNS: dict[str, str] = {
     # Claude Code format: ## 2.0.69
@@ -14,8 +16,6 @@
     "keepachangelog": r"^## \[([^\]]+)\](?: - (\d{4}-\d{2}-\d{2}))?",
 }
 
-HTTP_TIMEOUT_SECONDS = 10.0
-
 
 class ChangelogSource(ReleaseSource):
     """Fetch release information from a CHANGELOG file."""
@@ -51,83 +51,136 @@ def _parse_date(self, date_str: str | None) -> datetime:
                 pass
         return datetime.now(UTC)
 
-    def _extract_content(self, text: str, start_pos: int, pattern: re.Pattern) -> str:
-        """Extract content between current version and next version.
+    def _iter_sections(self, response: httpx.Response, pattern: re.Pattern) -> Iterator[str]:
+        """Yield the version sections of a streamed CHANGELOG, newest first.
+
+        Chunks are scanned incrementally and only complete lines are matched
+        against the version pattern. A section is yielded as soon as the next
+        version header is read, so the download stops at the header after the
+        last section the caller consumes. Text before the first header is
+        skipped, and consumed text is dropped from the buffer.
 
         Args:
-            text: Full CHANGELOG text
-            start_pos: Position after version header line
+            response: Streaming HTTP response
             pattern: Compiled version pattern
 
-        Returns:
-            Extracted content (trimmed)
+        Yields:
+            Section text from a version header up to the next one
         """
-        remaining_text = text[start_pos:]
-        next_match = pattern.search(remaining_text)
+        buffer = ""
+        search_from = 0
+        section_start: int | None = None
+
+        for chunk in itertools.chain(response.iter_text(), [None]):
+            if chunk is None:
+                # End of file: the last line may lack a trailing newline
+                complete_end = len(buffer)
+            else:
+                buffer += chunk
+                complete_end = buffer.rfind("\n") + 1
 
-        if next_match:
-            content = remaining_text[: next_match.start()]
-        else:
-            content = remaining_text
+            while match := pattern.search(buffer, search_from, complete_end):
+                if section_start is not None:
+                    yield buffer[section_start : match.start()]
+                section_start = match.start()
+                search_from = match.end()
 
-        return content.strip()
+            search_from = max(search_from, complete_end)
+            keep_from = section_start if section_start is not None else complete_end
+            buffer = buffer[keep_from:]
+            search_from -= keep_from
+            if section_start is not None:
+                section_start = 0
 
-    def fetch_latest_version(self) -> dict | None:
-        """Fetch latest version from CHANGELOG file.
+        if section_start is not None:
+            yield buffer
+
+    def _section_result(self, section: str, pattern: re.Pattern, url: str) -> dict:
+        """Build release information from a version section.
+
+        Args:
+            section: Section text starting with a version header
+            pattern: Compiled version pattern
+            url: Release page URL
 
         Returns:
             Dictionary with version, content, url, published, source
-            or None if failed
         """
-        raw_url = self.config.get("raw_url")
-        if not raw_url:
-            print("✗ Changelog: raw_url not configured")
-            return None
+        match = pattern.match(section)
+        assert match is not None
+        version = match.group(1)
 
+        # Extract date from group(2) if available (keepachangelog pattern)
         try:
-            response = httpx.get(raw_url, timeout=HTTP_TIMEOUT_SECONDS)
-            response.raise_for_status()
-            text = response.text
+            date_str = match.group(2)
+        except IndexError:
+            date_str = None
 
-            pattern = self._get_pattern()
-            match = pattern.search(text)
+        # Content starts after the version header line
+        header_end = section.find("\n", match.end())
+        content = section[header_end + 1 :] if header_end != -1 else ""
 
-            if not match:
-                print("✗ Changelog: No version found")
-                return None
+        return {
+            "version": version,
+            "content": content.strip(),
+            "url": url,
+            "published": self._parse_date(date_str),
+            "source": "changelog",
+        }
 
-            version = match.group(1)
-
-            # Extract date from group(2) if available (keepachangelog pattern)
-            try:
-                date_str = match.group(2)
-            except IndexError:
-                date_str = None
+    def fetch_releases(self, known_version: str | None = None) -> list[dict] | None:
+        """Fetch versions from CHANGELOG file down to a known version.
 
-            published = self._parse_date(date_str)
+        Version sections are read newest first while the file downloads, and
+        reading stops at the known version.
 
-            # Find end of version header line to start content extraction
-            # +1 to skip the newline character itself
-            header_end = text.find("\n", match.end())
-            if header_end == -1:
-                header_end = match.end()
-            else:
-                header_end += 1
+        Args:
+            known_version: Version seen on the previous check
 
-            content = self._extract_content(text, header_end, pattern)
+        Returns:
+            Releases newest first, ending with the known version if it was
+            reached, or None if failed
+        """
+        raw_url = self.config.get("raw_url")
+        if not raw_url:
+            print("✗ Changelog: raw_url not configured")
+            return None
 
+        try:
+            pattern = self._get_pattern()
             url = self.config.get("content_url") or raw_url
 
-            return {
-                "version": version,
-                "content": content,
-                "url": url,
-                "published": published,
-                "source": "changelog",
-            }
+            with self._stream(raw_url) as response:
+                cached_result = self._not_modified_result(raw_url, response)
+                if cached_result:
+                    return [cached_result]
+                response.raise_for_status()
+                with self.metrics.timer("parse"):
+                    sections = self._iter_sections(response, pattern)
+                    releases = collect_until(
+                        (self._section_result(s, pattern, url) for s in sections),
+                        known_version,
+                    )
+
+            if not releases:
+                print("✗ Changelog: No version found")
+                return None
+
+            self._remember(raw_url, response, releases[0])
+            return releases
         except httpx.HTTPError as e:
             print(f"✗ Changelog: HTTP error - {e}")
             return None
         except re.error as e:
             print(f"✗ Changelog: Invalid regex pattern - {e}")
             return None
+
+    def fetch_latest_version(self) -> dict | None:
+        """Fetch latest version from CHANGELOG file.
+
+        Returns:
+            Dictionary with version, content, url, published, source
+            or None if failed
+        """
+        releases = self.fetch_releases()
+        return releases[0] if releases else None
@@ -0,0 +1,405 @@
+"""Lightweight streaming Atom / RSS entry parser.
+
+Feeds are parsed incrementally with ``xml.etree.ElementTree.XMLPullParser``
+and entries are yielded as soon as they are complete, so callers that only
+need the newest entries stop reading (and downloading) early. feedparser is
+only imported as a fallback for feeds that are not well-formed XML.
+"""
+
+import html.entities
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+
+import httpx
+
+ENTRY_TAGS = frozenset({"entry", "item"})
+
+# Allow lists mirror feedparser's sanitizer so both parsing paths produce the
+# same summaries. Inline styles are dropped instead of being CSS-filtered.
+SAFE_ELEMENTS = frozenset(
+    (
+        "a abbr acronym address area article aside audio b big blockquote br button "
+        "canvas caption center cite code col colgroup command datagrid datalist dd del "
+        "details dfn dialog dir div dl dt em event-source fieldset figcaption figure font "
+        "footer form h1 h2 h3 h4 h5 h6 header hr i img input ins kbd keygen label legend "
+        "li m map menu meter multicol nav nextid noscript ol optgroup option output p pre "
+        "progress q s samp section select small sound source spacer span strike strong "
+        "sub sup table tbody td textarea tfoot th thead time tr tt u ul var video"
+    ).split()
+)
+SAFE_ATTRIBUTES = frozenset(
+    (
+        "abbr accept accept-charset accesskey action align alt autocomplete autofocus "
+        "axis background balance bgcolor bgproperties border bordercolor bordercolordark "
+        "bordercolorlight bottompadding cellpadding cellspacing ch challenge char charoff "
+        "charset checked choff cite class clear color cols colspan compact "
+        "contenteditable controls coords data datafld datapagesize datasrc datetime "
+        "default delay dir disabled draggable dynsrc enctype end face for form frame "
+        "galleryimg gutter headers height hidden hidefocus high href hreflang hspace icon "
+        "id inputmode ismap keytype label lang leftspacing list longdesc loop loopcount "
+        "loopend loopstart low lowsrc max maxlength media method min multiple name nohref "
+        "noshade nowrap open optimum pattern ping point-size poster pqg preload prompt "
+        "radiogroup readonly rel repeat-max repeat-min replace required rev rightspacing "
+        "rows rowspan rules scope selected shape size span src start step summary "
+        "suppress tabindex target template title toppadding type unselectable urn usemap "
+        "valign value variable volume vrml vspace width wrap xml:lang"
+    ).split()
+)
+SAFE_URI_SCHEMES = frozenset(
+    (
+        "file ftp gopher h323 hdl http https imap magnet mailto mms news nntp prospero "
+        "rsync rtsp rtspu sftp shttp sip sips snews svn svn+ssh telnet wais aim callto "
+        "cvs facetime feed git gtalk irc ircs irc6 itms msnim skype ssh smb ymsg"
+    ).split()
+)
+# Elements dropped together with their content
+UNSAFE_ELEMENTS_WITH_CONTENT = frozenset({"applet", "script", "style"})
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "basefont",
+        "br",
+        "col",
+        "command",
+        "embed",
+        "frame",
+        "hr",
+        "img",
+        "input",
+        "isindex",
+        "keygen",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+HTML_CONTENT_TYPES = frozenset({"html", "text/html"})
+
+_BARE_AMPERSAND = re.compile(r"&(?!#\d+;|#x[0-9a-fA-F]+;|\w+;)")
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    """Feed entry fields used by the GitHub sources.
+
+    Attributes:
+        title: Entry title
+        link: Entry URL
+        summary: Summary, falling back to content (Atom) or description (RSS)
+        published: Published time, falling back to updated time (UTC)
+    """
+
+    title: str
+    link: str
+    summary: str
+    published: datetime | None
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag name.
+
+    Args:
+        tag: Tag name, possibly in ``{namespace}name`` form
+
+    Returns:
+        Local tag name
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 (Atom) or RFC 822 (RSS) date.
+
+    Args:
+        value: Date string
+
+    Returns:
+        Datetime in UTC or None if missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+class _HTMLSanitizer(HTMLParser):
+    """Re-serialize HTML keeping only allow-listed elements and attributes.
+
+    Text of dropped elements is kept, except inside ``<script>``, ``<style>``
+    and ``<applet>``. Entity and character references are passed through.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.pieces: list[str] = []
+        self.unsafe_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in UNSAFE_ELEMENTS_WITH_CONTENT:
+            self.unsafe_depth += 1
+            return
+        if tag not in SAFE_ELEMENTS:
+            return
+
+        # Later duplicates win, names are sorted (as in feedparser)
+        normalized = {key.lower(): key if value is None else value for key, value in attrs}
+        serialized = ""
+        for key, value in sorted(normalized.items()):
+            if key not in SAFE_ATTRIBUTES:
+                continue
+            if key in ("rel", "type"):
+                value = value.lower()
+            if key == "href" and not _is_safe_uri(value):
+                value = ""
+            value = value.replace(">", "&gt;").replace("<", "&lt;").replace('"', "&quot;")
+            serialized += f' {key}="{_BARE_AMPERSAND.sub("&amp;", value)}"'
+
+        if tag in VOID_ELEMENTS:
+            self.pieces.append(f"<{tag}{serialized} />")
+        else:
+            self.pieces.append(f"<{tag}{serialized}>")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in UNSAFE_ELEMENTS_WITH_CONTENT:
+            self.unsafe_depth = max(self.unsafe_depth - 1, 0)
+        elif tag in SAFE_ELEMENTS and tag not in VOID_ELEMENTS:
+            self.pieces.append(f"</{tag}>")
+
+    def handle_data(self, data: str) -> None:
+        if not self.unsafe_depth:
+            self.pieces.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        if not self.unsafe_depth:
+            self.pieces.append(f"&#{name.lower()};")
+
+    def handle_entityref(self, name: str) -> None:
+        if self.unsafe_depth:
+            return
+        if name in html.entities.name2codepoint or name == "apos":
+            self.pieces.append(f"&{name};")
+        else:
+            self.pieces.append(f"&amp;{name}")
+
+    def handle_comment(self, data: str) -> None:
+        if not self.unsafe_depth:
+            self.pieces.append(f"<!--{data}-->")
+
+
+def _is_safe_uri(uri: str) -> bool:
+    """Check that a URI is relative or uses an allow-listed scheme.
+
+    Args:
+        uri: URI from an ``href`` attribute
+
+    Returns:
+        True if the URI can be kept
+    """
+    scheme, separator, _ = uri.strip().partition(":")
+    if not separator or "/" in scheme:
+        return True
+    return scheme.lower() in SAFE_URI_SCHEMES
+
+
+def _sanitize_html(source: str) -> str:
+    """Remove scripts, styles and unknown markup from HTML feed content.
+
+    Produces the same output as feedparser's sanitizer for the HTML found in
+    release feeds, without importing feedparser on the streaming path.
+
+    Args:
+        source: HTML fragment
+
+    Returns:
+        Sanitized HTML fragment
+    """
+    source = source.replace("<![CDATA[", "&lt;![CDATA[")
+    source = source.replace("&#39;", "'").replace("&#34;", '"')
+    sanitizer = _HTMLSanitizer()
+    sanitizer.feed(source)
+    sanitizer.close()
+    return "".join(sanitizer.pieces).strip().replace("\r\n", "\n")
+
+
+def _element_text(element: ET.Element) -> str:
+    """Get the text of an element, including nested XHTML content.
+
+    Args:
+        element: XML element
+
+    Returns:
+        Concatenated text
+    """
+    return "".join(element.itertext()).strip()
+
+
+def _entry_from_element(element: ET.Element) -> FeedEntry:
+    """Convert an ``<entry>`` or ``<item>`` element to a FeedEntry.
+
+    Args:
+        element: Entry element
+
+    Returns:
+        Feed entry
+    """
+    fields: dict[str, str] = {}
+    link = ""
+
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                # RSS: <link>url</link>
+                link = link or _element_text(child)
+            elif child.get("rel", "alternate") == "alternate" or not link:
+                link = href
+        elif name not in fields:
+            text = _element_text(child)
+            # Atom marks escaped HTML with type="html", RSS descriptions always are
+            if name == "description" or child.get("type", "").lower() in HTML_CONTENT_TYPES:
+                text = _sanitize_html(text)
+            fields[name] = text
+
+    summary = fields.get("summary") or fields.get("content") or fields.get("description", "")
+    published = _parse_datetime(
+        fields.get("published") or fields.get("updated") or fields.get("pubDate")
+    )
+
+    return FeedEntry(
+        title=fields.get("title", ""),
+        link=link,
+        summary=summary,
+        published=published,
+    )
+
+
+def _completed_entries(parser: ET.XMLPullParser) -> Iterator[ET.Element]:
+    """Get the entry elements completed since the last call.
+
+    Args:
+        parser: Pull parser reporting "end" events
+
+    Yields:
+        Completed ``<entry>`` or ``<item>`` elements
+    """
+    for _, element in parser.read_events():
+        if isinstance(element, ET.Element) and _local_name(element.tag) in ENTRY_TAGS:
+            yield element
+
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[FeedEntry]:
+    """Yield feed entries newest first while the feed is being read.
+
+    Args:
+        chunks: Feed body as an iterable of byte chunks
+
+    Yields:
+        Feed entries in document order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the feed is not well-formed XML
+    """
+    parser: ET.XMLPullParser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for element in _completed_entries(parser):
+            yield _entry_from_element(element)
+            element.clear()
+
+    parser.close()
+    for element in _completed_entries(parser):
+        yield _entry_from_element(element)
+
+
+def _struct_time_to_datetime(value: time.struct_time | None) -> datetime | None:
+    """Convert a feedparser struct_time (UTC) to datetime.
+
+    Args:
+        value: Parsed time tuple
+
+    Returns:
+        Datetime in UTC or None
+    """
+    if not value:
+        return None
+    return datetime(*value[:6], tzinfo=UTC)
+
+
+def _iter_feedparser_entries(content: bytes) -> Iterator[FeedEntry]:
+    """Yield feed entries using feedparser (fallback for malformed feeds).
+
+    Args:
+        content: Complete feed body
+
+    Yields:
+        Feed entries in document order
+    """
+    import feedparser
+
+    feed = feedparser.parse(content)
+    for entry in feed.entries:
+        published = _struct_time_to_datetime(
+            entry.get("published_parsed")
+        ) or _struct_time_to_datetime(entry.get("updated_parsed"))
+        yield FeedEntry(
+            title=entry.get("title", ""),
+            link=entry.get("link", ""),
+            summary=entry.get("summary", ""),
+            published=published,
+        )
+
+
+def read_feed_entries(response: httpx.Response) -> Iterator[FeedEntry]:
+    """Yield entries from a streaming feed response.
+
+    The body is only read as far as the caller consumes entries. If the feed
+    turns out not to be well-formed XML, the rest of the body is read and the
+    remaining entries come from feedparser instead.
+
+    Args:
+        response: Streaming HTTP response with an unread body
+
+    Yields:
+        Feed entries in document order
+    """
+    stream = response.iter_bytes()
+    consumed: list[bytes] = []
+
+    def record(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    yielded = 0
+    try:
+        for entry in iter_feed_entries(record(stream)):
+            yielded += 1
+            yield entry
+    except ET.ParseError as e:
+        print(f"  ⚠️  Malformed feed, falling back to feedparser: {e}")
+        content = b"".join(consumed) + b"".join(stream)
+        for index, entry in enumerate(_iter_feedparser_entries(content)):
+            if index >= yielded:
+                yield entry
@@ -1,11 +1,9 @@
 """GitHub Commits source for release information."""
 
-import time
 from datetime import UTC, datetime
 
-import feedparser
-
 from devtools_release_notifier.sources.base import ReleaseSource
+from devtools_release_notifier.sources.feed import read_feed_entries
 
 
 class GitHubCommitsSource(ReleaseSource):
@@ -23,31 +21,30 @@ def fetch_latest_version(self) -> dict | None:
             return None
 
         try:
-            feed = feedparser.parse(atom_url)
-            if not feed.entries:
-                print("✗ GitHub Commits: No entries found")
-                return None
+            with self._stream(atom_url) as response:
+                cached_result = self._not_modified_result(atom_url, response)
+                if cached_result:
+                    return cached_result
+                response.raise_for_status()
 
-            latest = feed.entries[0]
+                # Only the newest entry is needed; stop reading after it
+                with self.metrics.timer("parse"):
+                    latest = next(read_feed_entries(response), None)
 
-            # Try to get published time, fallback to updated time or current time
-            published_time = None
-            if hasattr(latest, "published_parsed") and latest.published_parsed:
-                parsed_time: time.struct_time = latest.published_parsed  # type: ignore[assignment]
-                published_time = datetime(*parsed_time[:6], tzinfo=UTC)
-            elif hasattr(latest, "updated_parsed") and latest.updated_parsed:
-                updated_time: time.struct_time = latest.updated_parsed  # type: ignore[assignment]
-                published_time = datetime(*updated_time[:6], tzinfo=UTC)
-            else:
-                published_time = datetime.now(UTC)
+            if not latest:
+                print("✗ GitHub Commits: No entries found")
+                return None
 
-            return {
+            # Published time falls back to updated time, then current time
+            result = {
                 "version": latest.title,
                 "content": latest.summary,
                 "url": latest.link,
-                "published": published_time,
+                "published": latest.published or datetime.now(UTC),
                 "source": "github_commits",
             }
+            self._remember(atom_url, response, result)
+            return result
         except Exception as e:
             print(f"✗ GitHub Commits: Failed to fetch - {e}")
             return None
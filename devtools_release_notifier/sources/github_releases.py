@@ -1,21 +1,44 @@
 """GitHub Releases source for release information."""
 
-import time
 from datetime import UTC, datetime
 
-import feedparser
-
-from devtools_release_notifier.sources.base import ReleaseSource
+from devtools_release_notifier.sources.base import ReleaseSource, collect_until
+from devtools_release_notifier.sources.feed import FeedEntry, read_feed_entries
 
 
 class GitHubReleaseSource(ReleaseSource):
     """Fetch release information from GitHub Releases Atom feed."""
 
-    def fetch_latest_version(self) -> dict | None:
-        """Fetch latest release from GitHub Releases.
+    def _entry_result(self, entry: FeedEntry) -> dict:
+        """Build release information from a feed entry.
+
+        Args:
+            entry: Feed entry
 
         Returns:
-            Dictionary with version, content, url, published, source or None if failed
+            Dictionary with version, content, url, published, source
+        """
+        # Published time falls back to updated time, then current time
+        return {
+            "version": entry.title,
+            "content": entry.summary,
+            "url": entry.link,
+            "published": entry.published or datetime.now(UTC),
+            "source": "github_releases",
+        }
+
+    def fetch_releases(self, known_version: str | None = None) -> list[dict] | None:
+        """Fetch releases from GitHub Releases down to a known version.
+
+        Entries are read newest first while the feed downloads, and reading
+        stops at the known version.
+
+        Args:
+            known_version: Version seen on the previous check
+
+        Returns:
+            Releases newest first, ending with the known version if it was
+            reached, or None if failed
         """
         atom_url = self.config.get("atom_url")
         if not atom_url:
@@ -23,31 +46,32 @@ def fetch_latest_version(self) -> dict | None:
             return None
 
         try:
-            feed = feedparser.parse(atom_url)
-            if not feed.entries:
+            with self._stream(atom_url) as response:
+                cached_result = self._not_modified_result(atom_url, response)
+                if cached_result:
+                    return [cached_result]
+                response.raise_for_status()
+
+                with self.metrics.timer("parse"):
+                    releases = collect_until(
+                        map(self._entry_result, read_feed_entries(response)), known_version
+                    )
+
+            if not releases:
                 print("✗ GitHub Releases: No entries found")
                 return None
 
-            latest = feed.entries[0]
-
-            # Try to get published time, fallback to updated time or current time
-            published_time = None
-            if hasattr(latest, "published_parsed") and latest.published_parsed:
-                parsed_time: time.struct_time = latest.published_parsed  # type: ignore[assignment]
-                published_time = datetime(*parsed_time[:6], tzinfo=UTC)
-            elif hasattr(latest, "updated_parsed") and latest.updated_parsed:
-                updated_time: time.struct_time = latest.updated_parsed  # type: ignore[assignment]
-                published_time = datetime(*updated_time[:6], tzinfo=UTC)
-            else:
-                published_time = datetime.now(UTC)
-
-            return {
-                "version": latest.title,
-                "content": latest.summary,
-                "url": latest.link,
-                "published": published_time,
-                "source": "github_releases",
-            }
+            self._remember(atom_url, response, releases[0])
+            return releases
         except Exception as e:
             print(f"✗ GitHub Releases: Failed to fetch - {e}")
             return None
+
+    def fetch_latest_version(self) -> dict | None:
+        """Fetch latest release from GitHub Releases.
+
+        Returns:
+            Dictionary with version, content, url, published, source or None if failed
+        """
+        releases = self.fetch_releases()
+        return releases[0] if releases else None
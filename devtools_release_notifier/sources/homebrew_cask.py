@@ -1,16 +1,94 @@
 """Homebrew Cask source for release information."""
 
+import threading
 from datetime import UTC, datetime
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 import httpx
 
+from devtools_release_notifier.http_cache import HttpCache
+from devtools_release_notifier.metrics import Metrics
 from devtools_release_notifier.sources.base import ReleaseSource
 from devtools_release_notifier.templates import render_template
 
+if TYPE_CHECKING:
+    from devtools_release_notifier.sources.homebrew_index import HomebrewCaskIndex
+
 
 class HomebrewCaskSource(ReleaseSource):
     """Fetch release information from Homebrew Cask JSON API."""
 
+    def __init__(
+        self,
+        config: dict,
+        client: httpx.Client | None = None,
+        http_cache: HttpCache | None = None,
+        cask_index: HomebrewCaskIndex | None = None,
+        metrics: Metrics | None = None,
+        cancel: threading.Event | None = None,
+    ):
+        """Initialize with configuration.
+
+        Args:
+            config: Configuration dictionary for this source
+            client: Shared HTTP client (a private client is created if omitted)
+            http_cache: Conditional request cache (requests are unconditional if omitted)
+            cask_index: Bulk cask index (per-cask API requests are made if omitted)
+            metrics: Metrics to record request timings in (disabled if omitted)
+            cancel: Set once the fetch is no longer needed
+        """
+        super().__init__(config, client, http_cache, metrics, cancel)
+        self.cask_index = cask_index
+
+    def _build_result(self, data: dict) -> dict | None:
+        """Build release information from a cask entry.
+
+        Args:
+            data: Cask entry from the per-cask API or the bulk index
+
+        Returns:
+            Dictionary with version info or None if version is missing
+        """
+        version = data.get("version")
+        homepage = data.get("homepage")
+        download_url = data.get("url")
+
+        if not version:
+            print("✗ Homebrew Cask: version not found in response")
+            return None
+
+        # Generate installation information
+        token = data.get("token", "unknown")
+        content = render_template(t"Version: {version}\n")
+        if download_url:
+            content += render_template(t"Download: {download_url}\n")
+        content += render_template(t"Install: `brew install --cask {token}`")
+
+        return {
+            "version": version,
+            "content": content,
+            "url": homepage or "",
+            "download_url": download_url or "",
+            "published": datetime.now(UTC),
+            "source": "homebrew_cask",
+        }
+
+    def _lookup_index(self, api_url: str) -> dict | None:
+        """Look up this cask in the bulk index.
+
+        Args:
+            api_url: Per-cask API URL (e.g. .../api/cask/zed.json)
+
+        Returns:
+            Cask entry or None if no index is configured or the cask is missing
+        """
+        if not self.cask_index:
+            return None
+        token = PurePosixPath(urlparse(api_url).path).stem
+        return self.cask_index.get(token)
+
     def fetch_latest_version(self) -> dict | None:
         """Fetch latest version from Homebrew Cask.
 
@@ -24,33 +102,21 @@ def fetch_latest_version(self) -> dict | None:
             return None
 
         try:
-            response = httpx.get(api_url, timeout=10.0)
+            entry = self._lookup_index(api_url)
+            if entry:
+                return self._build_result(entry)
+
+            response = self._get(api_url)
+            cached_result = self._not_modified_result(api_url, response)
+            if cached_result:
+                return cached_result
             response.raise_for_status()
-            data = response.json()
-
-            version = data.get("version")
-            homepage = data.get("homepage")
-            download_url = data.get("url")
-
-            if not version:
-                print("✗ Homebrew Cask: version not found in response")
-                return None
-
-            # Generate installation information
-            token = data.get("token", "unknown")
-            content = render_template(t"Version: {version}\n")
-            if download_url:
-                content += render_template(t"Download: {download_url}\n")
-            content += render_template(t"Install: `brew install --cask {token}`")
-
-            return {
-                "version": version,
-                "content": content,
-                "url": homepage or "",
-                "download_url": download_url or "",
-                "published": datetime.now(UTC),
-                "source": "homebrew_cask",
-            }
+
+            with self.metrics.timer("parse"):
+                result = self._build_result(response.json())
+            if result:
+                self._remember(api_url, response, result)
+            return result
         except httpx.HTTPError as e:
             print(f"✗ Homebrew Cask: HTTP error - {e}")
             return None
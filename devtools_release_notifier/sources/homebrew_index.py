@@ -0,0 +1,179 @@
+"""Bulk Homebrew Cask index shared by all Homebrew sources."""
+
+import gzip
+import json
+import os
+import threading
+from pathlib import Path
+
+import httpx
+
+from devtools_release_notifier.metrics import NULL_METRICS, Metrics, url_host
+
+HOMEBREW_INDEX_FILENAME = "homebrew_cask_index.json.gz"
+
+# Fields of a cask entry used by HomebrewCaskSource
+CASK_FIELDS = ("token", "version", "homepage", "url")
+
+
+def _build_index(casks: list[dict]) -> dict[str, dict]:
+    """Build a token to cask entry mapping, keeping only the fields we use.
+
+    Args:
+        casks: Cask entries from the bulk API
+
+    Returns:
+        Mapping of cask token to reduced cask entry
+    """
+    return {
+        cask["token"]: {field: cask.get(field) for field in CASK_FIELDS}
+        for cask in casks
+        if isinstance(cask, dict) and cask.get("token")
+    }
+
+
+class HomebrewCaskIndex:
+    """Token to cask entry index built from a single bulk cask API download.
+
+    The index is loaded lazily on first lookup, at most once per instance.
+    A compact local copy is kept next to the other caches and revalidated
+    with ETag / Last-Modified, so unchanged indexes cost one 304 response.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        index_url: str,
+        local_path: str | Path | None = None,
+        index_file: str | Path | None = None,
+        metrics: Metrics | None = None,
+    ):
+        """Initialize index.
+
+        Args:
+            client: Shared HTTP client
+            index_url: Bulk cask API URL
+            local_path: Path of the local index copy (not persisted if omitted)
+            index_file: Local file in bulk API format used instead of the network
+            metrics: Metrics to record download timings in (disabled if omitted)
+        """
+        self.client = client
+        self.index_url = index_url
+        self.local_path = Path(local_path) if local_path else None
+        self.index_file = Path(index_file) if index_file else None
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self._lock = threading.Lock()
+        self._casks: dict[str, dict] | None = None
+
+    def get(self, token: str) -> dict | None:
+        """Look up a cask by token.
+
+        Args:
+            token: Cask token (e.g. "zed")
+
+        Returns:
+            Cask entry or None if not in the index
+        """
+        with self._lock:
+            if self._casks is None:
+                self._casks = self._load()
+        return self._casks.get(token)
+
+    def _load(self) -> dict[str, dict]:
+        """Load the index from the fixture file or the bulk API.
+
+        Returns:
+            Mapping of cask token to cask entry (empty if unavailable)
+        """
+        if self.index_file:
+            try:
+                with open(self.index_file) as f:
+                    return _build_index(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Failed to read Homebrew index file: {e}")
+                return {}
+
+        return self._fetch()
+
+    def _fetch(self) -> dict[str, dict]:
+        """Download the bulk index, reusing the local copy if unchanged.
+
+        Returns:
+            Mapping of cask token to cask entry (empty if unavailable)
+        """
+        local = self._read_local()
+        headers = {}
+        if local.get("etag"):
+            headers["If-None-Match"] = local["etag"]
+        if local.get("last_modified"):
+            headers["If-Modified-Since"] = local["last_modified"]
+
+        host = url_host(self.index_url)
+        try:
+            with self.metrics.timer("fetch", source="homebrew_index", host=host):
+                response = self.client.get(self.index_url, headers=headers)
+            self.metrics.count(
+                "http_requests",
+                source="homebrew_index",
+                host=host,
+                status=str(response.status_code),
+            )
+            if response.status_code == httpx.codes.NOT_MODIFIED and "casks" in local:
+                print("  ✓ Homebrew index not modified since last check")
+                return local["casks"]
+            response.raise_for_status()
+            with self.metrics.timer("parse", source="homebrew_index"):
+                casks = _build_index(response.json())
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"⚠️  Failed to fetch Homebrew index: {e}")
+            return {}
+
+        self._write_local(
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "casks": casks,
+            }
+        )
+        return casks
+
+    def _read_local(self) -> dict:
+        """Read the local index copy.
+
+        Returns:
+            Stored index document or an empty dict
+        """
+        if not self.local_path or not self.local_path.exists():
+            return {}
+
+        try:
+            with gzip.open(self.local_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            print(f"⚠️  Failed to read local Homebrew index: {e}")
+            return {}
+
+    def _write_local(self, data: dict):
+        """Replace the local index copy atomically.
+
+        Like :func:`~devtools_release_notifier.cache_store.write_json_atomic`,
+        the file is written to a temporary sibling and renamed over the copy,
+        so an interrupted write never leaves a truncated archive behind.
+
+        Args:
+            data: Index document with validators and casks
+        """
+        if not self.local_path:
+            return
+
+        compressed = gzip.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        tmp_path = self.local_path.with_name(self.local_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.local_path)
+        except OSError as e:
+            print(f"⚠️  Failed to write local Homebrew index: {e}")
@@ -0,0 +1,136 @@
+"""Import-time profiling for the command line entry points.
+
+Imports are measured in a fresh interpreter with ``python -X importtime``,
+since by the time a command line option is parsed the entry point's own
+imports have already happened.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Entry points run as separate interpreters by the GitHub Actions workflow
+ENTRY_POINTS: dict[str, str] = {
+    "devtools-notifier": "devtools_release_notifier.notifier",
+    "send_to_discord": "devtools_release_notifier.scripts.send_to_discord",
+    "extract_claude_response": "devtools_release_notifier.scripts.extract_claude_response",
+}
+
+
+@dataclass
+class ImportTiming:
+    """Import time of one module.
+
+    Attributes:
+        module: Module name
+        self_us: Time spent in the module itself (microseconds)
+        cumulative_us: Time including the module's own imports (microseconds)
+        depth: Nesting level (0 for modules imported directly)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        output: Standard error of the profiled interpreter
+
+    Returns:
+        Timings in the order the imports finished
+    """
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        name = fields[2].rstrip()
+        indent = len(name) - len(name.lstrip())
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=max(indent - 1, 0) // 2,
+            )
+        )
+    return timings
+
+
+def profile_imports(modules: list[str]) -> list[ImportTiming]:
+    """Import modules in a fresh interpreter and collect their import times.
+
+    Args:
+        modules: Modules to import, in order
+
+    Returns:
+        Timings of all modules imported by them (interpreter startup excluded)
+
+    Raises:
+        RuntimeError: If the modules cannot be imported
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {', '.join(modules)}: {result.stderr.strip()}")
+
+    # Everything imported before the first requested module belongs to startup
+    timings = parse_importtime(result.stderr)
+    site_end = 0
+    for index, timing in enumerate(timings):
+        if timing.depth == 0 and timing.module == "site":
+            site_end = index + 1
+    return timings[site_end:]
+
+
+def format_profile(name: str, timings: list[ImportTiming], top: int = 15) -> str:
+    """Format import timings as a table of the slowest modules.
+
+    Args:
+        name: Entry point name
+        timings: Timings from :func:`profile_imports`
+        top: Number of modules to list
+
+    Returns:
+        Report text
+    """
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [
+        f"{name}: {total_us / 1000:.1f} ms in {len(timings)} modules",
+        f"  {'self':>10}  {'cumulative':>10}  module",
+    ]
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(
+            f"  {timing.self_us / 1000:>7.1f} ms  {timing.cumulative_us / 1000:>7.1f} ms  "
+            f"{timing.module}"
+        )
+    return "\n".join(lines)
+
+
+def print_startup_profile(notifier_modules: list[str], top: int = 15):
+    """Print import time per module for every entry point.
+
+    Args:
+        notifier_modules: Modules the notifier imports lazily for the current
+            configuration (e.g. the configured source types)
+        top: Number of modules listed per entry point
+    """
+    print("⏱️  Startup import profile (python -X importtime)\n")
+    for name, module in ENTRY_POINTS.items():
+        modules = [module]
+        if name == "devtools-notifier":
+            modules += notifier_modules
+        print(format_profile(name, profile_imports(modules), top))
+        print()
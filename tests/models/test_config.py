@@ -4,6 +4,7 @@
 from pydantic import ValidationError
 
 from devtools_release_notifier.models.config import (
+    AdaptivePollingConfig,
     AppConfig,
     CommonConfig,
     GitHubCommitsSourceConfig,
@@ -17,6 +18,7 @@
 MIN_PRIORITY = 1
 DEFAULT_CHECK_INTERVAL_HOURS = 6
 DEFAULT_CACHE_DIRECTORY = "./cache"
+DEFAULT_MAX_CONCURRENCY = 8
 DEFAULT_WEBHOOK_ENV = "DISCORD_WEBHOOK"
 MIN_COLOR = 0
 MAX_COLOR = 16777215
@@ -158,6 +160,8 @@ def test_common_config_defaults():
     config = CommonConfig()
     assert config.check_interval_hours == DEFAULT_CHECK_INTERVAL_HOURS
     assert config.cache_directory == DEFAULT_CACHE_DIRECTORY
+    assert config.max_concurrency == DEFAULT_MAX_CONCURRENCY
+    assert config.source_strategy == "fallback"
 
 
 def test_common_config_custom_values():
@@ -177,6 +181,27 @@ def test_common_config_invalid_interval():
     assert "check_interval_hours" in str(exc_info.value)
 
 
+def test_common_config_invalid_source_strategy():
+    """Test CommonConfig with unknown source_strategy."""
+    with pytest.raises(ValidationError) as exc_info:
+        CommonConfig(source_strategy="parallel")
+    assert "source_strategy" in str(exc_info.value)
+
+
+def test_common_config_invalid_max_concurrency():
+    """Test CommonConfig with invalid max_concurrency."""
+    with pytest.raises(ValidationError) as exc_info:
+        CommonConfig(max_concurrency=0)
+    assert "max_concurrency" in str(exc_info.value)
+
+
+def test_adaptive_polling_config_invalid_bounds():
+    """Test AdaptivePollingConfig with a floor above the ceiling."""
+    with pytest.raises(ValidationError) as exc_info:
+        AdaptivePollingConfig(min_interval_hours=48, max_interval_hours=24)
+    assert "min_interval_hours must not exceed max_interval_hours" in str(exc_info.value)
+
+
 def test_app_config_valid():
     """Test AppConfig with valid data."""
     config = AppConfig(
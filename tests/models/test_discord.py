@@ -6,9 +6,12 @@
 from pydantic import ValidationError
 
 from devtools_release_notifier.models.discord import (
+    EMBED_TITLE_LIMIT,
+    EMBEDS_PER_MESSAGE,
     DiscordEmbed,
     DiscordEmbedFooter,
     DiscordWebhookPayload,
+    ReleaseNotification,
 )
 
 # Constants
@@ -152,3 +155,77 @@ def test_create_release_notification_timestamp_format():
     # Verify timestamp can be parsed as ISO 8601
     timestamp = datetime.fromisoformat(embed.timestamp.replace("Z", "+00:00"))
     assert isinstance(timestamp, datetime)
+
+
+def _embed(description: str = "Notes", title: str = "Title") -> DiscordEmbed:
+    return DiscordEmbed(
+        title=title,
+        description=description,
+        url="https://example.com",
+        color=VALID_COLOR,
+        timestamp="2025-01-01T00:00:00Z",
+    )
+
+
+def test_create_release_truncates_title():
+    """Test that release embed titles are cut to Discord's title limit."""
+    embed = DiscordEmbed.create_release(
+        tool_name="T" * 300,
+        version="v1.0.0",
+        content="Notes",
+        url="https://example.com",
+        color=VALID_COLOR,
+    )
+
+    assert len(embed.title) == EMBED_TITLE_LIMIT
+
+
+def test_character_count():
+    """Test counting characters toward the per-message limit."""
+    embed = _embed(description="A" * 100, title="B" * 10)
+    embed.footer = DiscordEmbedFooter(text="C" * 5)
+
+    assert embed.character_count() == 115
+
+
+def test_pack_by_embed_count():
+    """Test that payloads hold at most 10 embeds and keep order."""
+    embeds = [_embed(description=str(i)) for i in range(25)]
+
+    payloads = DiscordWebhookPayload.pack(embeds)
+
+    assert [len(p.embeds) for p in payloads] == [EMBEDS_PER_MESSAGE, EMBEDS_PER_MESSAGE, 5]
+    assert [e.description for p in payloads for e in p.embeds] == [str(i) for i in range(25)]
+
+
+def test_pack_by_character_limit():
+    """Test that payloads stay within the combined character limit."""
+    embeds = [_embed(description="A" * CONTENT_MAX_LENGTH) for _ in range(3)]
+    embeds.insert(1, _embed(description="short"))
+
+    payloads = DiscordWebhookPayload.pack(embeds)
+
+    assert [len(p.embeds) for p in payloads] == [2, 1, 1]
+    assert all(sum(e.character_count() for e in p.embeds) <= 6000 for p in payloads)
+
+
+def test_pack_empty():
+    """Test packing no embeds."""
+    assert DiscordWebhookPayload.pack([]) == []
+
+
+def test_release_notification_to_embed():
+    """Test building an embed from a release notification."""
+    notification = ReleaseNotification(
+        webhook_url="https://discord.com/api/webhooks/123/abc",
+        tool_name="Zed Editor",
+        version="v0.100.0",
+        content="Notes",
+        url="https://example.com",
+        color=VALID_COLOR,
+    )
+
+    embed = notification.to_embed()
+
+    assert embed.title == "🚀 Zed Editor - v0.100.0"
+    assert embed.description == "Notes"
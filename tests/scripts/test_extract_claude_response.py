@@ -104,6 +104,24 @@ def test_invalid_json_skipped():
     assert data[0]["tool_name"] == "Valid"
 
 
+def test_nested_array_returns_outer_translation():
+    """Test that an inner array of objects does not hide the enclosing translation."""
+    text = '[{"tool_name": "Outer", "translated_content": "Content", "notes": [{"kind": "inner"}]}]'
+    result = extract_json_from_text(text)
+    assert result == text
+
+
+def test_bracket_heavy_text_after_translation():
+    """Test that unrelated and unterminated arrays after the translation are skipped."""
+    translation = '[{"tool_name": "Zed", "translated_content": "内容"}]'
+    text = (
+        f"Answer:\n{translation}\n"
+        'Tool output: [[1, 2], [3]] [{"path": "a.py"}] [{"unterminated": '
+    )
+    result = extract_json_from_text(text)
+    assert result == translation
+
+
 def test_extract_from_array_format_result_type(tmp_path: Path):
     """Test extracting from array format with type='result'."""
     execution_file = tmp_path / "execution.json"
@@ -163,6 +181,120 @@ def test_extract_from_array_format_assistant_string_content(tmp_path: Path):
     assert parsed[0]["tool_name"] == "Test Tool"
 
 
+def test_extract_from_json_lines(tmp_path: Path):
+    """Test extracting from a JSON-lines (stream-json) execution file."""
+    execution_file = tmp_path / "execution.jsonl"
+    lines = [
+        {"type": "system", "subtype": "init"},
+        {"type": "result", "result": '[{"tool_name": "Ghostty", "translated_content": "内容"}]'},
+        {"type": "user", "message": {"content": "done"}},
+    ]
+    execution_file.write_text("\n".join(json.dumps(line, ensure_ascii=False) for line in lines))
+
+    result = extract_claude_response(str(execution_file))
+    assert json.loads(result)[0]["tool_name"] == "Ghostty"
+
+
+def test_json_lines_without_translation(tmp_path: Path):
+    """Test error when a JSON-lines file holds no translation."""
+    execution_file = tmp_path / "execution.jsonl"
+    execution_file.write_text('{"type": "system"}\n{"type": "result", "result": "none"}\n')
+
+    with pytest.raises(ValueError, match="Could not find translated JSON"):
+        extract_claude_response(str(execution_file))
+
+
+def _forbid_full_parse(monkeypatch):
+    def fail_load(*args, **kwargs):
+        raise AssertionError("the whole file should not be parsed")
+
+    monkeypatch.setattr(json, "load", fail_load)
+
+
+def test_array_format_read_from_end(tmp_path: Path, monkeypatch):
+    """Test that a large array file is answered without parsing it whole."""
+    execution_file = tmp_path / "execution.json"
+    filler = {"type": "user", "message": {"content": [{"type": "text", "text": "{x} " * 50_000}]}}
+    answer = [{"tool_name": "Zed Editor", "translated_content": "長い内容 " * 20_000}]
+    data = [filler, filler, {"type": "result", "result": json.dumps(answer, ensure_ascii=False)}]
+    execution_file.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+
+    _forbid_full_parse(monkeypatch)
+
+    result = extract_claude_response(str(execution_file))
+    assert json.loads(result) == answer
+
+
+def test_array_format_answer_before_tool_items(tmp_path: Path, monkeypatch):
+    """Test that items after the answer are stepped over, not parsed whole."""
+    execution_file = tmp_path / "execution.json"
+    answer = [{"tool_name": "Zed Editor", "translated_content": "内容 [{}]"}]
+    tricky = ['quote \\" and }{][', "ends with a backslash \\", '{"type": "result"}', "x" * 70_000]
+    tool_items = [
+        {
+            "type": "user",
+            "message": {"content": [{"type": "tool_result", "content": text, "lines": [[i], {}]}]},
+        }
+        for i, text in enumerate(tricky * 50)
+    ]
+    data = [
+        {"type": "system", "subtype": "init"},
+        {"type": "assistant", "message": {"content": json.dumps(answer, ensure_ascii=False)}},
+        *tool_items,
+    ]
+    execution_file.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+    _forbid_full_parse(monkeypatch)
+
+    result = extract_claude_response(str(execution_file))
+    assert json.loads(result) == answer
+
+
+def test_array_format_without_translation(tmp_path: Path, monkeypatch):
+    """Test error when no array item holds a translation, without a full parse."""
+    execution_file = tmp_path / "execution.json"
+    data = [
+        {"type": "result", "result": "none"},
+        {"type": "assistant", "message": {"content": "[]"}},
+    ]
+    execution_file.write_text(json.dumps(data))
+    _forbid_full_parse(monkeypatch)
+
+    with pytest.raises(ValueError, match="Could not find translated JSON"):
+        extract_claude_response(str(execution_file))
+
+
+def test_array_format_deeply_nested_item(tmp_path: Path, monkeypatch):
+    """Test that the full parse finds the answer behind a deeply nested item.
+
+    Items read from the end before the nested one are not examined again.
+    """
+    execution_file = tmp_path / "execution.json"
+    nested: object = "leaf"
+    for _ in range(40):
+        nested = {"child": [nested]}
+    answer = [{"tool_name": "Ghostty", "translated_content": "内容"}]
+    data = [
+        {"type": "result", "result": json.dumps(answer)},
+        {"type": "user", "nested": nested},
+        {"type": "assistant", "message": {"content": "No answer here"}},
+    ]
+    execution_file.write_text(json.dumps(data))
+    texts: list[str] = []
+
+    def record_text(text: str) -> str | None:
+        texts.append(text)
+        return extract_json_from_text(text)
+
+    monkeypatch.setattr(
+        "devtools_release_notifier.scripts.extract_claude_response.extract_json_from_text",
+        record_text,
+    )
+
+    result = extract_claude_response(str(execution_file))
+    assert json.loads(result) == answer
+    assert texts.count("No answer here") == 1
+
+
 def test_extract_from_dict_format_direct_field(tmp_path: Path):
     """Test extracting from dict format with direct 'response' field."""
     execution_file = tmp_path / "execution.json"
@@ -11,11 +11,13 @@
 
 from devtools_release_notifier.scripts.send_to_discord import (
     _escape_yaml_string,
+    _load_releases,
     _send_notifications,
     _slugify_tool_name,
     main,
     save_markdown_log,
     send_to_discord,
+    update_releases_index,
 )
 
 # Constants
@@ -342,6 +344,26 @@ def test_main_translated_data_not_list(tmp_path: Path, monkeypatch):
     assert exc_info.value.code == 1
 
 
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("{not json", "Error loading releases file"),
+        ('{"not": "a list"}', "Releases data must be a JSON array"),
+        ('[{"tool_name": "Zed"}]', "Invalid releases data format"),
+    ],
+)
+def test_load_releases_errors(tmp_path: Path, capsys, content: str, message: str):
+    """Test _load_releases reports invalid JSON, non-arrays and invalid items distinctly."""
+    releases_file = tmp_path / "releases.json"
+    releases_file.write_text(content)
+
+    with pytest.raises(SystemExit) as exc_info:
+        _load_releases(str(releases_file))
+
+    assert exc_info.value.code == 1
+    assert message in capsys.readouterr().err
+
+
 @respx.mock
 def test_main_fallback_to_original_content(tmp_path: Path, monkeypatch):
     """Test main function falls back to original content when translation is missing."""
@@ -742,6 +764,102 @@ def test_send_notifications_no_markdown_on_discord_failure(tmp_path: Path):
         os.environ.update(original_env)
 
 
+@respx.mock
+def test_send_notifications_batch(tmp_path: Path, monkeypatch):
+    """Test _send_notifications packs releases into one message per webhook."""
+    from devtools_release_notifier.models.output import ReleaseOutput
+
+    webhook = respx.post(WEBHOOK_URL).mock(return_value=httpx.Response(204))
+    monkeypatch.setenv("TEST_WEBHOOK", WEBHOOK_URL)
+    monkeypatch.delenv("MISSING_WEBHOOK", raising=False)
+
+    releases = [
+        ReleaseOutput(
+            tool_name=name,
+            version="v1.0.0",
+            content="Original content",
+            url="https://github.com/test",
+            color=VALID_COLOR,
+            webhook_env=env,
+        )
+        for name, env in [
+            ("Zed Editor", "TEST_WEBHOOK"),
+            ("Ghostty", "MISSING_WEBHOOK"),
+            ("Claude Code", "TEST_WEBHOOK"),
+        ]
+    ]
+    translated_map = {"Zed Editor": "## 翻訳された内容"}
+    markdown_dir = tmp_path / "releases"
+
+    success, failed, skipped = _send_notifications(
+        releases, translated_map, markdown_dir=str(markdown_dir), batch=True
+    )
+
+    assert (success, failed, skipped) == (2, 0, 1)
+    assert webhook.call_count == 1
+    embeds = json.loads(webhook.calls[0].request.content)["embeds"]
+    assert [e["description"] for e in embeds] == ["## 翻訳された内容", "Original content"]
+    assert (markdown_dir / "zed-editor").exists()
+    assert (markdown_dir / "claude-code").exists()
+
+
+@respx.mock
+def test_send_notifications_outbox_retries_failures(tmp_path: Path, monkeypatch):
+    """Test _send_notifications keeps failed releases in the outbox and retries them."""
+    from devtools_release_notifier.models.output import ReleaseOutput
+
+    webhook = respx.post(WEBHOOK_URL).mock(side_effect=[httpx.Response(500), httpx.Response(204)])
+    monkeypatch.setenv("TEST_WEBHOOK", WEBHOOK_URL)
+
+    release = ReleaseOutput(
+        tool_name="Zed Editor",
+        version="v1.0.0",
+        content="Original content",
+        url="https://github.com/test",
+        color=VALID_COLOR,
+        webhook_env="TEST_WEBHOOK",
+    )
+    outbox_path = tmp_path / "outbox.json"
+    markdown_dir = tmp_path / "releases"
+
+    result = _send_notifications(
+        [release],
+        {"Zed Editor": "## 翻訳"},
+        markdown_dir=str(markdown_dir),
+        outbox_path=str(outbox_path),
+    )
+
+    assert result == (0, 1, 0)
+    entries = json.loads(outbox_path.read_text())
+    assert entries[0]["release"]["content"] == "## 翻訳"
+    assert WEBHOOK_URL not in outbox_path.read_text()
+    assert not markdown_dir.exists()
+
+    # Make the retry due; the translated content is sent without new releases
+    entries[0]["next_attempt_at"] = "2000-01-01T00:00:00Z"
+    outbox_path.write_text(json.dumps(entries))
+
+    result = _send_notifications(
+        [], {}, markdown_dir=str(markdown_dir), outbox_path=str(outbox_path)
+    )
+
+    assert result == (1, 0, 0)
+    assert webhook.call_count == 2
+    assert "## 翻訳" in json.loads(webhook.calls[1].request.content)["embeds"][0]["description"]
+    assert not outbox_path.exists()
+    assert (markdown_dir / "zed-editor").exists()
+
+
+def test_main_requires_releases_without_outbox(monkeypatch):
+    """Test main rejects a run with neither a releases file nor --outbox."""
+    monkeypatch.setattr(sys, "argv", ["send_to_discord.py"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+
+
 @respx.mock
 def test_main_with_markdown_dir_option(tmp_path: Path, monkeypatch):
     """Test main function with --markdown-dir option."""
@@ -794,6 +912,38 @@ def test_main_with_markdown_dir_option(tmp_path: Path, monkeypatch):
     assert "翻訳" in content
 
 
+def test_update_releases_index_after_save(tmp_path: Path):
+    """Test that the releases index includes logs saved through the manifest."""
+    markdown_dir = tmp_path / "releases"
+    save_markdown_log(
+        str(markdown_dir),
+        "Zed Editor",
+        "v1.0.0",
+        "内容",
+        "https://example.com/1",
+        datetime(2025, 1, 1, tzinfo=UTC),
+    )
+    assert update_releases_index(str(markdown_dir))
+    assert (markdown_dir / "_manifest.jsonl").exists()
+
+    save_markdown_log(
+        str(markdown_dir),
+        "Ghostty",
+        "v2.0.0",
+        "内容",
+        "https://example.com/2",
+        datetime(2025, 1, 2, tzinfo=UTC),
+    )
+    assert update_releases_index(str(markdown_dir))
+
+    index = (markdown_dir / "index.md").read_text(encoding="utf-8")
+    assert "- [Ghostty](./ghostty/index.md)" in index
+    assert index.index("### 2025-01-02") < index.index("### 2025-01-01")
+    assert "- [v2.0.0](./ghostty/2025-01-02.md)" in index
+    assert "- [v1.0.0](./zed-editor/2025-01-01.md)" in index
+    assert len((markdown_dir / "_manifest.jsonl").read_text().splitlines()) == 2
+
+
 def test_escape_yaml_string():
     """Test escaping double quotes in YAML strings."""
     # No quotes - unchanged
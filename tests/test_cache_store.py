@@ -0,0 +1,134 @@
+"""Tests for consolidated version cache."""
+
+import json
+from datetime import UTC, datetime
+
+from devtools_release_notifier.cache_store import CacheStore, legacy_cache_path
+
+
+def test_get_missing_tool(tmp_path):
+    """Test that unknown tools are not found."""
+    store = CacheStore(tmp_path)
+    assert store.get("Unknown Tool") is None
+
+
+def test_set_is_staged_until_commit(tmp_path):
+    """Test that updates are only written on commit."""
+    store = CacheStore(tmp_path)
+    store.set("Zed Editor", "v0.100.0")
+
+    cached = store.get("Zed Editor")
+    assert cached is not None
+    assert cached.version == "v0.100.0"
+    assert not store.path.exists()
+
+    store.commit()
+
+    with open(store.path) as f:
+        data = json.load(f)
+    assert data["Zed Editor"]["version"] == "v0.100.0"
+    assert not store.path.with_name(store.path.name + ".tmp").exists()
+
+
+def test_commit_and_reload(tmp_path):
+    """Test that committed entries are loaded by a new store."""
+    store = CacheStore(tmp_path)
+    store.set("Zed Editor", "v0.100.0")
+    store.set("Claude Code", "2.0.69")
+    store.commit()
+
+    reloaded = CacheStore(tmp_path)
+    zed = reloaded.get("Zed Editor")
+    claude = reloaded.get("Claude Code")
+    assert zed is not None
+    assert zed.version == "v0.100.0"
+    assert claude is not None
+    assert claude.version == "2.0.69"
+
+
+def test_set_records_release_times(tmp_path):
+    """Test that new versions after the first one record their detection time."""
+    store = CacheStore(tmp_path)
+    store.set("Zed Editor", "v0.100.0")
+    store.mark_checked("Zed Editor", datetime(2100, 1, 1, tzinfo=UTC))
+    store.set("Zed Editor", "v0.101.0")
+    store.set("Zed Editor", "v0.102.0")
+    store.commit()
+
+    cached = CacheStore(tmp_path).get("Zed Editor")
+    assert cached is not None
+    assert cached.version == "v0.102.0"
+    assert len(cached.release_times) == 2
+    assert cached.release_times[-1] == cached.timestamp
+    assert cached.checked_at == datetime(2100, 1, 1, tzinfo=UTC)
+
+
+def test_mark_checked_unknown_tool(tmp_path):
+    """Test that tools without a cached version are not marked as checked."""
+    store = CacheStore(tmp_path)
+    store.mark_checked("Zed Editor", datetime(2100, 1, 1, tzinfo=UTC))
+
+    assert store.get("Zed Editor") is None
+
+
+def test_commit_without_changes_does_not_write(tmp_path):
+    """Test that a clean store does not touch the disk."""
+    store = CacheStore(tmp_path)
+    store.commit()
+    assert not store.path.exists()
+
+
+def test_load_invalid_json(tmp_path):
+    """Test that a corrupt cache file is ignored."""
+    (tmp_path / "versions.json").write_text("{invalid json")
+
+    store = CacheStore(tmp_path)
+    assert store.get("Zed Editor") is None
+
+
+def test_migrate_legacy_files(tmp_path):
+    """Test one-shot migration from per-tool cache files."""
+    legacy_path = legacy_cache_path(tmp_path, "Zed Editor")
+    legacy_path.write_text(
+        json.dumps({"version": "v0.99.0", "timestamp": "2025-01-15T12:00:00+00:00"})
+    )
+
+    store = CacheStore(tmp_path)
+    store.migrate_legacy_files(["Zed Editor", "Raycast"])
+
+    cached = store.get("Zed Editor")
+    assert cached is not None
+    assert cached.version == "v0.99.0"
+    assert store.get("Raycast") is None
+
+    store.commit()
+
+    assert not legacy_path.exists()
+    migrated = CacheStore(tmp_path).get("Zed Editor")
+    assert migrated is not None
+    assert migrated.version == "v0.99.0"
+
+
+def test_migrate_keeps_existing_entries(tmp_path):
+    """Test that migration never overwrites entries already in the store."""
+    store = CacheStore(tmp_path)
+    store.set("Zed Editor", "v0.100.0")
+    store.commit()
+
+    legacy_cache_path(tmp_path, "Zed Editor").write_text(json.dumps({"version": "v0.99.0"}))
+
+    reloaded = CacheStore(tmp_path)
+    reloaded.migrate_legacy_files(["Zed Editor"])
+    cached = reloaded.get("Zed Editor")
+    assert cached is not None
+    assert cached.version == "v0.100.0"
+
+
+def test_migrate_invalid_legacy_file(tmp_path):
+    """Test that an unreadable legacy file is skipped."""
+    legacy_cache_path(tmp_path, "Zed Editor").write_text("{invalid json")
+
+    store = CacheStore(tmp_path)
+    store.migrate_legacy_files(["Zed Editor"])
+
+    assert store.get("Zed Editor") is None
@@ -0,0 +1,54 @@
+"""Tests for cadence-based check intervals."""
+
+from datetime import UTC, datetime, timedelta
+
+from devtools_release_notifier.cadence import (
+    CADENCE_HISTORY,
+    CHECKS_PER_RELEASE,
+    cadence_interval,
+    record_release,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+FLOOR = timedelta(hours=1)
+CEILING = timedelta(days=7)
+
+
+def _times(*gaps: timedelta) -> list[datetime]:
+    times = [START]
+    for gap in gaps:
+        times.append(times[-1] + gap)
+    return times
+
+
+def test_unknown_cadence_uses_floor():
+    """Test that tools with fewer than two releases are checked as often as allowed."""
+    assert cadence_interval([], FLOOR, CEILING) == FLOOR
+    assert cadence_interval([START], FLOOR, CEILING) == FLOOR
+
+
+def test_interval_follows_median_gap():
+    """Test that the interval is a fraction of the median gap, ignoring outliers."""
+    day = timedelta(days=1)
+    times = _times(day, day, timedelta(minutes=5), day, timedelta(days=60))
+
+    assert cadence_interval(times, FLOOR, CEILING) == day / CHECKS_PER_RELEASE
+
+
+def test_interval_clamped():
+    """Test that the interval stays between the floor and the ceiling."""
+    hourly = _times(*[timedelta(hours=1)] * 5)
+    monthly = _times(*[timedelta(days=30)] * 5)
+
+    assert cadence_interval(hourly, FLOOR, CEILING) == FLOOR
+    assert cadence_interval(monthly, FLOOR, CEILING) == CEILING
+
+
+def test_record_release_keeps_latest():
+    """Test that only the latest CADENCE_HISTORY release times are kept."""
+    times: list[datetime] = []
+    for day in range(CADENCE_HISTORY + 3):
+        times = record_release(times, START + timedelta(days=day))
+
+    assert len(times) == CADENCE_HISTORY
+    assert times[-1] == START + timedelta(days=CADENCE_HISTORY + 2)
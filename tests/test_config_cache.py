@@ -0,0 +1,117 @@
+"""Tests for the compiled configuration cache."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from devtools_release_notifier import config_cache
+from devtools_release_notifier.config_cache import config_key, load_config
+
+CONFIG = {
+    "tools": [
+        {
+            "name": "Test Tool",
+            "sources": [
+                {
+                    "type": "homebrew_cask",
+                    "priority": 1,
+                    "api_url": "https://formulae.brew.sh/api/cask/test.json",
+                }
+            ],
+            "notification": {"webhook_env": "DISCORD_WEBHOOK", "color": 5814783},
+        }
+    ],
+    "common": {"check_interval_hours": 12},
+}
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "config.yml"
+    path.write_text(yaml.safe_dump(CONFIG))
+    return path
+
+
+def _fail_yaml(monkeypatch):
+    def fail_safe_load(stream):
+        raise AssertionError("config.yml should not be parsed")
+
+    monkeypatch.setattr(yaml, "safe_load", fail_safe_load)
+
+
+def test_load_config_without_cache(config_path: Path, tmp_path: Path):
+    """Test that no compiled file is written when the cache is disabled."""
+    config = load_config(config_path)
+
+    assert config.common.check_interval_hours == 12
+    assert list(tmp_path.iterdir()) == [config_path]
+
+
+def test_load_config_reuses_compiled(config_path: Path, tmp_path: Path, monkeypatch):
+    """Test that an unchanged configuration is loaded without parsing YAML."""
+    compiled_path = tmp_path / "cache" / "config.compiled.json"
+    config = load_config(config_path, compiled_path)
+    assert compiled_path.read_text().splitlines()[0] == config_key(config_path.read_bytes())
+
+    _fail_yaml(monkeypatch)
+
+    assert load_config(config_path, compiled_path) == config
+
+
+def test_load_config_recompiles_changed_file(config_path: Path, tmp_path: Path):
+    """Test that editing config.yml invalidates the compiled file."""
+    compiled_path = tmp_path / "config.compiled.json"
+    load_config(config_path, compiled_path)
+
+    config_path.write_text(config_path.read_text().replace("12", "24"))
+
+    assert load_config(config_path, compiled_path).common.check_interval_hours == 24
+    assert load_config(config_path, compiled_path).common.check_interval_hours == 24
+
+
+def test_load_config_recompiles_for_new_version(config_path: Path, tmp_path: Path, monkeypatch):
+    """Test that a different package version invalidates the compiled file."""
+    compiled_path = tmp_path / "config.compiled.json"
+    load_config(config_path, compiled_path)
+    monkeypatch.setattr(config_cache, "_package_version", lambda: "99.0.0")
+
+    load_config(config_path, compiled_path)
+
+    assert compiled_path.read_text().startswith("99.0.0:")
+
+
+def test_load_config_does_not_store_defaults(config_path: Path, tmp_path: Path):
+    """Test that omitted settings take their defaults from the running code."""
+    compiled_path = tmp_path / "config.compiled.json"
+    config = load_config(config_path, compiled_path)
+
+    compiled = compiled_path.read_text().splitlines()[1]
+    assert "check_jitter" not in compiled
+    assert "max_concurrency" not in compiled
+    assert load_config(config_path, compiled_path) == config
+
+
+def test_load_config_ignores_invalid_compiled(config_path: Path, tmp_path: Path, capsys):
+    """Test that a corrupt compiled file is replaced."""
+    compiled_path = tmp_path / "config.compiled.json"
+    compiled_path.write_text(config_key(config_path.read_bytes()) + "\n{not json\n")
+
+    config = load_config(config_path, compiled_path)
+
+    assert config.tools[0].name == "Test Tool"
+    assert "Ignoring invalid compiled config" in capsys.readouterr().out
+    assert compiled_path.read_text().splitlines()[1] == config.model_dump_json(exclude_unset=True)
+
+
+def test_load_config_invalid_is_not_compiled(tmp_path: Path):
+    """Test that an invalid configuration raises and leaves no compiled file."""
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(yaml.safe_dump({"tools": []}))
+    compiled_path = tmp_path / "config.compiled.json"
+
+    with pytest.raises(ValidationError):
+        load_config(config_path, compiled_path)
+
+    assert not compiled_path.exists()
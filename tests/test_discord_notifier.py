@@ -1,13 +1,28 @@
 """Tests for Discord notifier."""
 
+import json
+
 import httpx
 import respx
 
+from devtools_release_notifier.models.discord import ReleaseNotification
 from devtools_release_notifier.notifiers.discord import DiscordNotifier
 
 # Constants
 VALID_COLOR = 5814783
 WEBHOOK_URL = "https://discord.com/api/webhooks/123456/abcdef"
+OTHER_WEBHOOK_URL = "https://discord.com/api/webhooks/654321/fedcba"
+
+
+def _notification(tool_name: str, webhook_url: str = WEBHOOK_URL) -> ReleaseNotification:
+    return ReleaseNotification(
+        webhook_url=webhook_url,
+        tool_name=tool_name,
+        version="v1.0.0",
+        content=f"Notes for {tool_name}",
+        url="https://example.com",
+        color=VALID_COLOR,
+    )
 
 
 class TestDiscordNotifier:
@@ -93,3 +108,40 @@ def test_send_long_content(self):
         body = request.read().decode()
         # Content should be truncated to 4000 characters in the Discord payload
         assert '"description": "' + ("A" * 4000) + '"' in body or len(body) < 6000
+
+    @respx.mock
+    def test_send_batch_groups_by_webhook(self):
+        """Test that batched notifications are packed per webhook."""
+        main_route = respx.post(WEBHOOK_URL).mock(return_value=httpx.Response(204))
+        other_route = respx.post(OTHER_WEBHOOK_URL).mock(return_value=httpx.Response(204))
+
+        notifications = [_notification(f"Tool {i}") for i in range(12)]
+        notifications.insert(3, _notification("Other", OTHER_WEBHOOK_URL))
+
+        results = DiscordNotifier().send_batch(notifications)
+
+        assert results == [True] * 13
+        assert main_route.call_count == 2
+        assert other_route.call_count == 1
+
+        first, second = (json.loads(call.request.content) for call in main_route.calls)
+        assert len(first["embeds"]) == 10
+        assert len(second["embeds"]) == 2
+        assert first["embeds"][3]["title"] == "🚀 Tool 3 - v1.0.0"
+
+    @respx.mock
+    def test_send_batch_reports_per_release(self):
+        """Test that a failed message only fails the releases it carried."""
+        respx.post(WEBHOOK_URL).mock(
+            side_effect=[httpx.Response(500), httpx.Response(204)],
+        )
+
+        notifications = [_notification(f"Tool {i}") for i in range(11)]
+
+        results = DiscordNotifier().send_batch(notifications)
+
+        assert results == [False] * 10 + [True]
+
+    def test_send_batch_empty(self):
+        """Test that no requests are made without notifications."""
+        assert DiscordNotifier().send_batch([]) == []
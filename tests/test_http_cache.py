@@ -0,0 +1,84 @@
+"""Tests for conditional request cache."""
+
+import json
+from datetime import UTC, datetime
+
+import httpx
+
+from devtools_release_notifier.http_cache import HttpCache
+
+URL = "https://github.com/test/repo/releases.atom"
+RESULT = {
+    "version": "v1.0.0",
+    "content": "Release notes",
+    "url": "https://github.com/test/repo/releases/tag/v1.0.0",
+    "published": datetime(2025, 1, 15, 12, 0, 0, tzinfo=UTC),
+    "source": "github_releases",
+}
+
+
+def test_request_headers_empty_when_not_cached(tmp_path):
+    """Test that unknown URLs produce no conditional headers."""
+    cache = HttpCache(tmp_path / "http_cache.json")
+    assert cache.request_headers(URL) == {}
+    assert cache.result(URL) is None
+
+
+def test_store_and_request_headers(tmp_path):
+    """Test that stored validators become conditional request headers."""
+    cache = HttpCache(tmp_path / "http_cache.json")
+    response = httpx.Response(
+        200, headers={"ETag": 'W/"abc"', "Last-Modified": "Wed, 15 Jan 2025 12:00:00 GMT"}
+    )
+
+    cache.store(URL, response, RESULT)
+
+    assert cache.request_headers(URL) == {
+        "If-None-Match": 'W/"abc"',
+        "If-Modified-Since": "Wed, 15 Jan 2025 12:00:00 GMT",
+    }
+    assert cache.result(URL) == RESULT
+
+
+def test_store_without_validators_is_ignored(tmp_path):
+    """Test that responses without ETag or Last-Modified are not cached."""
+    cache = HttpCache(tmp_path / "http_cache.json")
+    cache.store(URL, httpx.Response(200), RESULT)
+    cache.save()
+
+    assert cache.result(URL) is None
+    assert not (tmp_path / "http_cache.json").exists()
+
+
+def test_save_and_reload(tmp_path):
+    """Test that entries survive a save and reload."""
+    path = tmp_path / "http_cache.json"
+    cache = HttpCache(path)
+    cache.store(URL, httpx.Response(200, headers={"ETag": '"v1"'}), RESULT)
+    cache.save()
+
+    reloaded = HttpCache(path)
+    assert reloaded.request_headers(URL) == {"If-None-Match": '"v1"'}
+    result = reloaded.result(URL)
+    assert result is not None
+    assert result["version"] == "v1.0.0"
+    assert result["published"] == "2025-01-15T12:00:00Z"
+    assert not path.with_name("http_cache.json.tmp").exists()
+
+
+def test_load_invalid_file(tmp_path):
+    """Test that a corrupt cache file is ignored."""
+    path = tmp_path / "http_cache.json"
+    path.write_text("{invalid json")
+
+    cache = HttpCache(path)
+    assert cache.result(URL) is None
+
+
+def test_load_invalid_entry(tmp_path):
+    """Test that a cache file with invalid structure is ignored."""
+    path = tmp_path / "http_cache.json"
+    path.write_text(json.dumps({URL: {"etag": '"v1"'}}))
+
+    cache = HttpCache(path)
+    assert cache.result(URL) is None
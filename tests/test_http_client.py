@@ -0,0 +1,23 @@
+"""Tests for shared HTTP client factory."""
+
+from devtools_release_notifier.http_client import USER_AGENT, create_http_client
+from devtools_release_notifier.models.config import HttpConfig
+
+
+def test_create_http_client_defaults():
+    """Test client creation with default configuration."""
+    with create_http_client() as client:
+        assert client.timeout.read == HttpConfig().timeout_seconds
+        assert client.follow_redirects is True
+        assert client.headers["User-Agent"] == USER_AGENT
+
+
+def test_create_http_client_custom_limits():
+    """Test that pool limits are taken from configuration."""
+    config = HttpConfig(timeout_seconds=5.0, max_connections=4, max_keepalive_connections=2)
+
+    with create_http_client(config) as client:
+        pool = client._transport._pool  # type: ignore[attr-defined]
+        assert client.timeout.read == 5.0
+        assert pool._max_connections == 4
+        assert pool._max_keepalive_connections == 2
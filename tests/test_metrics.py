@@ -0,0 +1,122 @@
+"""Tests for run instrumentation."""
+
+import json
+import threading
+
+from devtools_release_notifier.metrics import NULL_METRICS, Metrics, url_host
+
+
+def _find(records: list[dict], name: str, **labels) -> list[dict]:
+    return [
+        r
+        for r in records
+        if r["name"] == name and all(r["labels"].get(k) == v for k, v in labels.items())
+    ]
+
+
+def test_timer_records_phase_and_labels():
+    """Test that timers aggregate per phase and label set."""
+    metrics = Metrics()
+
+    for _ in range(3):
+        with metrics.timer("fetch", host="example.com"):
+            pass
+
+    [record] = metrics.records()
+    assert record["type"] == "timer"
+    assert record["labels"] == {"phase": "fetch", "host": "example.com"}
+    assert record["count"] == 3
+    assert record["sum"] >= record["max"] >= 0
+
+
+def test_bound_labels_apply_to_nested_measurements():
+    """Test that labels bound for a context reach timers and counters inside it."""
+    metrics = Metrics()
+
+    with metrics.labels(tool="Zed"), metrics.labels(source="homebrew_cask"):
+        with metrics.timer("parse"):
+            pass
+        metrics.count("http_requests", status="200")
+    metrics.count("http_requests", status="200")
+
+    records = metrics.records()
+    [timer] = _find(records, "phase_seconds")
+    assert timer["labels"] == {"phase": "parse", "tool": "Zed", "source": "homebrew_cask"}
+    assert len(_find(records, "http_requests", tool="Zed")) == 1
+    assert _find(records, "http_requests", status="200")[-1]["value"] == 1
+
+
+def test_bound_labels_are_per_thread():
+    """Test that labels bound in one thread do not leak into another."""
+    metrics = Metrics()
+    bound = threading.Event()
+    counted = threading.Event()
+
+    def worker():
+        with metrics.labels(tool="A"):
+            bound.set()
+            counted.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    bound.wait()
+    metrics.count("new_releases")
+    counted.set()
+    thread.join()
+
+    [record] = metrics.records()
+    assert "tool" not in record["labels"]
+
+
+def test_disabled_metrics_record_nothing():
+    """Test that a disabled instance is a no-op."""
+    with NULL_METRICS.labels(tool="Zed"), NULL_METRICS.timer("fetch"):
+        NULL_METRICS.count("http_requests")
+
+    assert NULL_METRICS.records() == []
+    assert NULL_METRICS.timer("fetch") is NULL_METRICS.timer("parse")
+
+
+def test_write_json_lines(tmp_path):
+    """Test JSON lines output."""
+    metrics = Metrics()
+    metrics.count("notifications", result="sent")
+    with metrics.timer("notify"):
+        pass
+
+    path = tmp_path / "metrics.jsonl"
+    metrics.write(path)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["type"] for r in records] == ["timer", "counter"]
+    assert records[1] == {
+        "type": "counter",
+        "name": "notifications",
+        "labels": {"result": "sent"},
+        "value": 1,
+    }
+
+
+def test_write_openmetrics(tmp_path):
+    """Test OpenMetrics text output."""
+    metrics = Metrics()
+    metrics.count("http_requests", host="example.com", status="304")
+    metrics.count("http_requests", host="example.com", status="200")
+    with metrics.timer("fetch", tool='Say "hi"'):
+        pass
+
+    path = tmp_path / "metrics.txt"
+    metrics.write(path, "openmetrics")
+    lines = path.read_text().splitlines()
+
+    assert lines[0] == "# TYPE devtools_notifier_phase_seconds summary"
+    assert 'devtools_notifier_phase_seconds_count{phase="fetch",tool="Say \\"hi\\""} 1' in lines
+    assert lines.count("# TYPE devtools_notifier_http_requests counter") == 1
+    assert 'devtools_notifier_http_requests_total{host="example.com",status="304"} 1' in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_url_host():
+    """Test host label extraction."""
+    assert url_host("https://github.com/zed-industries/zed/releases.atom") == "github.com"
+    assert url_host("not a url") == "unknown"
@@ -1,15 +1,33 @@
 """Tests for main notifier."""
 
+import argparse
+import asyncio
+import copy
 import json
+import subprocess
+import sys
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import httpx
+import pytest
 import respx
 import yaml
 
-from devtools_release_notifier.notifier import UnifiedReleaseNotifier
+from devtools_release_notifier.metrics import Metrics
+from devtools_release_notifier.models.discord import CONTENT_MAX_LENGTH
+from devtools_release_notifier.models.release import ReleaseInfo
+from devtools_release_notifier.notifier import (
+    UnifiedReleaseNotifier,
+    catch_up_content,
+    lazy_modules,
+    positive_int,
+)
 
 # Sample configuration
-SAMPLE_CONFIG = {
+SAMPLE_CONFIG: dict[str, Any] = {
     "tools": [
         {
             "name": "Test Tool",
@@ -68,6 +86,51 @@ def test_get_cache_path(self, tmp_path, monkeypatch):
         assert cache_path.name == "test_tool_version.json"
         assert cache_path.parent.name == "cache"
 
+    def test_get_source_shares_http_client(self, tmp_path, monkeypatch):
+        """Test that sources and the Discord notifier share the pooled client."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+
+        monkeypatch.chdir(tmp_path)
+
+        with UnifiedReleaseNotifier(str(config_file)) as notifier:
+            source = notifier.get_source(notifier.config.tools[0].sources[0])
+            assert source.client is notifier.http_client
+            assert notifier.discord_notifier.client is notifier.http_client
+
+        assert notifier.http_client.is_closed
+
+    @respx.mock
+    def test_run_with_homebrew_bulk_index(self, tmp_path, monkeypatch):
+        """Test that the bulk index replaces per-cask API requests."""
+        config = {
+            **SAMPLE_CONFIG,
+            "common": {
+                "cache_directory": "./cache",
+                "homebrew": {"bulk_index": True},
+            },
+        }
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+
+        monkeypatch.chdir(tmp_path)
+
+        index_route = respx.get("https://formulae.brew.sh/api/cask.json").mock(
+            return_value=httpx.Response(200, json=[HOMEBREW_RESPONSE])
+        )
+
+        output_file = tmp_path / "releases.json"
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        notifier.run(output_file=str(output_file), no_notify=True)
+
+        with open(output_file) as f:
+            releases = json.load(f)
+        assert releases[0]["version"] == "1.0.0"
+        assert index_route.call_count == 1
+        assert len(respx.calls) == 1
+
     def test_save_and_load_cached_version(self, tmp_path, monkeypatch):
         """Test saving and loading cached version."""
         config_file = tmp_path / "config.yml"
@@ -133,6 +196,34 @@ def test_run_with_new_release(self, tmp_path, monkeypatch):
         assert cached is not None
         assert cached.version == "1.0.0"
 
+        # Cache is committed to the consolidated store at the end of the run
+        with open(tmp_path / "cache" / "versions.json") as f:
+            assert json.load(f)["Test Tool"]["version"] == "1.0.0"
+
+        # The release is recorded in the history
+        record = notifier.history.get("Test Tool", "1.0.0")
+        assert record is not None
+        assert record.source == "homebrew_cask"
+        assert (tmp_path / "cache" / "history" / "test_tool.jsonl").exists()
+
+    def test_init_migrates_legacy_cache(self, tmp_path, monkeypatch):
+        """Test that legacy per-tool cache files are picked up on startup."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "test_tool_version.json").write_text(
+            json.dumps({"version": "0.9.0", "timestamp": "2025-01-15T12:00:00+00:00"})
+        )
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+
+        cached = notifier.load_cached_version("Test Tool")
+        assert cached is not None
+        assert cached.version == "0.9.0"
+
     @respx.mock
     def test_run_with_existing_version(self, tmp_path, monkeypatch):
         """Test run with existing version (no update)."""
@@ -159,10 +250,36 @@ def test_run_with_existing_version(self, tmp_path, monkeypatch):
         # Output file should not be created (no new releases)
         assert not output_file.exists()
 
+    @respx.mock
+    def test_run_not_modified_uses_http_cache(self, tmp_path, monkeypatch):
+        """Test that a second run sends validators and treats 304 as up to date."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+
+        monkeypatch.chdir(tmp_path)
+
+        route = respx.get("https://formulae.brew.sh/api/cask/test.json")
+        route.side_effect = [
+            httpx.Response(200, json=HOMEBREW_RESPONSE, headers={"ETag": '"abc"'}),
+            httpx.Response(304),
+        ]
+
+        UnifiedReleaseNotifier(str(config_file)).run(no_notify=True)
+        assert (tmp_path / "cache" / "http_cache.json").exists()
+
+        output_file = tmp_path / "releases.json"
+        UnifiedReleaseNotifier(str(config_file)).run(
+            output_file=str(output_file), no_notify=True, force=True
+        )
+
+        assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+        assert not output_file.exists()
+
     @respx.mock
     def test_process_tool_disabled(self, tmp_path, monkeypatch):
         """Test processing disabled tool."""
-        config = SAMPLE_CONFIG.copy()
+        config = copy.deepcopy(SAMPLE_CONFIG)
         config["tools"][0]["enabled"] = False
 
         config_file = tmp_path / "config.yml"
@@ -222,3 +339,637 @@ def test_process_tool_with_discord_notification(self, tmp_path, monkeypatch):
 
         # Verify Discord webhook was called
         assert len([call for call in respx.calls if "discord.com" in str(call.request.url)]) == 1
+
+    @respx.mock
+    def test_run_records_metrics(self, tmp_path, monkeypatch):
+        """Test that an enabled Metrics instance sees every phase of a run."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DISCORD_WEBHOOK", "https://discord.com/api/webhooks/123/abc")
+
+        respx.get("https://formulae.brew.sh/api/cask/test.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+        respx.post("https://discord.com/api/webhooks/123/abc").mock(
+            return_value=httpx.Response(204)
+        )
+
+        metrics = Metrics()
+        with UnifiedReleaseNotifier(str(config_file), metrics=metrics) as notifier:
+            notifier.run()
+
+        records = metrics.records()
+        phases = {r["labels"]["phase"] for r in records if r["type"] == "timer"}
+        assert phases == {"fetch", "parse", "validate", "cache", "notify", "run"}
+
+        [fetch] = [r for r in records if r["labels"].get("phase") == "fetch"]
+        assert fetch["labels"] == {
+            "phase": "fetch",
+            "tool": "Test Tool",
+            "source": "homebrew_cask",
+            "host": "formulae.brew.sh",
+        }
+        counters = {
+            (r["name"], tuple(sorted(r["labels"].items()))): r["value"]
+            for r in records
+            if r["type"] == "counter"
+        }
+        assert counters[("notifications", (("result", "sent"), ("tool", "Test Tool")))] == 1
+        assert counters[("new_releases", (("tool", "Test Tool"),))] == 1
+
+    @respx.mock
+    def test_run_concurrent_preserves_config_order(self, tmp_path, monkeypatch):
+        """Test that concurrent processing writes releases in configuration order."""
+        config = {
+            "tools": [
+                {
+                    "name": f"Tool {i}",
+                    "enabled": True,
+                    "sources": [
+                        {
+                            "type": "homebrew_cask",
+                            "priority": 1,
+                            "api_url": f"https://formulae.brew.sh/api/cask/tool{i}.json",
+                        }
+                    ],
+                    "notification": {"webhook_env": "DISCORD_WEBHOOK", "color": 5814783},
+                }
+                for i in range(5)
+            ],
+            "common": {"cache_directory": "./cache", "max_concurrency": 5},
+        }
+
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+
+        monkeypatch.chdir(tmp_path)
+
+        def slow_first(request):
+            # The first tool finishes last
+            if request.url.path.endswith("tool0.json"):
+                time.sleep(0.2)
+            return httpx.Response(200, json=HOMEBREW_RESPONSE)
+
+        respx.get(url__startswith="https://formulae.brew.sh/api/cask/").mock(side_effect=slow_first)
+
+        output_file = tmp_path / "releases.json"
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        notifier.run(output_file=str(output_file), no_notify=True)
+
+        with open(output_file) as f:
+            releases = json.load(f)
+
+        assert [r["tool_name"] for r in releases] == [f"Tool {i}" for i in range(5)]
+
+    @respx.mock
+    def test_run_batches_notifications(self, tmp_path, monkeypatch):
+        """Test that batch mode sends one multi-embed message in config order."""
+        config = {
+            "tools": [
+                {
+                    "name": f"Tool {i}",
+                    "enabled": True,
+                    "sources": [
+                        {
+                            "type": "homebrew_cask",
+                            "priority": 1,
+                            "api_url": f"https://formulae.brew.sh/api/cask/tool{i}.json",
+                        }
+                    ],
+                    "notification": {"webhook_env": "DISCORD_WEBHOOK", "color": 5814783},
+                }
+                for i in range(3)
+            ],
+            "common": {"cache_directory": "./cache", "discord": {"batch": True}},
+        }
+
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DISCORD_WEBHOOK", "https://discord.com/api/webhooks/123/abc")
+
+        respx.get(url__startswith="https://formulae.brew.sh/api/cask/").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+        webhook = respx.post("https://discord.com/api/webhooks/123/abc").mock(
+            return_value=httpx.Response(204)
+        )
+
+        with UnifiedReleaseNotifier(str(config_file)) as notifier:
+            notifier.run()
+
+        assert webhook.call_count == 1
+        embeds = json.loads(webhook.calls[0].request.content)["embeds"]
+        assert [e["title"] for e in embeds] == [f"🚀 Tool {i} - 1.0.0" for i in range(3)]
+        assert len(notifier.outbox) == 0
+        assert not (tmp_path / "cache" / "outbox.json").exists()
+
+    @respx.mock
+    def test_failed_notification_is_retried_from_outbox(self, tmp_path, monkeypatch):
+        """Test that a failed delivery stays in the outbox and is sent on a later run."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(copy.deepcopy(SAMPLE_CONFIG), f)
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DISCORD_WEBHOOK", "https://discord.com/api/webhooks/123/abc")
+
+        respx.get("https://formulae.brew.sh/api/cask/test.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+        webhook = respx.post("https://discord.com/api/webhooks/123/abc").mock(
+            side_effect=[httpx.Response(500), httpx.Response(204)]
+        )
+
+        UnifiedReleaseNotifier(str(config_file)).run()
+
+        outbox_file = tmp_path / "cache" / "outbox.json"
+        with open(outbox_file) as f:
+            entries = json.load(f)
+        assert [e["release"]["version"] for e in entries] == ["1.0.0"]
+        assert entries[0]["attempts"] == 1
+        # Only the environment variable name is stored, never the webhook URL
+        assert "discord.com" not in outbox_file.read_text()
+
+        # Make the retry due and run again; the version is already cached
+        entries[0]["next_attempt_at"] = "2000-01-01T00:00:00Z"
+        with open(outbox_file, "w") as f:
+            json.dump(entries, f)
+
+        UnifiedReleaseNotifier(str(config_file)).run()
+
+        assert webhook.call_count == 2
+        assert not outbox_file.exists()
+
+
+RACE_CONFIG = {
+    "tools": [
+        {
+            "name": "Race Tool",
+            "enabled": True,
+            "sources": [
+                {
+                    "type": "homebrew_cask",
+                    "priority": 2,
+                    "api_url": "https://formulae.brew.sh/api/cask/secondary.json",
+                },
+                {
+                    "type": "homebrew_cask",
+                    "priority": 1,
+                    "api_url": "https://formulae.brew.sh/api/cask/primary.json",
+                },
+            ],
+            "notification": {"webhook_env": "DISCORD_WEBHOOK", "color": 5814783},
+        }
+    ],
+    "common": {"cache_directory": "./cache", "source_strategy": "race"},
+}
+
+
+def _cask_response(version: str, delay: float = 0.0):
+    """Build a respx side effect returning a cask JSON after a delay."""
+
+    def side_effect(request):
+        time.sleep(delay)
+        return httpx.Response(200, json={**HOMEBREW_RESPONSE, "version": version})
+
+    return side_effect
+
+
+class TestSourceRace:
+    """Tests for racing sources concurrently."""
+
+    def _notifier(self, tmp_path, monkeypatch) -> UnifiedReleaseNotifier:
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(RACE_CONFIG, f)
+        monkeypatch.chdir(tmp_path)
+        return UnifiedReleaseNotifier(str(config_file))
+
+    @respx.mock
+    def test_race_prefers_higher_priority(self, tmp_path, monkeypatch):
+        """Test that a slower higher-priority result wins over a faster one."""
+        respx.get("https://formulae.brew.sh/api/cask/primary.json").mock(
+            side_effect=_cask_response("1.0.0", delay=0.2)
+        )
+        respx.get("https://formulae.brew.sh/api/cask/secondary.json").mock(
+            side_effect=_cask_response("2.0.0")
+        )
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        releases = notifier.fetch_release_race(notifier.config.tools[0])
+
+        assert releases is not None
+        assert releases[0].version == "1.0.0"
+
+    @respx.mock
+    def test_race_falls_back_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failed higher-priority source falls back to the next one."""
+        respx.get("https://formulae.brew.sh/api/cask/primary.json").mock(
+            return_value=httpx.Response(500)
+        )
+        respx.get("https://formulae.brew.sh/api/cask/secondary.json").mock(
+            side_effect=_cask_response("2.0.0")
+        )
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        releases = notifier.fetch_release_race(notifier.config.tools[0])
+
+        assert releases is not None
+        assert releases[0].version == "2.0.0"
+
+    @respx.mock
+    def test_race_does_not_wait_for_lower_priority(self, tmp_path, monkeypatch):
+        """Test that the winner is returned without waiting for slower sources."""
+        respx.get("https://formulae.brew.sh/api/cask/primary.json").mock(
+            side_effect=_cask_response("1.0.0")
+        )
+        respx.get("https://formulae.brew.sh/api/cask/secondary.json").mock(
+            side_effect=_cask_response("2.0.0", delay=1.0)
+        )
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        started = time.monotonic()
+        releases = notifier.fetch_release_race(notifier.config.tools[0])
+        elapsed = time.monotonic() - started
+
+        assert releases is not None
+        assert releases[0].version == "1.0.0"
+        assert elapsed < 0.5
+
+    @respx.mock
+    def test_race_abandons_lower_priority_in_flight(self, tmp_path, monkeypatch):
+        """Test that a source answering after the winner caches nothing."""
+        secondary_url = "https://formulae.brew.sh/api/cask/secondary.json"
+        answered = threading.Event()
+
+        def slow_secondary(request):
+            time.sleep(0.2)
+            answered.set()
+            return httpx.Response(200, json=HOMEBREW_RESPONSE, headers={"ETag": '"v2"'})
+
+        respx.get("https://formulae.brew.sh/api/cask/primary.json").mock(
+            side_effect=_cask_response("1.0.0")
+        )
+        respx.get(secondary_url).mock(side_effect=slow_secondary)
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        releases = notifier.fetch_release_race(notifier.config.tools[0])
+        assert answered.wait(timeout=2)
+        time.sleep(0.1)
+
+        assert releases is not None
+        assert releases[0].version == "1.0.0"
+        assert notifier.http_cache.request_headers(secondary_url) == {}
+
+    def test_result_after_race_decided_is_not_counted(self, tmp_path, monkeypatch):
+        """Test that a source finishing after cancellation is neither logged nor counted."""
+        cancel = threading.Event()
+
+        class LateSource:
+            def fetch_releases(self, known_version):
+                cancel.set()
+                return [{**HOMEBREW_RESPONSE, "content": "", "url": "", "source": "homebrew_cask"}]
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        notifier.metrics = Metrics()
+        monkeypatch.setattr(notifier, "get_source", lambda source_config, cancel: LateSource())
+
+        result = notifier.fetch_from_source(notifier.config.tools[0].sources[0], cancel=cancel)
+
+        assert result is None
+        assert not [r for r in notifier.metrics.records() if r["name"] == "source_results"]
+
+    @respx.mock
+    def test_run_with_race_strategy(self, tmp_path, monkeypatch):
+        """Test a full run using the race strategy."""
+        respx.get("https://formulae.brew.sh/api/cask/primary.json").mock(
+            side_effect=_cask_response("1.0.0")
+        )
+        respx.get("https://formulae.brew.sh/api/cask/secondary.json").mock(
+            side_effect=_cask_response("2.0.0")
+        )
+
+        notifier = self._notifier(tmp_path, monkeypatch)
+        output_file = tmp_path / "releases.json"
+        notifier.run(output_file=str(output_file), no_notify=True)
+
+        with open(output_file) as f:
+            releases = json.load(f)
+        assert releases[0]["version"] == "1.0.0"
+
+
+class TestCheckSchedule:
+    """Tests for skipping tools checked recently."""
+
+    @respx.mock
+    def test_run_skips_recently_checked_tool(self, tmp_path, monkeypatch):
+        """Test that a second run within check_interval_hours makes no request."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+        monkeypatch.chdir(tmp_path)
+
+        route = respx.get("https://formulae.brew.sh/api/cask/test.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+
+        UnifiedReleaseNotifier(str(config_file)).run(no_notify=True)
+        with open(tmp_path / "cache" / "versions.json") as f:
+            assert json.load(f)["Test Tool"]["checked_at"] is not None
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        notifier.run(no_notify=True)
+        assert route.call_count == 1
+
+        # --force ignores the last check
+        notifier.run(no_notify=True, force=True)
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_tool_due_after_interval(self, tmp_path, monkeypatch):
+        """Test that a tool is checked again once its interval has passed."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+        monkeypatch.chdir(tmp_path)
+
+        route = respx.get("https://formulae.brew.sh/api/cask/test.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        tool = notifier.config.tools[0]
+        notifier.save_cached_version("Test Tool", "1.0.0")
+        notifier.cache_store.mark_checked("Test Tool", datetime.now(UTC) - timedelta(hours=7))
+
+        notifier.process_tool(tool)
+
+        assert route.call_count == 1
+
+    def test_failed_check_is_not_recorded(self, tmp_path, monkeypatch):
+        """Test that a tool whose sources all failed is retried on the next run."""
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(SAMPLE_CONFIG, f)
+        monkeypatch.chdir(tmp_path)
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        notifier.save_cached_version("Test Tool", "1.0.0")
+        monkeypatch.setattr(notifier, "fetch_release", lambda tool_config, known_version: None)
+
+        notifier.process_tool(notifier.config.tools[0])
+
+        cached = notifier.load_cached_version("Test Tool")
+        assert cached is not None
+        assert cached.checked_at is None
+
+    @respx.mock
+    def test_adaptive_polling_interval(self, tmp_path, monkeypatch):
+        """Test that adaptive polling replaces check_interval_hours with the cadence."""
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["common"]["adaptive_polling"] = {"enabled": True, "min_interval_hours": 2}
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+        monkeypatch.chdir(tmp_path)
+
+        route = respx.get("https://formulae.brew.sh/api/cask/test.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_RESPONSE)
+        )
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        tool = notifier.config.tools[0]
+        notifier.run(no_notify=True)
+        cached = notifier.load_cached_version("Test Tool")
+        assert cached is not None
+        assert cached.checked_at is not None
+        assert notifier.check_interval(tool) == timedelta(hours=2)
+        assert notifier.next_check(tool) == cached.checked_at + timedelta(hours=2)
+
+        # Not due yet: no request is made
+        assert notifier.process_tool(tool) is None
+        assert route.call_count == 1
+
+    def test_check_interval_without_adaptive_polling(self, tmp_path, monkeypatch):
+        """Test that the configured interval is used without adaptive polling."""
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["tools"].append({**config["tools"][0], "name": "Slow", "check_interval_hours": 48})
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+        monkeypatch.chdir(tmp_path)
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+
+        assert notifier.check_interval(notifier.config.tools[0]) == timedelta(hours=6)
+        assert notifier.check_interval(notifier.config.tools[1]) == timedelta(hours=48)
+        assert notifier.next_check(notifier.config.tools[0]) is None
+
+
+class TestCatchUp:
+    """Tests for reporting every release published since the last check."""
+
+    FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry><title>v3</title><updated>2025-01-03T00:00:00Z</updated><content>Third</content></entry>
+  <entry><title>v2</title><updated>2025-01-02T00:00:00Z</updated><content>Second</content></entry>
+  <entry><title>v1</title><updated>2025-01-01T00:00:00Z</updated><content>First</content></entry>
+</feed>
+"""
+
+    def _notifier(self, tmp_path, monkeypatch) -> UnifiedReleaseNotifier:
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["tools"][0]["sources"] = [
+            {
+                "type": "github_releases",
+                "priority": 1,
+                "owner": "test",
+                "repo": "repo",
+                "atom_url": "https://github.com/test/repo/releases.atom",
+            }
+        ]
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+        monkeypatch.chdir(tmp_path)
+        respx.get("https://github.com/test/repo/releases.atom").mock(
+            return_value=httpx.Response(200, text=self.FEED)
+        )
+        return UnifiedReleaseNotifier(str(config_file))
+
+    @respx.mock
+    def test_reports_all_missed_releases(self, tmp_path, monkeypatch):
+        """Test that releases between the cached and the newest version are reported."""
+        notifier = self._notifier(tmp_path, monkeypatch)
+        notifier.save_cached_version("Test Tool", "v1")
+
+        output = notifier.process_tool(notifier.config.tools[0])
+
+        assert output is not None
+        assert output.version == "v3"
+        assert output.content == "### v3\n\nThird\n\n### v2\n\nSecond"
+        assert [r.version for r in notifier.history.latest("Test Tool", 5)] == ["v3", "v2"]
+        assert len(respx.calls) == 1
+
+    def test_long_notes_share_the_length_limit(self):
+        """Test that long notes are shortened so that the oldest release stays visible."""
+        published = datetime(2025, 1, 1, tzinfo=UTC)
+        releases = [
+            ReleaseInfo(
+                version=f"v{i}",
+                content=content,
+                url="https://example.com",
+                published=published,
+                source="github_releases",
+            )
+            for i, content in enumerate(["a" * 3000, "Short", "c" * 3000], start=1)
+        ]
+
+        content = catch_up_content(releases)
+
+        assert len(content) <= CONTENT_MAX_LENGTH
+        assert "### v2\n\nShort\n\n" in content
+        assert content.count("…") == 2
+        assert content.startswith("### v1\n\naaa")
+        assert content.split("### v3\n\n")[1].startswith("ccc")
+
+    @respx.mock
+    def test_first_check_reports_newest_only(self, tmp_path, monkeypatch):
+        """Test that a tool without cached version reports only its newest release."""
+        notifier = self._notifier(tmp_path, monkeypatch)
+
+        output = notifier.process_tool(notifier.config.tools[0])
+
+        assert output is not None
+        assert output.content == "Third"
+
+    @respx.mock
+    def test_unknown_cached_version_reports_newest_only(self, tmp_path, monkeypatch):
+        """Test that a cached version missing from the feed does not flood notifications."""
+        notifier = self._notifier(tmp_path, monkeypatch)
+        notifier.save_cached_version("Test Tool", "v0")
+
+        output = notifier.process_tool(notifier.config.tools[0])
+
+        assert output is not None
+        assert output.content == "Third"
+
+
+class TestServe:
+    """Tests for serve mode."""
+
+    def test_serve_checks_due_tools_until_stopped(self, tmp_path, monkeypatch):
+        """Test that due tools are processed in one round and the loop honours stop."""
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["tools"].append({**config["tools"][0], "name": "Disabled Tool", "enabled": False})
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+        monkeypatch.chdir(tmp_path)
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        stop = asyncio.Event()
+        rounds: list[list[str]] = []
+
+        async def fake_run_async(
+            output_file=None, no_notify=False, max_concurrency=None, tools=None, force=False
+        ):
+            rounds.append(([tool.name for tool in tools], force))
+            stop.set()
+
+        monkeypatch.setattr(notifier, "run_async", fake_run_async)
+
+        asyncio.run(asyncio.wait_for(notifier.serve_async(no_notify=True, stop=stop), timeout=5))
+
+        assert rounds == [(["Test Tool"], True)]
+
+    def test_serve_waits_for_recently_checked_tools(self, tmp_path, monkeypatch):
+        """Test that tools checked within their interval are not due at startup."""
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["tools"].append({**config["tools"][0], "name": "New Tool"})
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+        monkeypatch.chdir(tmp_path)
+
+        notifier = UnifiedReleaseNotifier(str(config_file))
+        checked = datetime.now(UTC) + timedelta(hours=1)
+        monkeypatch.setattr(
+            notifier, "next_check", lambda tool: checked if tool.name == "Test Tool" else None
+        )
+        stop = asyncio.Event()
+        rounds: list[list[str]] = []
+
+        async def fake_run_async(
+            output_file=None, no_notify=False, max_concurrency=None, tools=None, force=False
+        ):
+            rounds.append([tool.name for tool in tools])
+            stop.set()
+
+        monkeypatch.setattr(notifier, "run_async", fake_run_async)
+
+        asyncio.run(asyncio.wait_for(notifier.serve_async(no_notify=True, stop=stop), timeout=5))
+
+        assert rounds == [["New Tool"]]
+
+
+class TestCommandLine:
+    """Tests for command-line argument parsing."""
+
+    def test_positive_int(self):
+        """Test that positive integers are accepted."""
+        assert positive_int("4") == 4
+
+    @pytest.mark.parametrize("value", ["0", "-2", "many"])
+    def test_positive_int_rejects_invalid(self, value):
+        """Test that zero, negative and non-integer values are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+
+class TestLazyImports:
+    """Tests for deferred imports of optional modules."""
+
+    def test_import_defers_optional_modules(self):
+        """Test that importing the notifier leaves optional modules unimported."""
+        optional = [
+            "yaml",
+            "devtools_release_notifier.cadence",
+            "devtools_release_notifier.notifiers.discord",
+            "devtools_release_notifier.outbox",
+            "devtools_release_notifier.release_history",
+            "devtools_release_notifier.scheduler",
+        ]
+        code = (
+            "import sys, devtools_release_notifier.notifier\n"
+            f"print([m for m in {optional!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_modules_follow_command_and_config(self, tmp_path):
+        """Test that profiled modules depend on the command and configuration."""
+        config = copy.deepcopy(SAMPLE_CONFIG)
+        config["common"]["adaptive_polling"] = {"enabled": True}
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+
+        assert lazy_modules(str(config_file), notify=False) == [
+            "devtools_release_notifier.sources.homebrew_cask",
+            "devtools_release_notifier.cadence",
+        ]
+        assert lazy_modules(str(config_file), command="serve")[-2:] == [
+            "devtools_release_notifier.outbox",
+            "devtools_release_notifier.scheduler",
+        ]
@@ -0,0 +1,176 @@
+"""Tests for the durable notification outbox."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+from devtools_release_notifier.models.output import ReleaseOutput
+from devtools_release_notifier.outbox import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    MAX_ATTEMPTS,
+    NotificationOutbox,
+    backoff_delay,
+)
+
+WEBHOOK_URL = "https://discord.com/api/webhooks/123/abc"
+NOW = datetime(2100, 1, 1, tzinfo=UTC)
+
+
+def _release(tool_name: str = "Test Tool", version: str = "1.0.0") -> ReleaseOutput:
+    return ReleaseOutput(
+        tool_name=tool_name,
+        version=version,
+        content="Release notes",
+        url="https://example.com/release",
+        color=5814783,
+    )
+
+
+class RecordingSender:
+    """Sender returning preset results and recording what it was given."""
+
+    def __init__(self, *results: bool):
+        self.results = list(results)
+        self.calls: list[list] = []
+
+    def __call__(self, notifications: list) -> list[bool]:
+        self.calls.append(notifications)
+        return [self.results.pop(0) for _ in notifications]
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay."""
+
+    def test_doubles_per_attempt(self):
+        """Test that the delay doubles with every failed attempt."""
+        assert backoff_delay(1) == BACKOFF_BASE
+        assert backoff_delay(2) == BACKOFF_BASE * 2
+        assert backoff_delay(3) == BACKOFF_BASE * 4
+
+    def test_capped(self):
+        """Test that the delay never exceeds BACKOFF_MAX."""
+        assert backoff_delay(50) == BACKOFF_MAX
+
+
+class TestNotificationOutbox:
+    """Tests for NotificationOutbox."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that pending entries survive a reload."""
+        path = tmp_path / "outbox.json"
+        outbox = NotificationOutbox(path)
+        outbox.add(_release())
+        outbox.save()
+
+        reloaded = NotificationOutbox(path)
+
+        assert len(reloaded) == 1
+        assert reloaded.due()[0].release == _release()
+
+    def test_add_replaces_same_version(self, tmp_path):
+        """Test that adding the same tool version twice keeps one entry."""
+        outbox = NotificationOutbox(tmp_path / "outbox.json")
+        outbox.add(_release())
+        outbox.add(_release().model_copy(update={"content": "翻訳済み"}))
+
+        assert len(outbox) == 1
+        assert outbox.due()[0].release.content == "翻訳済み"
+
+    def test_save_empty_removes_file(self, tmp_path):
+        """Test that saving an empty outbox removes the file."""
+        path = tmp_path / "outbox.json"
+        path.write_text("[]")
+
+        NotificationOutbox(path).save()
+
+        assert not path.exists()
+
+    def test_load_invalid_json(self, tmp_path, capsys):
+        """Test that a corrupt outbox file is ignored."""
+        path = tmp_path / "outbox.json"
+        path.write_text("{not json")
+
+        outbox = NotificationOutbox(path)
+
+        assert len(outbox) == 0
+        assert "Failed to parse outbox" in capsys.readouterr().out
+
+    def test_flush_sends_due_entries(self, tmp_path, monkeypatch):
+        """Test that delivered entries are removed from the outbox."""
+        monkeypatch.setenv("DISCORD_WEBHOOK", WEBHOOK_URL)
+        outbox = NotificationOutbox(tmp_path / "outbox.json")
+        outbox.add(_release("Tool A"))
+        outbox.add(_release("Tool B"))
+        send = RecordingSender(True, True)
+
+        result = outbox.flush(send, now=NOW)
+
+        assert len(send.calls) == 1
+        assert [n.tool_name for n in send.calls[0]] == ["Tool A", "Tool B"]
+        assert send.calls[0][0].webhook_url == WEBHOOK_URL
+        assert [e.release.tool_name for e in result.sent] == ["Tool A", "Tool B"]
+        assert len(outbox) == 0
+
+    def test_flush_failure_backs_off(self, tmp_path, monkeypatch):
+        """Test that a failed entry is kept and not retried before its backoff ends."""
+        monkeypatch.setenv("DISCORD_WEBHOOK", WEBHOOK_URL)
+        outbox = NotificationOutbox(tmp_path / "outbox.json")
+        outbox.add(_release())
+        send = RecordingSender(False, True)
+
+        result = outbox.flush(send, now=NOW)
+
+        assert len(result.failed) == 1
+        entry = outbox.due(now=NOW + BACKOFF_BASE)[0]
+        assert entry.attempts == 1
+        assert entry.next_attempt_at == NOW + BACKOFF_BASE
+
+        # Not yet due: nothing is sent
+        assert outbox.flush(send, now=NOW + timedelta(minutes=1)).sent == []
+        assert len(send.calls) == 1
+
+        result = outbox.flush(send, now=NOW + BACKOFF_BASE)
+        assert len(result.sent) == 1
+        assert len(outbox) == 0
+
+    def test_flush_gives_up_after_max_attempts(self, tmp_path, monkeypatch):
+        """Test that an entry is dropped once it has failed MAX_ATTEMPTS times."""
+        monkeypatch.setenv("DISCORD_WEBHOOK", WEBHOOK_URL)
+        outbox = NotificationOutbox(tmp_path / "outbox.json")
+        outbox.add(_release())
+        send = RecordingSender(*[False] * MAX_ATTEMPTS)
+
+        now = NOW
+        for _ in range(MAX_ATTEMPTS):
+            outbox.flush(send, now=now)
+            now += BACKOFF_MAX
+
+        assert len(outbox) == 0
+        assert len(send.calls) == MAX_ATTEMPTS
+
+    def test_flush_skips_missing_webhook(self, tmp_path, monkeypatch):
+        """Test that entries without a configured webhook are dropped unsent."""
+        monkeypatch.delenv("DISCORD_WEBHOOK", raising=False)
+        outbox = NotificationOutbox(tmp_path / "outbox.json")
+        outbox.add(_release())
+        send = RecordingSender()
+
+        result = outbox.flush(send, now=NOW)
+
+        assert send.calls == []
+        assert len(result.skipped) == 1
+        assert len(outbox) == 0
+
+    def test_saved_file_has_no_webhook_url(self, tmp_path, monkeypatch):
+        """Test that only the webhook environment variable name is persisted."""
+        monkeypatch.setenv("DISCORD_WEBHOOK", WEBHOOK_URL)
+        path = tmp_path / "outbox.json"
+        outbox = NotificationOutbox(path)
+        outbox.add(_release())
+        outbox.flush(RecordingSender(False), now=NOW)
+        outbox.save()
+
+        data = json.loads(path.read_text())
+
+        assert data[0]["release"]["webhook_env"] == "DISCORD_WEBHOOK"
+        assert WEBHOOK_URL not in path.read_text()
@@ -0,0 +1,201 @@
+"""Tests for Discord webhook rate limiting."""
+
+import httpx
+import respx
+
+from devtools_release_notifier.notifiers.discord import DiscordNotifier
+from devtools_release_notifier.notifiers.rate_limit import (
+    MAX_RETRY_AFTER_SECONDS,
+    WebhookRateLimiter,
+    retry_after_seconds,
+)
+
+WEBHOOK_URL = "https://discord.com/api/webhooks/123456/abcdef"
+OTHER_WEBHOOK_URL = "https://discord.com/api/webhooks/654321/fedcba"
+PAYLOAD: dict[str, list] = {"embeds": []}
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleeping."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, max_retries: int = 3) -> WebhookRateLimiter:
+    return WebhookRateLimiter(max_retries=max_retries, clock=clock, sleep=clock.sleep)
+
+
+def _limited(remaining: int, reset_after: float, limit: int = 5) -> httpx.Response:
+    return httpx.Response(
+        204,
+        headers={
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset-After": str(reset_after),
+        },
+    )
+
+
+def test_acquire_without_known_limits_does_not_wait():
+    """Test that unknown webhooks are not throttled."""
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    for _ in range(10):
+        limiter.acquire(WEBHOOK_URL)
+
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_bucket_reset():
+    """Test that an exhausted bucket delays the next request until reset."""
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    limiter.update(WEBHOOK_URL, _limited(remaining=2, reset_after=1.5))
+
+    limiter.acquire(WEBHOOK_URL)
+    limiter.acquire(WEBHOOK_URL)
+    assert clock.sleeps == []
+
+    limiter.acquire(WEBHOOK_URL)
+    assert clock.sleeps == [1.5]
+
+    # After the reset the learned limit applies again
+    for _ in range(4):
+        limiter.acquire(WEBHOOK_URL)
+    assert clock.sleeps == [1.5]
+
+
+def test_buckets_are_per_webhook():
+    """Test that one webhook's limit does not delay another."""
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    limiter.update(WEBHOOK_URL, _limited(remaining=0, reset_after=2.0))
+
+    limiter.acquire(OTHER_WEBHOOK_URL)
+
+    assert clock.sleeps == []
+
+
+def test_retry_after_seconds():
+    """Test reading the retry delay from headers or the JSON body."""
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "2.5"})) == 2.5
+    assert retry_after_seconds(httpx.Response(429, json={"retry_after": 0.75})) == 0.75
+    assert retry_after_seconds(httpx.Response(429)) == 1.0
+
+
+@respx.mock
+def test_post_retries_after_429():
+    """Test that rate-limited requests are retried after Retry-After."""
+    route = respx.post(WEBHOOK_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0.5"}, json={"retry_after": 0.5}),
+            httpx.Response(204),
+        ]
+    )
+    clock = FakeClock()
+
+    with httpx.Client() as client:
+        response = _limiter(clock).post(client, WEBHOOK_URL, PAYLOAD)
+
+    assert response.status_code == 204
+    assert route.call_count == 2
+    assert clock.sleeps == [0.5]
+
+
+@respx.mock
+def test_post_gives_up_after_max_retries():
+    """Test that the last 429 response is returned once retries are exhausted."""
+    route = respx.post(WEBHOOK_URL).mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "1"})
+    )
+    clock = FakeClock()
+
+    with httpx.Client() as client:
+        response = _limiter(clock, max_retries=2).post(client, WEBHOOK_URL, PAYLOAD)
+
+    assert response.status_code == 429
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_post_does_not_wait_for_long_delays():
+    """Test that delays above the cap are not waited for."""
+    route = respx.post(WEBHOOK_URL).mock(
+        return_value=httpx.Response(429, headers={"Retry-After": str(MAX_RETRY_AFTER_SECONDS + 1)})
+    )
+    clock = FakeClock()
+
+    with httpx.Client() as client:
+        response = _limiter(clock).post(client, WEBHOOK_URL, PAYLOAD)
+
+    assert response.status_code == 429
+    assert route.call_count == 1
+    assert clock.sleeps == []
+
+
+@respx.mock
+def test_post_fails_fast_while_long_delay_lasts():
+    """Test that a long Retry-After does not block later posts to the webhook."""
+    route = respx.post(WEBHOOK_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "3600"}),
+            httpx.Response(204),
+        ]
+    )
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    with httpx.Client() as client:
+        limiter.post(client, WEBHOOK_URL, PAYLOAD)
+        response = limiter.post(client, WEBHOOK_URL, PAYLOAD)
+
+        assert response.status_code == 429
+        assert retry_after_seconds(response) == 3600
+        assert route.call_count == 1
+        assert clock.sleeps == []
+
+        clock.now += 3600
+        assert limiter.post(client, WEBHOOK_URL, PAYLOAD).status_code == 204
+
+
+@respx.mock
+def test_notifier_burst_is_not_dropped():
+    """Test that a burst over the webhook limit is delivered without failures."""
+    calls = 0
+
+    def webhook(request):
+        nonlocal calls
+        calls += 1
+        # Two requests per window; the third in a window is rejected
+        if calls % 3 == 0:
+            return httpx.Response(429, headers={"Retry-After": "1"})
+        return _limited(remaining=2 - calls % 3, reset_after=1.0, limit=2)
+
+    respx.post(WEBHOOK_URL).mock(side_effect=webhook)
+    clock = FakeClock()
+    notifier = DiscordNotifier(rate_limiter=_limiter(clock))
+
+    results = [
+        notifier.send(
+            webhook_url=WEBHOOK_URL,
+            tool_name=f"Tool {i}",
+            version="v1.0.0",
+            content="Notes",
+            url="https://example.com",
+            color=5814783,
+        )
+        for i in range(6)
+    ]
+
+    assert results == [True] * 6
+    assert clock.sleeps
@@ -0,0 +1,139 @@
+"""Tests for the append-only release history."""
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from devtools_release_notifier.models.release import ReleaseInfo, ReleaseRecord
+from devtools_release_notifier.release_history import (
+    COMPACT_MIN_WASTE,
+    ReleaseHistory,
+    history_filename,
+    release_record,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _record(version: str, day: int) -> ReleaseRecord:
+    return ReleaseRecord(
+        version=version,
+        source="github_releases",
+        published=START + timedelta(days=day),
+        detected=START + timedelta(days=day, hours=1),
+        content_hash="0" * 64,
+    )
+
+
+def _history_with_days(tmp_path: Path, *days: int) -> ReleaseHistory:
+    history = ReleaseHistory(tmp_path)
+    for day in days:
+        history.append("Zed Editor", _record(f"v{day}", day))
+    return history
+
+
+def test_history_filename():
+    """Test that tool names map to safe file names."""
+    assert history_filename("Claude Code") == "claude_code.jsonl"
+    assert history_filename("Visual Studio Code (Insiders)") == "visual_studio_code_insiders.jsonl"
+
+
+def test_release_record_hashes_content():
+    """Test that a record stores the SHA-256 of the release notes."""
+    info = ReleaseInfo(
+        version="v1",
+        content="Notes",
+        url="https://example.com",
+        published=START,
+        source="changelog",
+    )
+
+    record = release_record(info, START + timedelta(hours=2))
+
+    assert record.content_hash == hashlib.sha256(b"Notes").hexdigest()
+    assert record.detected == START + timedelta(hours=2)
+    assert record.source == "changelog"
+
+
+def test_append_and_reload(tmp_path: Path):
+    """Test that appended records are found by a new history."""
+    _history_with_days(tmp_path, 1, 2)
+
+    history = ReleaseHistory(tmp_path)
+
+    assert [r.version for r in history.latest("Zed Editor", 5)] == ["v2", "v1"]
+    assert len(history.path("Zed Editor").read_text().splitlines()) == 2
+
+
+def test_append_known_version_is_noop(tmp_path: Path):
+    """Test that a version is recorded only once."""
+    history = _history_with_days(tmp_path, 1)
+
+    assert not history.append("Zed Editor", _record("v1", 5))
+    assert history.get("Zed Editor", "v1") == _record("v1", 1)
+    assert len(history.path("Zed Editor").read_text().splitlines()) == 1
+
+
+def test_append_after_truncated_line(tmp_path: Path):
+    """Test that an append after an interrupted one starts on a new line."""
+    _history_with_days(tmp_path, 1)
+    path = ReleaseHistory(tmp_path).path("Zed Editor")
+    path.write_text(path.read_text() + _record("v2", 2).model_dump_json()[:20])
+
+    history = ReleaseHistory(tmp_path)
+    assert history.append("Zed Editor", _record("v3", 3))
+
+    reloaded = ReleaseHistory(tmp_path)
+    assert [r.version for r in reloaded.latest("Zed Editor", 5)] == ["v3", "v1"]
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_queries(tmp_path: Path):
+    """Test latest, since and by-version queries."""
+    history = _history_with_days(tmp_path, 1, 3, 2, 10)
+
+    assert [r.version for r in history.latest("Zed Editor")] == ["v10"]
+    assert [r.version for r in history.latest("Zed Editor", 3)] == ["v10", "v3", "v2"]
+    assert history.latest("Zed Editor", 0) == []
+    assert [r.version for r in history.since("Zed Editor", START + timedelta(days=2))] == [
+        "v10",
+        "v3",
+        "v2",
+    ]
+    assert history.since("Zed Editor", START + timedelta(days=11)) == []
+    assert history.get("Zed Editor", "v3") == _record("v3", 3)
+    assert history.get("Zed Editor", "v4") is None
+    assert history.latest("Unknown Tool", 3) == []
+
+
+def test_compact_removes_waste(tmp_path: Path):
+    """Test that duplicate and truncated lines are dropped once they dominate the file."""
+    history = _history_with_days(tmp_path, 1, 2)
+    path = history.path("Zed Editor")
+    with open(path, "a") as f:
+        f.writelines(_record("v1", 9).model_dump_json() + "\n" for _ in range(COMPACT_MIN_WASTE))
+        f.write('{"version": "v3", "sou')
+
+    history = ReleaseHistory(tmp_path)
+    assert [r.version for r in history.latest("Zed Editor", 5)] == ["v2", "v1"]
+
+    assert history.compact() == ["Zed Editor"]
+    assert path.read_text().splitlines() == [
+        _record("v1", 1).model_dump_json(),
+        _record("v2", 2).model_dump_json(),
+    ]
+    assert history.compact() == []
+
+
+def test_compact_leaves_small_waste(tmp_path: Path):
+    """Test that a few wasted lines are only compacted when forced."""
+    history = _history_with_days(tmp_path, 1)
+    with open(history.path("Zed Editor"), "a") as f:
+        f.write(_record("v1", 1).model_dump_json() + "\n")
+
+    history = ReleaseHistory(tmp_path)
+    history.latest("Zed Editor")
+
+    assert history.compact() == []
+    assert history.compact(force=True) == ["Zed Editor"]
+    assert len(history.path("Zed Editor").read_text().splitlines()) == 1
@@ -0,0 +1,181 @@
+"""Tests for the releases manifest."""
+
+from pathlib import Path
+
+from devtools_release_notifier import release_manifest
+from devtools_release_notifier.models.output import ReleaseLogEntry
+from devtools_release_notifier.release_manifest import (
+    MANIFEST_FILENAME,
+    append_entry,
+    extract_title,
+    latest_entries,
+    load_entries,
+    scan_entries,
+    write_manifest,
+)
+
+
+def _write_log(base_dir: Path, tool: str, date: str, version: str) -> Path:
+    tool_dir = base_dir / tool
+    tool_dir.mkdir(parents=True, exist_ok=True)
+    file_path = tool_dir / f"{date}.md"
+    file_path.write_text(f'---\ntitle: "{tool} - {version}"\ndate: "{date}"\n---\n\n# Body\n')
+    return file_path
+
+
+def _entry(tool: str, date: str, version: str) -> ReleaseLogEntry:
+    return ReleaseLogEntry(
+        date=date, tool=tool, path=f"{tool}/{date}.md", title=f"{tool} - {version}"
+    )
+
+
+def test_scan_entries(tmp_path: Path):
+    """Test that scanning finds dated logs and skips other files."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    (tmp_path / "zed" / "index.md").write_text("# Zed")
+    (tmp_path / "_hidden").mkdir()
+    _write_log(tmp_path, "_hidden", "2025-01-02", "v2")
+
+    entries = scan_entries(tmp_path, max_entries=15)
+
+    assert entries == [_entry("zed", "2025-01-01", "v1")]
+
+
+def test_latest_entries_builds_missing_manifest(tmp_path: Path):
+    """Test that a missing manifest is built from disk."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    _write_log(tmp_path, "ghostty", "2025-01-03", "v3")
+    _write_log(tmp_path, "zed", "2025-01-02", "v2")
+
+    newest = latest_entries(tmp_path, max_entries=2)
+
+    assert [e.path for e in newest] == ["ghostty/2025-01-03.md", "zed/2025-01-02.md"]
+    assert (tmp_path / MANIFEST_FILENAME).exists()
+    assert load_entries(tmp_path) == newest
+
+
+def test_scan_entries_reads_only_newest(tmp_path: Path, monkeypatch):
+    """Test that a rebuild opens only as many logs as it keeps."""
+    for day in range(1, 29):
+        _write_log(tmp_path, "zed" if day % 2 else "ghostty", f"2025-02-{day:02d}", f"v{day}")
+    opened: list[Path] = []
+    original = release_manifest.extract_title
+
+    def counting_extract_title(file_path: Path) -> str | None:
+        opened.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(release_manifest, "extract_title", counting_extract_title)
+
+    entries = scan_entries(tmp_path, max_entries=3)
+
+    assert [(e.date, e.tool) for e in entries] == [
+        ("2025-02-28", "ghostty"),
+        ("2025-02-27", "zed"),
+        ("2025-02-26", "ghostty"),
+    ]
+    assert len(opened) == 3
+
+
+def test_scan_entries_skips_untitled(tmp_path: Path):
+    """Test that logs without a frontmatter title are skipped for older ones."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    (tmp_path / "zed" / "2025-01-02.md").write_text('# No frontmatter\ntitle: "zed - v2"\n')
+
+    assert [e.title for e in scan_entries(tmp_path, max_entries=1)] == ["zed - v1"]
+
+
+def test_extract_title_reads_frontmatter_only(tmp_path: Path):
+    """Test that a title outside the frontmatter is ignored."""
+    file_path = tmp_path / "2025-01-01.md"
+    file_path.write_text('---\ndate: "2025-01-01"\n---\n\ntitle: "Body"\n')
+
+    assert extract_title(file_path) is None
+
+
+def test_latest_entries_reads_manifest_without_opening_logs(tmp_path: Path, monkeypatch):
+    """Test that a current manifest is used without rescanning the logs."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    write_manifest(tmp_path, [_entry("zed", "2025-01-01", "from manifest")])
+
+    def fail_scan(base_dir, max_entries):
+        raise AssertionError("manifest should not be rebuilt")
+
+    monkeypatch.setattr(release_manifest, "scan_entries", fail_scan)
+
+    newest = latest_entries(tmp_path, max_entries=15)
+
+    assert [e.title for e in newest] == ["zed - from manifest"]
+
+
+def test_append_entry_updates_manifest(tmp_path: Path):
+    """Test that appended entries are visible and replace earlier lines for the same log."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    latest_entries(tmp_path, max_entries=15)
+
+    _write_log(tmp_path, "zed", "2025-01-02", "v2")
+    append_entry(tmp_path, _entry("zed", "2025-01-02", "v2"))
+    _write_log(tmp_path, "zed", "2025-01-02", "v3")
+    append_entry(tmp_path, _entry("zed", "2025-01-02", "v3"))
+
+    newest = latest_entries(tmp_path, max_entries=15)
+
+    assert [e.title for e in newest] == ["zed - v3", "zed - v1"]
+
+
+def test_append_entry_without_manifest(tmp_path: Path):
+    """Test that appending does not create a partial manifest."""
+    append_entry(tmp_path, _entry("zed", "2025-01-01", "v1"))
+
+    assert not (tmp_path / MANIFEST_FILENAME).exists()
+
+
+def test_latest_entries_rebuilds_stale_manifest(tmp_path: Path):
+    """Test that a manifest listing a deleted log or missing a tool is rebuilt."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    write_manifest(tmp_path, [_entry("zed", "2025-01-05", "deleted")])
+
+    assert [e.title for e in latest_entries(tmp_path, max_entries=15)] == ["zed - v1"]
+
+    _write_log(tmp_path, "ghostty", "2025-01-02", "v2")
+
+    assert [e.title for e in latest_entries(tmp_path, max_entries=15)] == [
+        "ghostty - v2",
+        "zed - v1",
+    ]
+
+
+def test_latest_entries_ignores_tool_without_logs(tmp_path: Path, monkeypatch):
+    """Test that a tool directory without release logs does not force rebuilds."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    (tmp_path / "dia").mkdir()
+    (tmp_path / "dia" / "index.md").write_text("# Dia")
+    latest_entries(tmp_path, max_entries=15)
+
+    def fail_scan(base_dir, max_entries):
+        raise AssertionError("manifest should not be rebuilt")
+
+    monkeypatch.setattr(release_manifest, "scan_entries", fail_scan)
+
+    assert len(latest_entries(tmp_path, max_entries=15)) == 1
+
+
+def test_load_entries_invalid(tmp_path: Path, capsys):
+    """Test that an invalid manifest is treated as missing."""
+    (tmp_path / MANIFEST_FILENAME).write_text("not json\n")
+
+    assert load_entries(tmp_path) is None
+    assert "Ignoring invalid releases manifest" in capsys.readouterr().out
+
+
+def test_latest_entries_rebuilds_for_unlisted_newer_log(tmp_path: Path):
+    """Test that a log copied in without the manifest is picked up if it would be rendered."""
+    _write_log(tmp_path, "zed", "2025-01-01", "v1")
+    _write_log(tmp_path, "zed", "2025-01-02", "v2")
+    latest_entries(tmp_path, max_entries=1)
+
+    _write_log(tmp_path, "ghostty", "2024-12-31", "old")
+    assert [e.title for e in latest_entries(tmp_path, max_entries=1)] == ["zed - v2"]
+
+    _write_log(tmp_path, "ghostty", "2025-01-03", "new")
+    assert [e.title for e in latest_entries(tmp_path, max_entries=1)] == ["ghostty - new"]
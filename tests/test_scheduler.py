@@ -0,0 +1,74 @@
+"""Tests for the serve mode tool scheduler."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+from devtools_release_notifier.models.config import ToolConfig
+from devtools_release_notifier.scheduler import ToolScheduler
+
+NOW = datetime(2100, 1, 1, tzinfo=UTC)
+
+
+def _tool(name: str, enabled: bool = True, interval: int | None = None) -> ToolConfig:
+    return ToolConfig(
+        name=name,
+        enabled=enabled,
+        check_interval_hours=interval,
+        sources=[{"type": "homebrew_cask", "priority": 1, "api_url": "https://example.com"}],
+        notification={"color": 0},
+    )
+
+
+def _interval(tool: ToolConfig) -> timedelta:
+    return timedelta(hours=tool.check_interval_hours or 6)
+
+
+def test_all_enabled_tools_due_at_start():
+    """Test that every enabled tool is due immediately and disabled ones never."""
+    tools = [_tool("A"), _tool("B", enabled=False), _tool("C")]
+    scheduler = ToolScheduler(tools, interval=_interval, jitter=0, now=NOW)
+
+    assert len(scheduler) == 2
+    assert [t.name for t in scheduler.due(NOW)] == ["A", "C"]
+
+
+def test_first_check_seeds_schedule():
+    """Test that recently checked tools are not due until their first check."""
+    tools = [_tool("Checked"), _tool("New")]
+    first = {"Checked": NOW + timedelta(hours=2)}
+    scheduler = ToolScheduler(tools, _interval, 0, NOW, first_check=lambda t: first.get(t.name))
+
+    assert [t.name for t in scheduler.due(NOW)] == ["New"]
+    assert [t.name for t in scheduler.due(NOW + timedelta(hours=2))] == ["Checked", "New"]
+
+
+def test_reschedule_uses_tool_interval():
+    """Test that tools come due again after their own or the default interval."""
+    fast, slow = _tool("Fast", interval=1), _tool("Slow")
+    scheduler = ToolScheduler([fast, slow], interval=_interval, jitter=0, now=NOW)
+    scheduler.reschedule([fast, slow], NOW)
+
+    assert scheduler.next_check() == NOW + timedelta(hours=1)
+    assert scheduler.due(NOW + timedelta(minutes=59)) == []
+    assert [t.name for t in scheduler.due(NOW + timedelta(hours=1))] == ["Fast"]
+    assert [t.name for t in scheduler.due(NOW + timedelta(hours=6))] == ["Fast", "Slow"]
+
+
+def test_jitter_spreads_checks_within_bounds():
+    """Test that jitter varies intervals by at most the configured fraction."""
+    tools = [_tool(f"Tool {i}") for i in range(50)]
+    scheduler = ToolScheduler(
+        tools, lambda tool: timedelta(hours=10), jitter=0.1, now=NOW, rng=random.Random(0)
+    )
+    scheduler.reschedule(tools, NOW)
+
+    assert scheduler.due(NOW + timedelta(hours=9)) == []
+    assert len(scheduler.due(NOW + timedelta(hours=11))) == 50
+    assert 0 < len(scheduler.due(NOW + timedelta(hours=10))) < 50
+
+
+def test_no_enabled_tools():
+    """Test that a schedule without enabled tools has no next check."""
+    scheduler = ToolScheduler([_tool("A", enabled=False)], _interval, 0.1, NOW)
+
+    assert scheduler.next_check() is None
@@ -1,15 +1,26 @@
 """Tests for release information sources."""
 
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+import json
+import subprocess
+import sys
+import threading
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
+from unittest.mock import patch
 
 import httpx
+import pytest
 import respx
 
+from devtools_release_notifier.http_cache import HttpCache
+from devtools_release_notifier.sources import get_source_class
+from devtools_release_notifier.sources.base import MAX_CATCH_UP, FetchCancelled
 from devtools_release_notifier.sources.changelog import ChangelogSource
+from devtools_release_notifier.sources.feed import _iter_feedparser_entries, iter_feed_entries
 from devtools_release_notifier.sources.github_commits import GitHubCommitsSource
 from devtools_release_notifier.sources.github_releases import GitHubReleaseSource
 from devtools_release_notifier.sources.homebrew_cask import HomebrewCaskSource
+from devtools_release_notifier.sources.homebrew_index import HomebrewCaskIndex
 
 # Sample Atom feed with published_parsed
 ATOM_FEED_WITH_PUBLISHED = """<?xml version="1.0" encoding="UTF-8"?>
@@ -35,6 +46,44 @@
 </feed>
 """
 
+# GitHub-style Atom feed (HTML content, no summary, multiple links)
+ATOM_FEED_GITHUB_STYLE = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">
+  <id>tag:github.com,2008:https://github.com/test/repo/releases</id>
+  <link type="text/html" rel="alternate" href="https://github.com/test/repo/releases"/>
+  <title>Release notes from repo</title>
+  <updated>2025-01-16T09:30:00+09:00</updated>
+  <entry>
+    <id>tag:github.com,2008:Repository/1/v0.101.0</id>
+    <updated>2025-01-16T09:30:00+09:00</updated>
+    <link rel="alternate" type="text/html" href="https://github.com/test/repo/releases/tag/v0.101.0"/>
+    <title>v0.101.0</title>
+    <content type="html">&lt;p&gt;New &amp;amp; improved&lt;/p&gt;</content>
+    <author><name>octocat</name></author>
+    <media:thumbnail height="30" width="30" url="https://avatars.githubusercontent.com/u/1"/>
+  </entry>
+  <entry>
+    <id>tag:github.com,2008:Repository/1/v0.100.0</id>
+    <updated>2025-01-15T12:00:00Z</updated>
+    <link rel="alternate" type="text/html" href="https://github.com/test/repo/releases/tag/v0.100.0"/>
+    <title>v0.100.0</title>
+    <content type="html">&lt;p&gt;Release notes&lt;/p&gt;</content>
+  </entry>
+</feed>
+"""
+
+# Atom feed that is not well-formed XML (unescaped ampersand)
+ATOM_FEED_MALFORMED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>v1 & v2</title>
+    <link href="https://github.com/test/repo/releases/tag/v1"/>
+    <summary>Release notes</summary>
+    <published>2025-01-15T12:00:00Z</published>
+  </entry>
+</feed>
+"""
+
 # Empty Atom feed
 EMPTY_ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom">
@@ -94,25 +143,17 @@
 class TestGitHubReleaseSource:
     """Tests for GitHubReleaseSource."""
 
-    @patch("devtools_release_notifier.sources.github_releases.feedparser.parse")
-    def test_fetch_success_with_published(self, mock_parse):
-        """Test successful fetch with published_parsed."""
+    @respx.mock
+    def test_fetch_success_with_published(self):
+        """Test successful fetch with published time."""
         config = {
             "atom_url": "https://github.com/test/repo/releases.atom",
             "owner": "test",
             "repo": "repo",
         }
-
-        # Mock feedparser response
-        mock_entry = MagicMock()
-        mock_entry.title = "v0.100.0"
-        mock_entry.summary = "Release notes"
-        mock_entry.link = "https://github.com/test/repo/releases/tag/v0.100.0"
-        mock_entry.published_parsed = (2025, 1, 15, 12, 0, 0)
-
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_parse.return_value = mock_feed
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_WITH_PUBLISHED)
+        )
 
         source = GitHubReleaseSource(config)
         result = source.fetch_latest_version()
@@ -121,51 +162,80 @@ def test_fetch_success_with_published(self, mock_parse):
         assert result["version"] == "v0.100.0"
         assert result["content"] == "Release notes"
         assert result["url"] == "https://github.com/test/repo/releases/tag/v0.100.0"
-        assert isinstance(result["published"], datetime)
+        assert result["published"] == datetime(2025, 1, 15, 12, 0, 0, tzinfo=UTC)
         assert result["source"] == "github_releases"
 
-    @patch("devtools_release_notifier.sources.github_releases.feedparser.parse")
-    def test_fetch_success_with_updated(self, mock_parse):
-        """Test successful fetch with updated_parsed fallback."""
+    @respx.mock
+    def test_fetch_success_with_updated(self):
+        """Test successful fetch with updated time fallback."""
         config = {
             "atom_url": "https://github.com/test/repo/releases.atom",
             "owner": "test",
             "repo": "repo",
         }
-
-        # Mock feedparser response with only updated_parsed
-        mock_entry = MagicMock()
-        mock_entry.title = "v0.100.0"
-        mock_entry.summary = "Release notes"
-        mock_entry.link = "https://github.com/test/repo/releases/tag/v0.100.0"
-        mock_entry.published_parsed = None
-        mock_entry.updated_parsed = (2025, 1, 15, 12, 0, 0)
-
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_parse.return_value = mock_feed
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_WITH_UPDATED)
+        )
 
         source = GitHubReleaseSource(config)
         result = source.fetch_latest_version()
 
         assert result is not None
         assert result["version"] == "v0.100.0"
-        assert isinstance(result["published"], datetime)
+        assert result["published"] == datetime(2025, 1, 15, 12, 0, 0, tzinfo=UTC)
         assert result["source"] == "github_releases"
 
-    @patch("devtools_release_notifier.sources.github_releases.feedparser.parse")
-    def test_fetch_empty_feed(self, mock_parse):
+    @respx.mock
+    def test_fetch_empty_feed(self):
         """Test fetch with empty feed."""
         config = {
             "atom_url": "https://github.com/test/repo/releases.atom",
             "owner": "test",
             "repo": "repo",
         }
+        respx.get(config["atom_url"]).mock(return_value=httpx.Response(200, text=EMPTY_ATOM_FEED))
+
+        source = GitHubReleaseSource(config)
+        result = source.fetch_latest_version()
+
+        assert result is None
+
+    @respx.mock
+    def test_fetch_github_content_entry(self):
+        """Test fetch from a GitHub-style entry with HTML content and no summary."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_GITHUB_STYLE)
+        )
+
+        source = GitHubReleaseSource(config)
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "v0.101.0"
+        assert result["content"] == "<p>New &amp; improved</p>"
+        assert result["url"] == "https://github.com/test/repo/releases/tag/v0.101.0"
 
-        # Mock empty feed
-        mock_feed = MagicMock()
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
+    @respx.mock
+    def test_fetch_malformed_feed_uses_feedparser(self):
+        """Test that feeds that are not well-formed XML fall back to feedparser."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_MALFORMED)
+        )
+
+        source = GitHubReleaseSource(config)
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "v1 & v2"
+        assert result["url"] == "https://github.com/test/repo/releases/tag/v1"
+
+    @respx.mock
+    def test_fetch_http_error(self):
+        """Test fetch with HTTP error."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        respx.get(config["atom_url"]).mock(return_value=httpx.Response(404))
 
         source = GitHubReleaseSource(config)
         result = source.fetch_latest_version()
@@ -253,25 +323,17 @@ def test_fetch_missing_api_url(self):
 class TestGitHubCommitsSource:
     """Tests for GitHubCommitsSource."""
 
-    @patch("devtools_release_notifier.sources.github_commits.feedparser.parse")
-    def test_fetch_success(self, mock_parse):
+    @respx.mock
+    def test_fetch_success(self):
         """Test successful fetch from GitHub Commits."""
         config = {
             "atom_url": "https://github.com/test/repo/commits/main.atom",
             "owner": "test",
             "repo": "repo",
         }
-
-        # Mock feedparser response
-        mock_entry = MagicMock()
-        mock_entry.title = "v0.100.0"
-        mock_entry.summary = "Release notes"
-        mock_entry.link = "https://github.com/test/repo/releases/tag/v0.100.0"
-        mock_entry.published_parsed = (2025, 1, 15, 12, 0, 0)
-
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_parse.return_value = mock_feed
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_WITH_PUBLISHED)
+        )
 
         source = GitHubCommitsSource(config)
         result = source.fetch_latest_version()
@@ -283,19 +345,15 @@ def test_fetch_success(self, mock_parse):
         assert isinstance(result["published"], datetime)
         assert result["source"] == "github_commits"
 
-    @patch("devtools_release_notifier.sources.github_commits.feedparser.parse")
-    def test_fetch_empty_feed(self, mock_parse):
+    @respx.mock
+    def test_fetch_empty_feed(self):
         """Test fetch with empty feed."""
         config = {
             "atom_url": "https://github.com/test/repo/commits/main.atom",
             "owner": "test",
             "repo": "repo",
         }
-
-        # Mock empty feed
-        mock_feed = MagicMock()
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
+        respx.get(config["atom_url"]).mock(return_value=httpx.Response(200, text=EMPTY_ATOM_FEED))
 
         source = GitHubCommitsSource(config)
         result = source.fetch_latest_version()
@@ -311,6 +369,48 @@ def test_fetch_missing_atom_url(self):
 
         assert result is None
 
+    @respx.mock
+    def test_fetch_releases_since_known_version(self):
+        """Test that releases are read newest first down to the known version."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, text=ATOM_FEED_GITHUB_STYLE)
+        )
+
+        releases = GitHubReleaseSource(config).fetch_releases("v0.100.0")
+
+        assert releases is not None
+        assert [r["version"] for r in releases] == ["v0.101.0", "v0.100.0"]
+        assert releases[1]["content"] == "<p>Release notes</p>"
+
+    @respx.mock
+    def test_fetch_releases_stops_at_known_version(self):
+        """Test that entries after the known version are not downloaded."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        entry = (
+            "<entry><title>v1.{i}</title><updated>2025-01-01T00:00:00Z</updated>"
+            "<content>Notes {i}</content></entry>"
+        )
+        chunks = [
+            b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">',
+            *(entry.format(i=i).encode() for i in range(10, 0, -1)),
+            b"</feed>",
+        ]
+        consumed = []
+
+        def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        respx.get(config["atom_url"]).mock(return_value=httpx.Response(200, content=stream()))
+
+        releases = GitHubReleaseSource(config).fetch_releases("v1.8")
+
+        assert releases is not None
+        assert [r["version"] for r in releases] == ["v1.10", "v1.9", "v1.8"]
+        assert len(consumed) < len(chunks)
+
 
 class TestChangelogSource:
     """Tests for ChangelogSource."""
@@ -435,6 +535,91 @@ def test_fetch_invalid_regex(self):
 
         assert result is None
 
+    @respx.mock
+    def test_fetch_stops_after_latest_section(self):
+        """Test that the stream is abandoned once the latest section is complete."""
+        config = {
+            "raw_url": "https://example.com/CHANGELOG.md",
+            "version_pattern": "simple",
+        }
+        older_sections = [f"## 1.0.{i}\n- Old change {i}\n\n".encode() for i in range(100, 0, -1)]
+        chunks = [
+            b"# Changelog\n\n## 2.0",
+            b".69\n- Minor ",
+            b"bugfixes\n\n## 2.0.6",
+            *older_sections,
+        ]
+        consumed = []
+
+        def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        respx.get(config["raw_url"]).mock(return_value=httpx.Response(200, content=stream()))
+
+        source = ChangelogSource(config)
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "2.0.69"
+        assert result["content"] == "- Minor bugfixes"
+        assert len(consumed) < len(chunks)
+
+    @respx.mock
+    def test_fetch_releases_walks_headers_to_known_version(self):
+        """Test that every section down to the known version is returned."""
+        config = {
+            "raw_url": "https://example.com/CHANGELOG.md",
+            "version_pattern": "keepachangelog",
+        }
+        changelog = CHANGELOG_KEEPACHANGELOG.replace(
+            "## [1.0.0]", "## [1.1.0] - 2024-02-01\n- Latest\n\n## [1.0.0]"
+        )
+        respx.get(config["raw_url"]).mock(return_value=httpx.Response(200, text=changelog))
+
+        releases = ChangelogSource(config).fetch_releases("0.9.0")
+
+        assert releases is not None
+        assert [r["version"] for r in releases] == ["1.1.0", "1.0.0", "0.9.0"]
+        assert releases[1]["content"] == "### Added\n- Initial release"
+        assert releases[1]["published"] == datetime(2024, 1, 15, tzinfo=UTC)
+        assert releases[2]["content"] == "### Changed\n- Beta improvements"
+
+    @respx.mock
+    def test_fetch_releases_unknown_version_is_bounded(self):
+        """Test that at most MAX_CATCH_UP sections are read for an unknown version."""
+        config = {
+            "raw_url": "https://example.com/CHANGELOG.md",
+            "version_pattern": "simple",
+        }
+        changelog = "".join(f"## 1.0.{i}\n- Change {i}\n\n" for i in range(50, 0, -1))
+        respx.get(config["raw_url"]).mock(return_value=httpx.Response(200, text=changelog))
+
+        releases = ChangelogSource(config).fetch_releases("0.1.0")
+
+        assert releases is not None
+        assert len(releases) == MAX_CATCH_UP
+        assert releases[0]["version"] == "1.0.50"
+
+    @respx.mock
+    def test_fetch_single_version_without_trailing_newline(self):
+        """Test that a final header line without newline is still found."""
+        config = {
+            "raw_url": "https://example.com/CHANGELOG.md",
+            "version_pattern": "simple",
+        }
+        respx.get(config["raw_url"]).mock(
+            return_value=httpx.Response(200, text="# Changelog\n\n## 1.0.0")
+        )
+
+        source = ChangelogSource(config)
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "1.0.0"
+        assert result["content"] == ""
+
     @respx.mock
     def test_fetch_no_version_found(self):
         """Test fetch when no version matches."""
@@ -450,3 +635,442 @@ def test_fetch_no_version_found(self):
         result = source.fetch_latest_version()
 
         assert result is None
+
+
+class TestSharedHttpClient:
+    """Tests for injecting a shared HTTP client into sources."""
+
+    def test_sources_use_injected_client(self):
+        """Test that every request goes through the injected client."""
+        requested_urls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            if request.url.host == "formulae.brew.sh":
+                return httpx.Response(200, json=HOMEBREW_CASK_JSON)
+            if request.url.path.endswith(".atom"):
+                return httpx.Response(200, text=ATOM_FEED_WITH_PUBLISHED)
+            return httpx.Response(200, text=CHANGELOG_SIMPLE)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        sources = [
+            HomebrewCaskSource({"api_url": "https://formulae.brew.sh/api/cask/zed.json"}, client),
+            GitHubReleaseSource({"atom_url": "https://github.com/test/repo/releases.atom"}, client),
+            GitHubCommitsSource(
+                {"atom_url": "https://github.com/test/repo/commits/main.atom"}, client
+            ),
+            ChangelogSource(
+                {"raw_url": "https://example.com/CHANGELOG.md", "version_pattern": "simple"},
+                client,
+            ),
+        ]
+
+        results = [source.fetch_latest_version() for source in sources]
+
+        assert all(result is not None for result in results)
+        assert len(requested_urls) == len(sources)
+        assert all(source.client is client for source in sources)
+
+
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified conditional requests."""
+
+    @respx.mock
+    def test_github_releases_not_modified_skips_parsing(self, tmp_path):
+        """Test that a 304 replays the cached result without parsing the feed."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        http_cache = HttpCache(tmp_path / "http_cache.json")
+        route = respx.get(config["atom_url"])
+        route.side_effect = [
+            httpx.Response(200, text=ATOM_FEED_WITH_PUBLISHED, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        first = GitHubReleaseSource(config, http_cache=http_cache).fetch_latest_version()
+
+        with patch("feedparser.parse") as parse:
+            second = GitHubReleaseSource(config, http_cache=http_cache).fetch_latest_version()
+            parse.assert_not_called()
+
+        assert first is not None
+        assert second == first
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @respx.mock
+    def test_changelog_not_modified(self, tmp_path):
+        """Test that a 304 for a changelog replays the cached result."""
+        config = {"raw_url": "https://example.com/CHANGELOG.md", "version_pattern": "simple"}
+        http_cache = HttpCache(tmp_path / "http_cache.json")
+        last_modified = "Wed, 15 Jan 2025 12:00:00 GMT"
+        route = respx.get(config["raw_url"])
+        route.side_effect = [
+            httpx.Response(200, text=CHANGELOG_SIMPLE, headers={"Last-Modified": last_modified}),
+            httpx.Response(304),
+        ]
+
+        ChangelogSource(config, http_cache=http_cache).fetch_latest_version()
+        result = ChangelogSource(config, http_cache=http_cache).fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "2.0.69"
+        assert route.calls[1].request.headers["If-Modified-Since"] == last_modified
+
+    @respx.mock
+    def test_not_modified_without_cached_result_fails(self, tmp_path):
+        """Test that an unexpected 304 is treated as a failure."""
+        config = {"api_url": "https://formulae.brew.sh/api/cask/zed.json"}
+        respx.get(config["api_url"]).mock(return_value=httpx.Response(304))
+
+        source = HomebrewCaskSource(config, http_cache=HttpCache(tmp_path / "http_cache.json"))
+
+        assert source.fetch_latest_version() is None
+
+
+# Sample bulk Homebrew Cask index
+HOMEBREW_CASK_INDEX = [
+    HOMEBREW_CASK_JSON,
+    {
+        "token": "raycast",
+        "version": "1.90.0",
+        "homepage": "https://www.raycast.com/",
+        "url": "https://releases.raycast.com/releases/1.90.0/download",
+        "desc": "Control your tools with a few keystrokes",
+    },
+]
+HOMEBREW_INDEX_URL = "https://formulae.brew.sh/api/cask.json"
+
+
+class TestCancellation:
+    """Tests for abandoning fetches that are no longer needed."""
+
+    @respx.mock
+    def test_stream_stops_at_next_chunk(self, tmp_path):
+        """Test that a cancelled fetch stops reading and caches nothing."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        http_cache = HttpCache(tmp_path / "http_cache.json")
+        cancel = threading.Event()
+        chunks_sent = []
+
+        def stream():
+            for chunk in ATOM_FEED_WITH_PUBLISHED.encode().splitlines(keepends=True):
+                chunks_sent.append(chunk)
+                if len(chunks_sent) == 2:
+                    cancel.set()
+                yield chunk
+
+        respx.get(config["atom_url"]).mock(
+            return_value=httpx.Response(200, content=stream(), headers={"ETag": '"v1"'})
+        )
+        source = GitHubReleaseSource(config, http_cache=http_cache, cancel=cancel)
+
+        with pytest.raises(FetchCancelled):
+            source.fetch_releases()
+
+        assert len(chunks_sent) == 2
+        assert http_cache.request_headers(config["atom_url"]) == {}
+
+    @respx.mock
+    def test_cancelled_source_sends_no_request(self):
+        """Test that a source cancelled before fetching sends nothing."""
+        route = respx.get("https://formulae.brew.sh/api/cask/test.json")
+        cancel = threading.Event()
+        cancel.set()
+        source = HomebrewCaskSource(
+            {"api_url": "https://formulae.brew.sh/api/cask/test.json"}, cancel=cancel
+        )
+
+        with pytest.raises(FetchCancelled):
+            source.fetch_latest_version()
+
+        assert route.call_count == 0
+
+    @respx.mock
+    def test_response_after_cancel_is_discarded(self):
+        """Test that a response arriving after cancellation returns no result."""
+        cancel = threading.Event()
+
+        def respond(request):
+            cancel.set()
+            return httpx.Response(200, json={"token": "test", "version": "1.0.0"})
+
+        respx.get("https://formulae.brew.sh/api/cask/test.json").mock(side_effect=respond)
+        source = HomebrewCaskSource(
+            {"api_url": "https://formulae.brew.sh/api/cask/test.json"}, cancel=cancel
+        )
+
+        with pytest.raises(FetchCancelled):
+            source.fetch_latest_version()
+
+    @respx.mock
+    def test_not_modified_after_cancel_is_not_replayed(self, tmp_path):
+        """Test that a 304 arriving after cancellation replays nothing."""
+        config = {"atom_url": "https://github.com/test/repo/releases.atom"}
+        http_cache = HttpCache(tmp_path / "http_cache.json")
+        cancel = threading.Event()
+
+        def not_modified(request):
+            cancel.set()
+            return httpx.Response(304)
+
+        respx.get(config["atom_url"]).mock(
+            side_effect=[
+                httpx.Response(200, text=ATOM_FEED_WITH_PUBLISHED, headers={"ETag": '"v1"'}),
+                not_modified,
+            ]
+        )
+        GitHubReleaseSource(config, http_cache=http_cache).fetch_latest_version()
+        source = GitHubReleaseSource(config, http_cache=http_cache, cancel=cancel)
+
+        with pytest.raises(FetchCancelled):
+            source.fetch_releases()
+
+
+class TestHomebrewCaskIndex:
+    """Tests for the bulk Homebrew Cask index."""
+
+    @respx.mock
+    def test_index_file_answers_without_requests(self, tmp_path):
+        """Test that a local index file answers lookups offline."""
+        index_file = tmp_path / "cask.json"
+        index_file.write_text(json.dumps(HOMEBREW_CASK_INDEX))
+        index = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL, index_file=index_file)
+
+        source = HomebrewCaskSource(
+            {"api_url": "https://formulae.brew.sh/api/cask/zed.json"}, cask_index=index
+        )
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "0.100.0"
+        assert "Install: `brew install --cask zed`" in result["content"]
+        assert len(respx.calls) == 0
+
+    @respx.mock
+    def test_index_downloaded_once(self, tmp_path):
+        """Test that several sources share a single index download."""
+        route = respx.get(HOMEBREW_INDEX_URL).mock(
+            return_value=httpx.Response(200, json=HOMEBREW_CASK_INDEX)
+        )
+        index = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL)
+
+        results = [
+            HomebrewCaskSource(
+                {"api_url": f"https://formulae.brew.sh/api/cask/{token}.json"}, cask_index=index
+            ).fetch_latest_version()
+            for token in ("zed", "raycast")
+        ]
+
+        assert [r["version"] for r in results if r] == ["0.100.0", "1.90.0"]
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_local_copy_revalidated_with_etag(self, tmp_path):
+        """Test that the local index copy is reused after a 304."""
+        local_path = tmp_path / "homebrew_cask_index.json.gz"
+        route = respx.get(HOMEBREW_INDEX_URL)
+        route.side_effect = [
+            httpx.Response(200, json=HOMEBREW_CASK_INDEX, headers={"ETag": '"index-v1"'}),
+            httpx.Response(304),
+        ]
+
+        first = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL, local_path=local_path)
+        assert first.get("zed") is not None
+        assert list(tmp_path.iterdir()) == [local_path]
+
+        second = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL, local_path=local_path)
+        entry = second.get("raycast")
+
+        assert entry is not None
+        assert entry["version"] == "1.90.0"
+        assert "desc" not in entry
+        assert route.calls[1].request.headers["If-None-Match"] == '"index-v1"'
+
+    @respx.mock
+    def test_failed_write_keeps_local_copy(self, tmp_path, monkeypatch):
+        """Test that an interrupted write leaves the previous local copy intact."""
+        local_path = tmp_path / "homebrew_cask_index.json.gz"
+        respx.get(HOMEBREW_INDEX_URL).mock(
+            return_value=httpx.Response(200, json=HOMEBREW_CASK_INDEX, headers={"ETag": '"v1"'})
+        )
+        HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL, local_path=local_path).get("zed")
+        previous = local_path.read_bytes()
+
+        def fail_fsync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("os.fsync", fail_fsync)
+        respx.get(HOMEBREW_INDEX_URL).mock(
+            return_value=httpx.Response(200, json=[], headers={"ETag": '"v2"'})
+        )
+        HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL, local_path=local_path).get("zed")
+
+        assert local_path.read_bytes() == previous
+
+    @respx.mock
+    def test_missing_cask_falls_back_to_api(self):
+        """Test that casks missing from the index are fetched individually."""
+        respx.get(HOMEBREW_INDEX_URL).mock(return_value=httpx.Response(200, json=[]))
+        api_route = respx.get("https://formulae.brew.sh/api/cask/zed.json").mock(
+            return_value=httpx.Response(200, json=HOMEBREW_CASK_JSON)
+        )
+        index = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL)
+
+        source = HomebrewCaskSource(
+            {"api_url": "https://formulae.brew.sh/api/cask/zed.json"}, cask_index=index
+        )
+        result = source.fetch_latest_version()
+
+        assert result is not None
+        assert result["version"] == "0.100.0"
+        assert api_route.call_count == 1
+
+    @respx.mock
+    def test_index_fetch_failure_is_empty(self):
+        """Test that a failed index download yields no entries."""
+        respx.get(HOMEBREW_INDEX_URL).mock(return_value=httpx.Response(500))
+        index = HomebrewCaskIndex(httpx.Client(), HOMEBREW_INDEX_URL)
+
+        assert index.get("zed") is None
+
+
+# Sample RSS feed
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Releases</title>
+    <link>https://example.com/</link>
+    <item>
+      <title>1.2.0</title>
+      <link>https://example.com/releases/1.2.0</link>
+      <description>Faster startup</description>
+      <pubDate>Wed, 15 Jan 2025 12:00:00 +0900</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+# GitHub-style release notes with markup feedparser's sanitizer removes
+ATOM_FEED_HTML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>v2.0.0</title>
+    <link rel="alternate" href="https://github.com/test/repo/releases/tag/v2.0.0"/>
+    <updated>2025-01-16T00:30:00Z</updated>
+    <content type="html">&lt;h2&gt;What&amp;#39;s new&lt;/h2&gt;
+&lt;p class="note" onclick="track()"&gt;Fix &amp;amp; \
+&lt;a href="https://example.com/?a=1&amp;amp;b=2" data-hovercard="1"&gt;docs&lt;/a&gt;\
+&lt;a href="javascript:alert(1)"&gt;bad&lt;/a&gt;&lt;br&gt;\
+&lt;img src="/logo.png" alt="logo"&gt;&lt;/p&gt;\
+&lt;script&gt;alert(1)&lt;/script&gt;&lt;style&gt;p {}&lt;/style&gt;\
+&lt;custom-tag&gt;text&lt;/custom-tag&gt; &amp;copy; &amp;#169; &amp;lt;tag&amp;gt;</content>
+  </entry>
+</feed>
+"""
+
+
+class TestFeedParser:
+    """Tests for the streaming feed parser."""
+
+    def test_parse_rss_item(self):
+        """Test parsing an RSS item."""
+        entry = next(iter_feed_entries([RSS_FEED.encode()]))
+
+        assert entry.title == "1.2.0"
+        assert entry.link == "https://example.com/releases/1.2.0"
+        assert entry.summary == "Faster startup"
+        assert entry.published == datetime(2025, 1, 15, 3, 0, 0, tzinfo=UTC)
+
+    def test_entries_in_document_order(self):
+        """Test that all entries are yielded newest first."""
+        entries = list(iter_feed_entries([ATOM_FEED_GITHUB_STYLE.encode()]))
+
+        assert [e.title for e in entries] == ["v0.101.0", "v0.100.0"]
+        assert entries[0].published == datetime(2025, 1, 16, 0, 30, 0, tzinfo=UTC)
+
+    def test_stops_reading_after_consumed_entries(self):
+        """Test that chunks after the requested entries are not read."""
+        data = ATOM_FEED_GITHUB_STYLE.encode()
+        split = data.index(b"</entry>") + len(b"</entry>")
+        chunks = [data[:split], data[split:]]
+        consumed = []
+
+        def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        entry = next(iter_feed_entries(stream()))
+
+        assert entry.title == "v0.101.0"
+        assert len(consumed) == 1
+
+    def test_malformed_feed_raises(self):
+        """Test that malformed XML raises ParseError."""
+        with pytest.raises(ET.ParseError):
+            list(iter_feed_entries([ATOM_FEED_MALFORMED.encode()]))
+
+    @pytest.mark.parametrize("feed", [ATOM_FEED_HTML_CONTENT, ATOM_FEED_GITHUB_STYLE, RSS_FEED])
+    def test_summary_matches_feedparser(self, feed):
+        """Test that summaries match the feedparser fallback path."""
+        data = feed.encode()
+        streamed = [entry.summary for entry in iter_feed_entries([data])]
+        parsed = [entry.summary for entry in _iter_feedparser_entries(data)]
+
+        assert streamed == parsed
+
+    def test_html_content_is_sanitized(self):
+        """Test that scripts, styles and unsafe attributes are removed."""
+        entry = next(iter_feed_entries([ATOM_FEED_HTML_CONTENT.encode()]))
+
+        assert "alert" not in entry.summary
+        assert "onclick" not in entry.summary
+        assert "p {}" not in entry.summary
+        assert '<a href="">bad</a>' in entry.summary
+        assert entry.summary.startswith("<h2>What's new</h2>")
+
+
+class TestSourceRegistry:
+    """Tests for lazy source class resolution."""
+
+    @pytest.mark.parametrize(
+        ("source_type", "source_class"),
+        [
+            ("github_releases", GitHubReleaseSource),
+            ("homebrew_cask", HomebrewCaskSource),
+            ("github_commits", GitHubCommitsSource),
+            ("changelog", ChangelogSource),
+        ],
+    )
+    def test_get_source_class(self, source_type, source_class):
+        """Test that every registered type resolves to its class."""
+        assert get_source_class(source_type) is source_class
+
+    def test_unknown_source_type(self):
+        """Test that an unknown type is rejected."""
+        with pytest.raises(ValueError, match="Unknown source type: rss"):
+            get_source_class("rss")
+
+    def test_notifier_imports_no_source_modules(self):
+        """Test that importing the notifier leaves source modules unimported."""
+        code = (
+            "import sys, devtools_release_notifier.notifier\n"
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "'devtools_release_notifier.sources.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "['devtools_release_notifier.sources.base']"
+
+    def test_homebrew_source_does_not_import_bulk_index(self):
+        """Test that the bulk index module is left unimported with the source."""
+        code = (
+            "import sys, devtools_release_notifier.sources.homebrew_cask\n"
+            "print('devtools_release_notifier.sources.homebrew_index' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
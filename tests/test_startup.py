@@ -0,0 +1,47 @@
+"""Tests for import-time profiling."""
+
+from devtools_release_notifier.startup import (
+    ImportTiming,
+    format_profile,
+    parse_importtime,
+    profile_imports,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:       700 |        820 | json.decoder
+import time:       330 |       1150 | json
+"""
+
+
+def test_parse_importtime():
+    """Test parsing -X importtime output into per-module timings."""
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert timings == [
+        ImportTiming(module="_json", self_us=120, cumulative_us=120, depth=1),
+        ImportTiming(module="json.decoder", self_us=700, cumulative_us=820, depth=0),
+        ImportTiming(module="json", self_us=330, cumulative_us=1150, depth=0),
+    ]
+
+
+def test_format_profile_lists_slowest_modules():
+    """Test that the report totals top-level imports and sorts by self time."""
+    report = format_profile("tool", parse_importtime(IMPORTTIME_OUTPUT), top=2)
+
+    lines = report.splitlines()
+    assert lines[0] == "tool: 2.0 ms in 3 modules"
+    assert lines[2].endswith("json.decoder")
+    assert lines[3].endswith("json")
+    assert len(lines) == 4
+
+
+def test_profile_imports_excludes_startup():
+    """Test that modules imported during interpreter startup are not reported."""
+    timings = profile_imports(["json"])
+
+    modules = [t.module for t in timings]
+    assert "json" in modules
+    assert "site" not in modules
+    assert "encodings" not in modules